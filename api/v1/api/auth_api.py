@@ -1,7 +1,6 @@
 from django.contrib.auth import authenticate
 from django.contrib.auth.models import User
 from django.contrib.auth.tokens import default_token_generator
-from django.core.mail import send_mail
 from django.template.loader import render_to_string
 from django.utils.encoding import force_bytes
 from django.utils.http import urlsafe_base64_decode, urlsafe_base64_encode
@@ -9,6 +8,7 @@ from drf_yasg.utils import swagger_auto_schema
 from rest_framework import status, viewsets
 from rest_framework.authtoken.models import Token
 from rest_framework.decorators import action
+from rest_framework.permissions import IsAdminUser
 from rest_framework.response import Response
 
 from api.v1.serializers.auth_serializer import LoginSerializer, RegisterSerializer
@@ -16,6 +16,8 @@ from api.v1.serializers.password_reset_serializer import (
     PasswordResetRequestSerializer,
     PasswordResetSerializer,
 )
+from apps.notifications.outbox import enqueue_email
+from apps.profiles.auth import token_cache
 from core.settings import BACKEND_URL, EMAIL_HOST_USER
 
 
@@ -77,12 +79,12 @@ class AuthAPI(viewsets.ViewSet):
             html_message = render_to_string(
                 "password_reset_email.html", {"reset_link": reset_link}
             )
-            send_mail(
+            # Sent by the send_outbox_email worker, not inside the request
+            enqueue_email(
                 "Permintaan Reset Kata Sandi",
                 f"Klik tautan untuk mereset kata sandi Anda: {reset_link}",
-                EMAIL_HOST_USER,
                 [email],
-                fail_silently=False,
+                from_email=EMAIL_HOST_USER,
                 html_message=html_message,
             )
         return Response({"message": "Tautan reset kata sandi terkirim"})
@@ -114,3 +116,16 @@ class AuthAPI(viewsets.ViewSet):
             return Response(
                 {"error": "Token tidak valid"}, status=status.HTTP_400_BAD_REQUEST
             )
+
+    @swagger_auto_schema(
+        method="get", responses={200: "Token cache hits and misses of this worker"}
+    )
+    @action(
+        detail=False,
+        methods=["get"],
+        url_path="cache-stats",
+        permission_classes=[IsAdminUser],
+    )
+    def cache_stats(self, request):
+        """Hit/miss counters of the authentication token cache, per process"""
+        return Response(token_cache.stats())
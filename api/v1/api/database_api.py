@@ -0,0 +1,24 @@
+from drf_yasg.utils import swagger_auto_schema
+from rest_framework import viewsets
+from rest_framework.decorators import action
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+
+from core.db import pool_stats
+
+
+class DatabaseAPI(viewsets.ViewSet):
+    """Visibility into the database connection pool"""
+
+    permission_classes = [IsAdminUser]
+
+    @swagger_auto_schema(
+        method="get",
+        responses={
+            200: "Pool size, saturation, checkout wait (ms) and connection churn"
+        },
+    )
+    @action(detail=False, methods=["get"], url_path="pool-stats")
+    def pool_stats(self, request):
+        """Connection pool metrics of the worker process answering the request"""
+        return Response(pool_stats())
@@ -0,0 +1,106 @@
+from drf_yasg.utils import swagger_auto_schema
+from rest_framework import status, viewsets
+from rest_framework.decorators import action
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+
+from api.v1.serializers.extraction_serializer import (
+    ExtractionLookupSerializer,
+    ExtractionRequestSerializer,
+    ExtractionStoreSerializer,
+)
+from apps.jobs.extraction import (
+    extract_job_fields,
+    extraction_stats,
+    lookup_extractions,
+    store_extraction,
+)
+from apps.jobs.models import JobExtraction
+
+
+class ExtractionCacheAPI(viewsets.ViewSet):
+    """
+    Cache of LLM job-field extraction results, keyed by normalized description.
+    The ingestion pipeline looks descriptions up here before invoking the model.
+    """
+
+    permission_classes = [IsAdminUser]
+
+    @swagger_auto_schema(
+        request_body=ExtractionStoreSerializer,
+        responses={201: "Extraction cached", 400: "Validation errors"},
+    )
+    def create(self, request):
+        """Store the extraction result for a description"""
+        serializer = ExtractionStoreSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        entry = store_extraction(
+            serializer.validated_data["description"],
+            serializer.validated_data["fields"],
+        )
+        return Response(
+            {"description_hash": entry.description_hash, "fields": entry.fields},
+            status=status.HTTP_201_CREATED,
+        )
+
+    @swagger_auto_schema(
+        method="post",
+        request_body=ExtractionLookupSerializer,
+        responses={200: "Cached fields per description (null on miss)"},
+    )
+    @action(detail=False, methods=["post"], url_path="lookup")
+    def lookup(self, request):
+        """Look up cached extraction results for a batch of descriptions"""
+        serializer = ExtractionLookupSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        results = [
+            {
+                "description_hash": description_hash,
+                "hit": fields is not None,
+                "fields": fields,
+            }
+            for description_hash, fields in lookup_extractions(
+                serializer.validated_data["descriptions"]
+            )
+        ]
+        return Response({"results": results})
+
+    @swagger_auto_schema(
+        method="post",
+        request_body=ExtractionRequestSerializer,
+        responses={
+            200: "Extracted fields and whether they came from the cache",
+            404: "Cache miss and no extractor configured",
+        },
+    )
+    @action(detail=False, methods=["post"], url_path="extract")
+    def extract(self, request):
+        """Return cached fields, running the configured extractor on a miss"""
+        serializer = ExtractionRequestSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        fields, cached = extract_job_fields(
+            serializer.validated_data["title"],
+            serializer.validated_data["description"],
+        )
+        if fields is None:
+            return Response(
+                {"error": "Cache miss and no extractor configured"},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+        return Response({"cached": cached, "fields": fields})
+
+    @swagger_auto_schema(method="get", responses={200: "Cache hit/miss statistics"})
+    @action(detail=False, methods=["get"], url_path="stats")
+    def stats(self, request):
+        """Cache size and hit/miss/eviction counters"""
+        counters = extraction_stats()
+        hits, misses = counters["hits"], counters["misses"]
+        return Response(
+            {
+                "entries": JobExtraction.objects.count(),
+                "hits": hits,
+                "misses": misses,
+                "evictions": counters["evictions"],
+                "hit_rate": round(hits / (hits + misses), 4) if hits + misses else 0,
+            }
+        )
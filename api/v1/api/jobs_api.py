@@ -1,17 +1,65 @@
+from collections import defaultdict
+
+from django.conf import settings
+from django.db.models import Q
+from django.http import StreamingHttpResponse
+from django.utils.cache import patch_vary_headers
+from django.utils.dateparse import parse_datetime
 from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
 from rest_framework import status, viewsets
 from rest_framework.decorators import action
-from rest_framework.pagination import PageNumberPagination
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.pagination import Cursor, CursorPagination, PageNumberPagination
+from rest_framework.permissions import IsAdminUser, IsAuthenticated
 from rest_framework.response import Response
 
 from api.v1.filters.jobs_filter import JobsFilter
+from api.v1.renderers import CSVRenderer, NDJSONRenderer
+from api.v1.serializers.fieldsets import sparse_queryset
 from api.v1.serializers.jobs_serializer import (
     JobAssessmentSerializer,
+    JobsBulkIngestSerializer,
     JobsDetailSerializer,
+    JobsIngestSerializer,
     JobsListSerializer,
+    JobsNewLinksSerializer,
+    JobsRecommendedSerializer,
+    JobsSimilarSerializer,
+    serialize_job_list_rows,
+)
+from apps.jobs.cache import cache_stats, get_cached_response, set_cached_response
+from apps.jobs.conditional import (
+    job_key,
+    job_validators,
+    list_validators,
+    not_modified,
+    set_validators,
+)
+from apps.jobs.consts import (
+    EMPLOYMENT_TYPE_CHOICES,
+    EXPORT_FIELDS,
+    FACET_FIELDS,
+    RECOMMENDED_JOBS_DEFAULT,
+    RECOMMENDED_JOBS_MAX,
+    SIMILAR_JOBS_DEFAULT,
+    SIMILAR_JOBS_MAX,
+    SUGGEST_DEFAULT,
+    SUGGEST_FIELDS,
+    SUGGEST_MAX,
+    WORK_LOCATION_CHOICES,
 )
+from apps.jobs.dedupe import index_jobs
+from apps.jobs.export import EXPORT_FORMATS, accepts_gzip, export_stream
+from apps.jobs.facets import facet_counts
+from apps.jobs.ingest import find_new_links, upsert_jobs
 from apps.jobs.models import JobAssessment, Jobs
+from apps.jobs.recommender import get_recommender
+from apps.jobs.similar import similar_jobs
+from apps.jobs.snapshot import export_snapshot, read_manifest
+from apps.jobs.suggest import get_suggest_index
+from apps.profiles.models import Profile
+from apps.rollups.queries import job_buckets, job_facets
 
 
 class JobsPagination(PageNumberPagination):
@@ -20,8 +68,115 @@ class JobsPagination(PageNumberPagination):
     max_page_size = 100
 
 
-class JobsAPI(viewsets.ModelViewSet):
-    queryset = Jobs.objects.all().order_by("-created_on")
+class JobsCursorPagination(CursorPagination):
+    """
+    Keyset pagination over (created_on, id), newest first.
+
+    Opt in with ?pagination=cursor. Each page is a bounded index range scan on
+    the composite key and no total count is computed, so deep pages cost the
+    same as the first one. Results are always ordered by recency.
+    """
+
+    page_size = 20
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    ordering = ("-created_on", "-id")
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.page_size = self.get_page_size(request)
+        self.base_url = request.build_absolute_uri()
+        cursor = self.decode_cursor(request)
+        self.reverse = bool(cursor and cursor.reverse)
+
+        if cursor is not None:
+            created_on, pk = self.decode_position(cursor.position)
+            # (created_on, id) < (c, i), written so the created_on bound stays
+            # an index range condition
+            if self.reverse:
+                queryset = queryset.filter(
+                    Q(created_on__gte=created_on)
+                    & (Q(created_on__gt=created_on) | Q(id__gt=pk))
+                )
+            else:
+                queryset = queryset.filter(
+                    Q(created_on__lte=created_on)
+                    & (Q(created_on__lt=created_on) | Q(id__lt=pk))
+                )
+
+        ordering = ("created_on", "id") if self.reverse else self.ordering
+        results = list(queryset.order_by(*ordering)[: self.page_size + 1])
+        has_more = len(results) > self.page_size
+        self.page = results[: self.page_size]
+        if self.reverse:
+            self.page.reverse()
+            self.has_next, self.has_previous = True, has_more
+        else:
+            self.has_next, self.has_previous = has_more, cursor is not None
+        return self.page
+
+    def decode_position(self, position):
+        try:
+            created_on, pk = position.rsplit("|", 1)
+            created_on = parse_datetime(created_on)
+            pk = int(pk)
+        except (AttributeError, TypeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+        if created_on is None:
+            raise NotFound(self.invalid_cursor_message)
+        return created_on, pk
+
+    def encode_position(self, instance):
+        # Rows of a .values() queryset (see JobsAPI.list) are dicts
+        if isinstance(instance, dict):
+            return f"{instance['created_on'].isoformat()}|{instance['id']}"
+        return f"{instance.created_on.isoformat()}|{instance.pk}"
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        position = self.encode_position(self.page[-1])
+        return self.encode_cursor(Cursor(offset=0, reverse=False, position=position))
+
+    def get_previous_link(self):
+        if not self.has_previous or not self.page:
+            return None
+        position = self.encode_position(self.page[0])
+        return self.encode_cursor(Cursor(offset=0, reverse=True, position=position))
+
+
+class CursorPaginationMixin:
+    """Switch to JobsCursorPagination when the client asks for ?pagination=cursor"""
+
+    cursor_pagination_class = JobsCursorPagination
+
+    @property
+    def paginator(self):
+        if not hasattr(self, "_paginator"):
+            if self.request.query_params.get("pagination") == "cursor":
+                self._paginator = self.cursor_pagination_class()
+            else:
+                self._paginator = self.pagination_class()
+        return self._paginator
+
+
+PAGINATION_PARAMETERS = [
+    openapi.Parameter(
+        "pagination",
+        openapi.IN_QUERY,
+        description="Set to 'cursor' for keyset pagination (no total count)",
+        type=openapi.TYPE_STRING,
+    ),
+    openapi.Parameter(
+        "cursor",
+        openapi.IN_QUERY,
+        description="Opaque cursor from a previous next/previous link",
+        type=openapi.TYPE_STRING,
+    ),
+]
+
+
+class JobsAPI(CursorPaginationMixin, viewsets.ModelViewSet):
+    queryset = Jobs.objects.defer("search_vector").order_by("-created_on")
     pagination_class = JobsPagination
     filterset_class = JobsFilter
     permission_classes = []
@@ -36,14 +191,28 @@ class JobsAPI(viewsets.ModelViewSet):
 
     def get_queryset(self):
         """Return jobs ordered by creation date (newest first)"""
-        return Jobs.objects.all().order_by("-created_on")
+        queryset = Jobs.objects.defer("search_vector").order_by("-created_on")
+        # Lists show one posting per near-duplicate cluster unless asked otherwise
+        if self.action in ("list", "export") and (
+            self.request.query_params.get("include_duplicates") != "true"
+        ):
+            queryset = queryset.filter(canonical__isnull=True)
+        if self.action == "retrieve":
+            queryset = sparse_queryset(queryset, JobsDetailSerializer, self.request)
+        return queryset
+
+    def perform_create(self, serializer):
+        index_jobs([serializer.save()])
+
+    def perform_update(self, serializer):
+        index_jobs([serializer.save()])
 
     @swagger_auto_schema(
         manual_parameters=[
             openapi.Parameter(
                 "search",
                 openapi.IN_QUERY,
-                description="Search in title, description, location, category, company, skills",
+                description="Full-text search in title, company, category, location, skills and description, ranked by relevance",
                 type=openapi.TYPE_STRING,
             ),
             openapi.Parameter(
@@ -112,6 +281,12 @@ class JobsAPI(viewsets.ModelViewSet):
                 description="Filter jobs posted before this date (YYYY-MM-DD)",
                 type=openapi.TYPE_STRING,
             ),
+            openapi.Parameter(
+                "include_duplicates",
+                openapi.IN_QUERY,
+                description="Set to 'true' to also list near-duplicate postings",
+                type=openapi.TYPE_STRING,
+            ),
             openapi.Parameter(
                 "page",
                 openapi.IN_QUERY,
@@ -124,17 +299,103 @@ class JobsAPI(viewsets.ModelViewSet):
                 description="Number of results per page (max 100)",
                 type=openapi.TYPE_INTEGER,
             ),
+            openapi.Parameter(
+                "facets",
+                openapi.IN_QUERY,
+                description=(
+                    "Comma-separated fields to return filter counts for, computed "
+                    f"over the filtered jobs ({', '.join(FACET_FIELDS)})"
+                ),
+                type=openapi.TYPE_STRING,
+            ),
+            *PAGINATION_PARAMETERS,
         ],
         responses={200: JobsListSerializer(many=True)},
     )
     def list(self, request, *args, **kwargs):
         """List jobs with filtering and search capabilities"""
-        return super().list(request, *args, **kwargs)
+        cached = get_cached_response(request, "api-list")
+        if cached is None:
+            facets = self.get_facet_fields()
+            queryset = self.filter_queryset(self.get_queryset())
+            # Fast path: only the listed columns, formatted without model instances
+            # A sparse fieldset may leave out uid and updated_on; the surrogate
+            # keys and validators need them
+            fields = list(self.get_serializer().fields)
+            rows = queryset.values(
+                *dict.fromkeys(["id", "created_on", "uid", "updated_on", *fields])
+            )
+            page = self.paginate_queryset(rows)
+            keys = [job_key(row["uid"]) for row in page]
+            validators = list_validators(request, page)
+            response = not_modified(request, *validators)
+            if response is not None:
+                return set_validators(response, *validators, keys=keys)
+            results = serialize_job_list_rows(page, fields)
+            data = self.get_paginated_response(results).data
+            if facets:
+                data["facets"] = self.get_facets(queryset, facets)
+            cached = (data, validators, keys)
+            set_cached_response(request, "api-list", cached)
+
+        data, validators, keys = cached
+        response = not_modified(request, *validators) or Response(data)
+        return set_validators(response, *validators, keys=keys)
+
+    def get_facet_fields(self):
+        value = self.request.query_params.get("facets", "")
+        fields = list(dict.fromkeys(f.strip() for f in value.split(",") if f.strip()))
+        unknown = [field for field in fields if field not in FACET_FIELDS]
+        if unknown:
+            raise ValidationError(
+                {"facets": f"Unsupported facets: {', '.join(unknown)}"}
+            )
+        return fields
+
+    def get_facets(self, queryset, fields):
+        """
+        Facet counts over the same filtered queryset as the results. Without any
+        filter they are read from the daily rollup instead of scanning jobs.
+        """
+        params = self.request.query_params
+        if not any(params.get(name) for name in self.filterset_class.base_filters):
+            return job_facets(
+                fields, include_duplicates=params.get("include_duplicates") == "true"
+            )
+        return facet_counts(queryset, fields)
 
     @swagger_auto_schema(responses={200: JobsDetailSerializer, 404: "Job not found"})
     def retrieve(self, request, *args, **kwargs):
         """Retrieve a specific job by UID"""
-        return super().retrieve(request, *args, **kwargs)
+        namespace = f"api-detail:{kwargs['pk']}"
+        cached = get_cached_response(request, namespace)
+        if cached is None:
+            try:
+                meta = (
+                    self.get_queryset()
+                    .filter(pk=kwargs["pk"])
+                    .values_list("uid", "updated_on")
+                    .first()
+                )
+            except (TypeError, ValueError):
+                meta = None
+            if meta is not None:
+                validators = job_validators(*meta)
+                response = not_modified(request, *validators)
+                if response is not None:
+                    return set_validators(
+                        response, *validators, keys=[job_key(meta[0])]
+                    )
+            job = self.get_object()
+            data = self.get_serializer(job).data
+            # A sparse fieldset may have deferred uid and updated_on
+            uid, updated_on = meta or (job.uid, job.updated_on)
+            cached = (data, job_validators(uid, updated_on), uid)
+            set_cached_response(request, namespace, cached)
+
+        data, validators, uid = cached
+        response = not_modified(request, *validators) or Response(data)
+        return set_validators(response, *validators, keys=[job_key(uid)])
 
     @swagger_auto_schema(
         request_body=JobsDetailSerializer,
@@ -182,57 +443,52 @@ class JobsAPI(viewsets.ModelViewSet):
     @action(detail=False, methods=["get"], url_path="statistics")
     def statistics(self, request):
         """Get job statistics similar to dashboard"""
-        queryset = self.get_queryset()
+        # Buckets come from the incrementally maintained rollups, so the cost
+        # depends on the number of buckets rather than the number of jobs
+        buckets = job_buckets(category=request.query_params.get("category"))
+        employment_counts = defaultdict(int)
+        location_counts = defaultdict(int)
+        category_counts = defaultdict(int)
+        for bucket in buckets:
+            employment_counts[bucket["employment_type"]] += bucket["count"]
+            location_counts[bucket["work_location"]] += bucket["count"]
+            category_counts[bucket["job_title_category"]] += bucket["count"]
 
-        # Apply category filter if provided
-        category = request.query_params.get("category")
-        if category:
-            queryset = queryset.filter(job_title_category__iexact=category)
+        total_jobs = sum(employment_counts.values())
 
-        # Calculate statistics
-        total_jobs = queryset.count()
+        def percentage(count):
+            return round((count / total_jobs * 100) if total_jobs > 0 else 0, 2)
 
         # Employment type distribution
         employment_stats = {}
         for choice_value, choice_label in EMPLOYMENT_TYPE_CHOICES:
-            count = queryset.filter(employment_type=choice_value).count()
+            count = employment_counts[choice_value]
             employment_stats[choice_value] = {
                 "label": choice_label,
                 "count": count,
-                "percentage": round(
-                    (count / total_jobs * 100) if total_jobs > 0 else 0, 2
-                ),
+                "percentage": percentage(count),
             }
 
         # Work location distribution
         location_stats = {}
         for choice_value, choice_label in WORK_LOCATION_CHOICES:
-            count = queryset.filter(work_location=choice_value).count()
+            count = location_counts[choice_value]
             location_stats[choice_value] = {
                 "label": choice_label,
                 "count": count,
-                "percentage": round(
-                    (count / total_jobs * 100) if total_jobs > 0 else 0, 2
-                ),
+                "percentage": percentage(count),
             }
 
         # Top categories
-        categories = queryset.values("job_title_category").distinct()
-        category_stats = []
-        for cat in categories:
-            if cat["job_title_category"]:
-                count = queryset.filter(
-                    job_title_category=cat["job_title_category"]
-                ).count()
-                category_stats.append(
-                    {
-                        "category": cat["job_title_category"],
-                        "count": count,
-                        "percentage": round(
-                            (count / total_jobs * 100) if total_jobs > 0 else 0, 2
-                        ),
-                    }
-                )
+        category_stats = [
+            {
+                "category": category_name,
+                "count": count,
+                "percentage": percentage(count),
+            }
+            for category_name, count in category_counts.items()
+            if category_name
+        ]
 
         # Sort by count and take top 10
         category_stats = sorted(category_stats, key=lambda x: x["count"], reverse=True)[
@@ -248,20 +504,327 @@ class JobsAPI(viewsets.ModelViewSet):
             }
         )
 
+    @swagger_auto_schema(
+        method="get",
+        manual_parameters=[
+            openapi.Parameter(
+                "limit",
+                openapi.IN_QUERY,
+                description=f"Number of jobs to return (max {RECOMMENDED_JOBS_MAX})",
+                type=openapi.TYPE_INTEGER,
+            ),
+        ],
+        responses={
+            200: JobsRecommendedSerializer(many=True),
+            404: "Profile not found",
+        },
+    )
+    @action(
+        detail=False,
+        methods=["get"],
+        url_path="recommended",
+        permission_classes=[IsAuthenticated],
+    )
+    def recommended(self, request):
+        """Jobs that best fit the current user's profile, best match first"""
+        profile = Profile.objects.filter(actor=request.user).first()
+        if profile is None:
+            return Response(
+                {"error": "Profile not found. Please create a profile first."},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+        try:
+            limit = int(request.query_params.get("limit", RECOMMENDED_JOBS_DEFAULT))
+        except ValueError:
+            limit = RECOMMENDED_JOBS_DEFAULT
+        limit = max(1, min(limit, RECOMMENDED_JOBS_MAX))
+
+        assessed = JobAssessment.objects.filter(profile=profile).values_list(
+            "job_id", flat=True
+        )
+        # Over-fetch: jobs deleted since the last rebuild are dropped below
+        ranked = get_recommender().recommend(
+            profile, limit * 2, exclude_ids=set(assessed)
+        )
+        scores = dict(ranked)
+        jobs = Jobs.objects.defer("search_vector").in_bulk(scores.keys())
+        results = [jobs[job_id] for job_id, _ in ranked if job_id in jobs][:limit]
+        for job in results:
+            job.score = round(scores[job.id], 4)
+        return Response({"results": JobsRecommendedSerializer(results, many=True).data})
 
-class JobAssessmentAPI(viewsets.ModelViewSet):
+    @swagger_auto_schema(
+        method="get",
+        manual_parameters=[
+            openapi.Parameter(
+                "limit",
+                openapi.IN_QUERY,
+                description=f"Number of jobs to return (max {SIMILAR_JOBS_MAX})",
+                type=openapi.TYPE_INTEGER,
+            ),
+        ],
+        responses={200: JobsSimilarSerializer(many=True), 404: "Job not found"},
+    )
+    @action(detail=True, methods=["get"], url_path="similar")
+    def similar(self, request, pk=None):
+        """Jobs with the most similar title, description and requirements"""
+        job = self.get_object()
+        try:
+            limit = int(request.query_params.get("limit", SIMILAR_JOBS_DEFAULT))
+        except ValueError:
+            limit = SIMILAR_JOBS_DEFAULT
+        limit = max(1, min(limit, SIMILAR_JOBS_MAX))
+        results = similar_jobs(job, limit)
+        return Response({"results": JobsSimilarSerializer(results, many=True).data})
+
+    @swagger_auto_schema(
+        method="get", responses={200: "Jobs response cache hits and misses"}
+    )
+    @action(
+        detail=False,
+        methods=["get"],
+        url_path="cache-stats",
+        permission_classes=[IsAdminUser],
+    )
+    def cache_stats(self, request):
+        """Hit/miss counters of the anonymous jobs response cache"""
+        return Response(cache_stats())
+
+    @swagger_auto_schema(
+        method="get",
+        manual_parameters=[
+            openapi.Parameter(
+                "field",
+                openapi.IN_QUERY,
+                description=f"Field to complete ({', '.join(SUGGEST_FIELDS)})",
+                type=openapi.TYPE_STRING,
+                required=True,
+            ),
+            openapi.Parameter(
+                "prefix",
+                openapi.IN_QUERY,
+                description="Typed text; matches the start of any word of a value",
+                type=openapi.TYPE_STRING,
+            ),
+            openapi.Parameter(
+                "limit",
+                openapi.IN_QUERY,
+                description=f"Number of completions to return (max {SUGGEST_MAX})",
+                type=openapi.TYPE_INTEGER,
+            ),
+        ],
+        responses={200: "Completions with job counts, most frequent first"},
+    )
+    @action(detail=False, methods=["get"], url_path="suggest")
+    def suggest(self, request):
+        """Typeahead completions served from an in-memory prefix index"""
+        field = request.query_params.get("field")
+        if field not in SUGGEST_FIELDS:
+            raise ValidationError(
+                {"field": f"Must be one of: {', '.join(SUGGEST_FIELDS)}"}
+            )
+        prefix = request.query_params.get("prefix", "")
+        try:
+            limit = int(request.query_params.get("limit", SUGGEST_DEFAULT))
+        except ValueError:
+            limit = SUGGEST_DEFAULT
+        limit = max(1, min(limit, SUGGEST_MAX))
+        completions = get_suggest_index().complete(field, prefix, limit)
+        return Response(
+            {
+                "field": field,
+                "prefix": prefix,
+                "results": [
+                    {"value": value, "count": count} for value, count in completions
+                ],
+            }
+        )
+
+    @swagger_auto_schema(
+        method="get",
+        manual_parameters=[
+            openapi.Parameter(
+                "format",
+                openapi.IN_QUERY,
+                description=f"Export format ({', '.join(EXPORT_FORMATS)})",
+                type=openapi.TYPE_STRING,
+            ),
+            openapi.Parameter(
+                "fields",
+                openapi.IN_QUERY,
+                description=f"Comma-separated columns ({', '.join(EXPORT_FIELDS)})",
+                type=openapi.TYPE_STRING,
+            ),
+        ],
+        responses={200: "Every matching job, one NDJSON line or CSV row each"},
+    )
+    @action(
+        detail=False,
+        methods=["get"],
+        url_path="export",
+        renderer_classes=[NDJSONRenderer, CSVRenderer],
+        permission_classes=[IsAuthenticated],
+    )
+    def export(self, request):
+        """
+        Stream all jobs matching the list filters in one response, read from a
+        server-side cursor. Gzipped when the client accepts it. Signed-in
+        users only, as it returns the whole catalogue in one request.
+        """
+        fields = self.get_export_fields()
+        queryset = self.filter_queryset(self.get_queryset())
+        export_format = request.accepted_renderer.format
+        gzip = accepts_gzip(request.headers.get("Accept-Encoding", ""))
+        response = StreamingHttpResponse(
+            export_stream(queryset, fields, export_format, gzip=gzip),
+            content_type=request.accepted_renderer.media_type,
+        )
+        response.headers["Content-Disposition"] = (
+            f'attachment; filename="jobs.{export_format}"'
+        )
+        if gzip:
+            response.headers["Content-Encoding"] = "gzip"
+        patch_vary_headers(response, ["Accept-Encoding"])
+        return response
+
+    def get_export_fields(self):
+        value = self.request.query_params.get("fields")
+        if not value:
+            return EXPORT_FIELDS
+        fields = [field.strip() for field in value.split(",") if field.strip()]
+        unknown = [field for field in fields if field not in EXPORT_FIELDS]
+        if unknown or not fields:
+            raise ValidationError(
+                {"fields": f"Must be among: {', '.join(EXPORT_FIELDS)}"}
+            )
+        return list(dict.fromkeys(fields))
+
+    @swagger_auto_schema(
+        method="get", responses={200: "Manifest of the Parquet snapshots"}
+    )
+    @swagger_auto_schema(
+        method="post",
+        request_body=openapi.Schema(
+            type=openapi.TYPE_OBJECT,
+            properties={
+                "incremental": openapi.Schema(
+                    type=openapi.TYPE_BOOLEAN,
+                    description="Only export jobs changed since the last snapshot",
+                )
+            },
+        ),
+        responses={201: "Manifest entry of the new snapshot"},
+    )
+    @action(
+        detail=False,
+        methods=["get", "post"],
+        url_path="snapshot",
+        permission_classes=[IsAdminUser],
+    )
+    def snapshot(self, request):
+        """List the Parquet snapshots of the catalogue, or write a new one"""
+        directory = settings.JOBS_SNAPSHOT_DIR
+        if request.method == "GET":
+            return Response(read_manifest(directory))
+        incremental = request.data.get("incremental") in (True, "true", "1")
+        return Response(
+            export_snapshot(directory, incremental=incremental),
+            status=status.HTTP_201_CREATED,
+        )
+
+    @swagger_auto_schema(
+        method="post",
+        request_body=JobsBulkIngestSerializer,
+        responses={
+            200: "Per-item inserted/updated/skipped status",
+            400: "Validation errors",
+        },
+    )
+    @action(
+        detail=False,
+        methods=["post"],
+        url_path="bulk-ingest",
+        permission_classes=[IsAdminUser],
+    )
+    def bulk_ingest(self, request):
+        """Upsert a batch of scraped jobs keyed on their link"""
+        serializer = JobsBulkIngestSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        # One serializer instance validates every record
+        item_serializer = JobsIngestSerializer()
+        results = []
+        records = []
+        seen_links = set()
+        for index, item in enumerate(serializer.validated_data["jobs"]):
+            result = {"index": index, "link": item.get("link")}
+            results.append(result)
+            try:
+                record = item_serializer.run_validation(item)
+            except ValidationError as exc:
+                result.update(status="skipped", errors=exc.detail)
+                continue
+            if record["link"] in seen_links:
+                result.update(status="skipped", errors="Duplicate link in batch")
+                continue
+            seen_links.add(record["link"])
+            result["link"] = record["link"]
+            records.append(record)
+
+        upserted = upsert_jobs(records, actor=request.user)
+        index_jobs(
+            Jobs.objects.filter(link__in=upserted.keys()).only(
+                "id", "title", "company_name", "description", "canonical_id"
+            )
+        )
+        summary = {"inserted": 0, "updated": 0, "skipped": 0}
+        for result in results:
+            if "status" not in result:
+                if result["link"] in upserted:
+                    result["uid"], result["status"] = upserted[result["link"]]
+                else:
+                    result.update(status="skipped", errors="Unchanged")
+            summary[result["status"]] += 1
+
+        return Response({**summary, "results": results})
+
+    @swagger_auto_schema(
+        method="post",
+        request_body=JobsNewLinksSerializer,
+        responses={200: "Links that are not saved yet", 400: "Validation errors"},
+    )
+    @action(
+        detail=False,
+        methods=["post"],
+        url_path="new-links",
+        permission_classes=[IsAdminUser],
+    )
+    def new_links(self, request):
+        """Filter candidate links down to postings that are not saved yet"""
+        serializer = JobsNewLinksSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        links = serializer.validated_data["links"]
+        new_links = find_new_links(links)
+        return Response({"new_links": new_links, "seen": len(links) - len(new_links)})
+
+
+class JobAssessmentAPI(CursorPaginationMixin, viewsets.ModelViewSet):
     serializer_class = JobAssessmentSerializer
     pagination_class = JobsPagination
 
     def get_queryset(self):
         """Return assessments for the current user's profile"""
-        return (
+        queryset = (
             JobAssessment.objects.filter(profile__actor=self.request.user)
             .select_related("job", "profile")
             .order_by("-created_on")
         )
+        return sparse_queryset(queryset, self.serializer_class, self.request)
 
-    @swagger_auto_schema(responses={200: JobAssessmentSerializer(many=True)})
+    @swagger_auto_schema(
+        manual_parameters=PAGINATION_PARAMETERS,
+        responses={200: JobAssessmentSerializer(many=True)},
+    )
     def list(self, request, *args, **kwargs):
         """List job assessments for the current user"""
         return super().list(request, *args, **kwargs)
@@ -274,8 +837,6 @@ class JobAssessmentAPI(viewsets.ModelViewSet):
         """Create a new job assessment"""
         # Get user's profile
         try:
-            from apps.profiles.models import Profile
-
             profile = Profile.objects.get(actor=request.user)
         except Profile.DoesNotExist:
             return Response(
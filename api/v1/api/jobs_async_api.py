@@ -0,0 +1,167 @@
+import functools
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.paginator import InvalidPage
+from django.http import HttpResponse
+from django.urls import URLPattern
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework.exceptions import ValidationError
+
+from api.v1.api.jobs_api import JobsAPI
+from api.v1.renderers import ORJSONRenderer
+from api.v1.serializers.jobs_serializer import serialize_job_list_rows
+from apps.jobs.cache import (
+    CachedPaginator,
+    aget_cached_response,
+    aset_cached_response,
+)
+from apps.jobs.conditional import (
+    job_key,
+    job_validators,
+    list_validators,
+    not_modified,
+    set_validators,
+)
+
+# Query parameters whose responses only the sync JobsAPI builds
+SYNC_ONLY_PARAMS = {"pagination", "cursor", "facets", "format"}
+
+
+def serves_natively(request, kwargs):
+    """
+    Whether an async view answers the request itself: anonymous JSON reads of
+    the page-number list or a detail. Everything else (writes, signed-in
+    users, the browsable API, cursor pages, facets) goes to JobsAPI.
+    """
+    return (
+        request.method == "GET"
+        and "format" not in kwargs
+        and "HTTP_AUTHORIZATION" not in request.META
+        and settings.SESSION_COOKIE_NAME not in request.COOKIES
+        and "text/html" not in request.headers.get("Accept", "")
+        and SYNC_ONLY_PARAMS.isdisjoint(request.GET)
+    )
+
+
+def jobs_view(request, action, **kwargs):
+    """A JobsAPI instance set up for `action`, for its querysets and serializers"""
+    view = JobsAPI(
+        action_map={"get": action}, args=(), kwargs=kwargs, format_kwarg=None
+    )
+    view.request = view.initialize_request(request)
+    view.headers = view.default_response_headers
+    return view
+
+
+def json_response(view, data):
+    response = HttpResponse(
+        ORJSONRenderer().render(data), content_type="application/json"
+    )
+    for name, value in view.headers.items():
+        response[name] = value
+    return response
+
+
+async def fetch_page(view, rows):
+    """
+    The requested page of `rows`, set on the view's paginator for its links.
+    Raises InvalidPage for a page JobsPagination would answer with a 404.
+    """
+    pagination = view.paginator
+    page_size = pagination.get_page_size(view.request)
+    count = await rows.acount()
+    paginator = CachedPaginator([], count, page_size)
+    number = view.request.query_params.get(pagination.page_query_param) or 1
+    if number in pagination.last_page_strings:
+        number = paginator.num_pages
+    number = paginator.validate_number(number)
+    bottom = (number - 1) * page_size
+    page = [row async for row in rows[bottom : bottom + page_size].aiterator()]
+    pagination.request = view.request
+    pagination.page = CachedPaginator(page, count, page_size).page(number)
+    return page
+
+
+async def list_jobs(request):
+    """JobsAPI.list, awaiting the jobs cache and the ORM; None to fall back"""
+    view = jobs_view(request, "list")
+    cached = await aget_cached_response(request, "api-list", view.request.user)
+    if cached is None:
+        try:
+            queryset = view.filter_queryset(view.get_queryset())
+            fields = list(view.get_serializer().fields)
+            rows = queryset.values(
+                *dict.fromkeys(["id", "created_on", "uid", "updated_on", *fields])
+            )
+            page = await fetch_page(view, rows)
+        except (InvalidPage, ValidationError):
+            return None
+        keys = [job_key(row["uid"]) for row in page]
+        validators = list_validators(request, page)
+        response = not_modified(request, *validators)
+        if response is not None:
+            return set_validators(response, *validators, keys=keys)
+        results = serialize_job_list_rows(page, fields)
+        data = view.paginator.get_paginated_response(results).data
+        cached = (data, validators, keys)
+        await aset_cached_response(request, "api-list", view.request.user, cached)
+
+    data, validators, keys = cached
+    response = not_modified(request, *validators) or json_response(view, data)
+    return set_validators(response, *validators, keys=keys)
+
+
+async def retrieve_job(request, pk):
+    """JobsAPI.retrieve, awaiting the jobs cache and the ORM; None to fall back"""
+    view = jobs_view(request, "retrieve", pk=pk)
+    namespace = f"api-detail:{pk}"
+    cached = await aget_cached_response(request, namespace, view.request.user)
+    if cached is None:
+        try:
+            queryset = view.get_queryset().filter(pk=pk)
+        except (TypeError, ValueError):
+            return None
+        meta = await queryset.values_list("uid", "updated_on").afirst()
+        if meta is None:
+            return None
+        validators = job_validators(*meta)
+        response = not_modified(request, *validators)
+        if response is not None:
+            return set_validators(response, *validators, keys=[job_key(meta[0])])
+        job = await queryset.afirst()
+        if job is None:
+            return None
+        cached = (view.get_serializer(job).data, validators, meta[0])
+        await aset_cached_response(request, namespace, view.request.user, cached)
+
+    data, validators, uid = cached
+    response = not_modified(request, *validators) or json_response(view, data)
+    return set_validators(response, *validators, keys=[job_key(uid)])
+
+
+ASYNC_ROUTES = {"jobs-list": list_jobs, "jobs-detail": retrieve_job}
+
+
+def async_route(pattern):
+    """
+    The router's URL pattern with the jobs list/detail answered by the async
+    views above where they can, and by the JobsAPI view otherwise.
+    """
+    serve = ASYNC_ROUTES.get(pattern.name)
+    if serve is None:
+        return pattern
+    sync_view = sync_to_async(pattern.callback)
+
+    # Keeps the attributes DRF's as_view() sets (cls, actions) for the schema
+    @functools.wraps(pattern.callback)
+    async def view(request, **kwargs):
+        if serves_natively(request, kwargs):
+            response = await serve(request, **kwargs)
+            if response is not None:
+                return response
+        return await sync_view(request, **kwargs)
+
+    return URLPattern(
+        pattern.pattern, csrf_exempt(view), pattern.default_args, pattern.name
+    )
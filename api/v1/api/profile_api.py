@@ -6,6 +6,7 @@ from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
+from api.v1.serializers.fieldsets import sparse_queryset
 from api.v1.serializers.profile_serializer import (
     ChangePasswordSerializer,
     ProfileSerializer,
@@ -39,12 +40,13 @@ class ProfileAPI(viewsets.ViewSet):
 
     @swagger_auto_schema(responses={200: ProfileSerializer, 404: "Profile not found"})
     def list(self, request):
-        profile = self.get_queryset().first()
+        queryset = sparse_queryset(self.get_queryset(), ProfileSerializer, request)
+        profile = queryset.first()
         if not profile:
             return Response(
                 {"error": "Profile not found"}, status=status.HTTP_404_NOT_FOUND
             )
-        serializer = ProfileSerializer(profile)
+        serializer = ProfileSerializer(profile, context={"request": request})
         return Response(serializer.data)
 
     @swagger_auto_schema(
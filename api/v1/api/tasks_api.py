@@ -0,0 +1,22 @@
+from drf_yasg.utils import swagger_auto_schema
+from rest_framework import viewsets
+from rest_framework.decorators import action
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+
+from apps.tasks.queue import queue_stats
+
+
+class TasksAPI(viewsets.ViewSet):
+    """Visibility into the Postgres background task queue"""
+
+    permission_classes = [IsAdminUser]
+
+    @swagger_auto_schema(
+        method="get",
+        responses={200: "Queue depth and wait/run times (seconds) per task name"},
+    )
+    @action(detail=False, methods=["get"], url_path="stats")
+    def stats(self, request):
+        """Queued, due, running and failed tasks, plus recent latency, per task"""
+        return Response(queue_stats())
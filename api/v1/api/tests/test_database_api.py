@@ -0,0 +1,26 @@
+from django.conf import settings
+from django.contrib.auth.models import User
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+
+
+class DatabasePoolStatsAPITestCase(APITestCase):
+    def setUp(self):
+        self.client = APIClient()
+
+    def test_pool_stats_requires_staff(self):
+        response = self.client.get("/api/v1/database/pool-stats/")
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_pool_stats_report_checkouts_and_saturation(self):
+        admin = User.objects.create_user(username="ops", password="x", is_staff=True)
+        self.client.force_authenticate(user=admin)
+        response = self.client.get("/api/v1/database/pool-stats/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        pool = settings.DATABASES["default"]["OPTIONS"]["pool"]
+        self.assertEqual(response.data["mode"], "pool")
+        self.assertEqual(response.data["max_size"], pool["max_size"])
+        # The test case's connection is checked out for the whole test
+        self.assertGreaterEqual(response.data["checkouts"], 1)
+        self.assertGreaterEqual(response.data["in_use"], 1)
+        self.assertGreater(response.data["saturation"], 0)
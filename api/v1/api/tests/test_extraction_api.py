@@ -0,0 +1,79 @@
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.test import override_settings
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+
+from apps.jobs.extraction import make_description_hash
+from apps.jobs.models import JobExtraction
+
+DESCRIPTION = "<p>We need a Python and Django engineer with 3+ years, remote.</p>"
+
+
+@override_settings(JOBS_EXTRACTOR="apps.jobs.extraction.FakeExtractor")
+class ExtractionCacheAPITestCase(APITestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.admin = User.objects.create_user(
+            username="n8n", password="x", is_staff=True
+        )
+        self.client.force_authenticate(user=self.admin)
+
+    def test_extract_miss_then_hit_for_edited_repost(self):
+        url = "/api/v1/extraction-cache/extract/"
+        response = self.client.post(url, {"description": DESCRIPTION}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse(response.data["cached"])
+        self.assertEqual(response.data["fields"]["hard_skills"], ["Python", "Django"])
+        self.assertEqual(response.data["fields"]["experience_level"], "3+ years")
+
+        repost = "We need a  PYTHON and Django engineer with 3+ years,   remote."
+        response = self.client.post(url, {"description": repost}, format="json")
+        self.assertTrue(response.data["cached"])
+        self.assertEqual(JobExtraction.objects.get().hit_count, 1)
+
+        stats = self.client.get("/api/v1/extraction-cache/stats/").data
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 1))
+
+    def test_store_and_batch_lookup(self):
+        response = self.client.post(
+            "/api/v1/extraction-cache/",
+            {"description": DESCRIPTION, "fields": {"hard_skills": ["Go"]}},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        response = self.client.post(
+            "/api/v1/extraction-cache/lookup/",
+            {"descriptions": [DESCRIPTION, "Something else"]},
+            format="json",
+        )
+        hits = [item["hit"] for item in response.data["results"]]
+        self.assertEqual(hits, [True, False])
+        self.assertEqual(response.data["results"][0]["fields"], {"hard_skills": ["Go"]})
+
+    @override_settings(EXTRACTION_CACHE_MAX_ENTRIES=1)
+    def test_eviction_keeps_most_recently_used(self):
+        url = "/api/v1/extraction-cache/extract/"
+        self.client.post(url, {"description": "b"}, format="json")
+        self.client.post(url, {"description": "a"}, format="json")
+        # Using "b" again makes it the most recently used, though older
+        self.assertTrue(
+            self.client.post(url, {"description": "b"}, format="json").data["cached"]
+        )
+        call_command("evict_extraction_cache", stdout=StringIO())
+        self.assertEqual(
+            list(JobExtraction.objects.values_list("description_hash", flat=True)),
+            [make_description_hash("b")],
+        )
+        stats = self.client.get("/api/v1/extraction-cache/stats/").data
+        self.assertEqual(
+            (stats["hits"], stats["misses"], stats["evictions"]), (1, 2, 1)
+        )
+
+    def test_requires_staff(self):
+        self.client.force_authenticate(user=None)
+        response = self.client.get("/api/v1/extraction-cache/stats/")
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
@@ -0,0 +1,1014 @@
+import csv
+import gzip
+import io
+import tempfile
+from datetime import timedelta
+
+import orjson
+from asgiref.sync import async_to_sync
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import caches
+from django.db import connection
+from django.test import override_settings
+from django.urls import include, path
+from rest_framework import status
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient, APITestCase
+
+from api.v1.api.jobs_async_api import async_route
+from api.v1.renderers import ORJSONRenderer
+from api.v1.serializers.jobs_serializer import (
+    JobsListSerializer,
+    serialize_job_list_rows,
+)
+from api.v1.urls import api_router
+from apps.jobs.ingest import find_new_links, upsert_jobs
+from apps.jobs.links import make_link_hash
+from apps.jobs.models import JobAssessment, Jobs
+from apps.jobs.recommender import get_recommender
+from apps.jobs.similar import build_index
+from apps.jobs.suggest import get_suggest_index
+from apps.jobs.views import AsyncJobDetailView, AsyncJobListView
+from apps.profiles.models import Profile
+
+
+class JobsAPITestCase(APITestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.python_job = Jobs.objects.create(
+            title="Senior Python Developer",
+            description="Build APIs with Django.",
+            link="https://example.com/jobs/1",
+            hard_skills=["Python", "Django"],
+            company_name="Tokopedia",
+            job_title_category="engineering",
+        )
+        self.designer_job = Jobs.objects.create(
+            title="Product Designer",
+            description="Work closely with our Python team on internal tools.",
+            link="https://example.com/jobs/2",
+            hard_skills=["Figma"],
+            company_name="Gojek",
+            job_title_category="design",
+            employment_type="contract",
+            work_location="hybrid",
+        )
+
+    def test_search_ranks_title_match_first(self):
+        response = self.client.get("/api/v1/jobs/", {"search": "python"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        uids = [job["uid"] for job in response.data["results"]]
+        self.assertEqual(uids, [self.python_job.uid, self.designer_job.uid])
+
+    def test_search_vector_follows_updates(self):
+        self.designer_job.title = "Golang Engineer"
+        self.designer_job.save()
+        response = self.client.get("/api/v1/jobs/", {"search": "golang"})
+        uids = [job["uid"] for job in response.data["results"]]
+        self.assertEqual(uids, [self.designer_job.uid])
+
+    def test_skill_filters_match_whole_skills(self):
+        Jobs.objects.create(
+            title="Frontend Developer",
+            description="",
+            link="https://example.com/jobs/3",
+            hard_skills=["JavaScript", " figma "],
+        )
+        response = self.client.get("/api/v1/jobs/", {"hard_skills": "java"})
+        self.assertEqual(response.data["results"], [])
+
+        response = self.client.get("/api/v1/jobs/", {"hard_skills_any": "Go, Django"})
+        uids = [job["uid"] for job in response.data["results"]]
+        self.assertEqual(uids, [self.python_job.uid])
+
+        response = self.client.get(
+            "/api/v1/jobs/", {"hard_skills_all": "FIGMA,javascript"}
+        )
+        self.assertEqual(len(response.data["results"]), 1)
+        self.assertEqual(response.data["results"][0]["title"], "Frontend Developer")
+
+    def test_company_name_fuzzy_tolerates_typos(self):
+        Jobs.objects.create(
+            title="Data Engineer",
+            description="",
+            link="https://example.com/jobs/3",
+            company_name="Tokopedia Tbk",
+        )
+        response = self.client.get("/api/v1/jobs/", {"company_name_fuzzy": "tokopeda"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        companies = [job["company_name"] for job in response.data["results"]]
+        self.assertCountEqual(companies, ["Tokopedia", "Tokopedia Tbk"])
+
+    def test_facets_follow_filters(self):
+        response = self.client.get(
+            "/api/v1/jobs/",
+            {"facets": "employment_type,work_location", "search": "python"},
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["results"]), 2)
+        self.assertCountEqual(
+            response.data["facets"]["employment_type"],
+            [{"value": "full_time", "count": 1}, {"value": "contract", "count": 1}],
+        )
+
+        response = self.client.get(
+            "/api/v1/jobs/", {"facets": "work_location", "work_location": "hybrid"}
+        )
+        self.assertEqual(
+            response.data["facets"],
+            {"work_location": [{"value": "hybrid", "count": 1}]},
+        )
+
+    def test_facets_without_filters_use_rollups(self):
+        response = self.client.get(
+            "/api/v1/jobs/", {"facets": "job_title_category,source_platform"}
+        )
+        self.assertEqual(
+            response.data["facets"]["source_platform"],
+            [{"value": "weworkremotely.com", "count": 2}],
+        )
+        self.assertEqual(len(response.data["facets"]["job_title_category"]), 2)
+
+    def test_facets_rejects_unknown_fields(self):
+        response = self.client.get("/api/v1/jobs/", {"facets": "title"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_list_fast_path_matches_serializer_output(self):
+        Jobs.objects.create(
+            title="Ingénieur logiciel \u2028 «senior»",
+            description="",
+            link="https://example.com/jobs/3",
+            location=None,
+            posted_on=None,
+        )
+        queryset = Jobs.objects.order_by("-created_on")
+        expected = JSONRenderer().render(JobsListSerializer(queryset, many=True).data)
+        rows = queryset.values("id", *JobsListSerializer.Meta.fields)
+        self.assertEqual(
+            ORJSONRenderer().render(serialize_job_list_rows(rows)), expected
+        )
+
+        response = self.client.get("/api/v1/jobs/", {"page_size": 10})
+        self.assertIn(expected[1:-1], response.content)
+
+    def test_statistics_distributions(self):
+        response = self.client.get("/api/v1/jobs/statistics/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["total_jobs"], 2)
+        employment = response.data["employment_type_distribution"]
+        self.assertEqual(employment["full_time"]["count"], 1)
+        self.assertEqual(employment["contract"]["percentage"], 50.0)
+        self.assertEqual(employment["internship"]["count"], 0)
+        locations = response.data["work_location_distribution"]
+        self.assertEqual(locations["remote"]["count"], 1)
+        self.assertEqual(locations["hybrid"]["count"], 1)
+        categories = {
+            c["category"]: c["count"] for c in response.data["top_categories"]
+        }
+        self.assertEqual(categories, {"engineering": 1, "design": 1})
+
+    def test_statistics_category_filter(self):
+        response = self.client.get("/api/v1/jobs/statistics/", {"category": "Design"})
+        self.assertEqual(response.data["total_jobs"], 1)
+        self.assertEqual(
+            response.data["top_categories"],
+            [{"category": "design", "count": 1, "percentage": 100.0}],
+        )
+
+    def test_statistics_query_count_is_constant(self):
+        for i in range(12):
+            Jobs.objects.create(
+                title=f"Job {i}",
+                description="",
+                link=f"https://example.com/jobs/category-{i}",
+                job_title_category=f"category-{i}",
+            )
+        with self.assertNumQueries(1):
+            response = self.client.get("/api/v1/jobs/statistics/")
+        self.assertEqual(response.data["total_jobs"], 14)
+        self.assertEqual(len(response.data["top_categories"]), 10)
+
+    def test_cursor_pagination_walks_forward_and_back(self):
+        for i in range(3):
+            Jobs.objects.create(
+                title=f"Job {i}",
+                description="",
+                link=f"https://example.com/jobs/cursor-{i}",
+            )
+        # Force ties on created_on so the id tiebreaker is exercised
+        Jobs.objects.update(created_on=self.python_job.created_on)
+        expected = list(
+            Jobs.objects.order_by("-created_on", "-id").values_list("uid", flat=True)
+        )
+
+        seen = []
+        url = "/api/v1/jobs/?pagination=cursor&page_size=2"
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertNotIn("count", response.data)
+            seen += [job["uid"] for job in response.data["results"]]
+            last_page = response.data
+            url = response.data["next"]
+        self.assertEqual(seen, expected)
+
+        response = self.client.get(last_page["previous"])
+        self.assertEqual(
+            [job["uid"] for job in response.data["results"]], expected[2:4]
+        )
+
+    def test_cursor_pagination_rejects_garbage_cursor(self):
+        response = self.client.get(
+            "/api/v1/jobs/", {"pagination": "cursor", "cursor": "bm9wZQ=="}
+        )
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_bulk_ingest_upserts_on_link(self):
+        admin = User.objects.create_user(username="n8n", password="x", is_staff=True)
+        self.client.force_authenticate(user=admin)
+        payload = {
+            "jobs": [
+                {
+                    "title": "Data Engineer",
+                    "description": "Pipelines",
+                    "link": "https://example.com/jobs/new",
+                    "hard_skills": ["SQL"],
+                },
+                {
+                    "title": "Senior Python Developer",
+                    "description": "Build APIs with Django and FastAPI.",
+                    "link": self.python_job.link,
+                    "hard_skills": ["Python", "Django"],
+                    "company_name": "Tokopedia",
+                    "job_title_category": "engineering",
+                },
+                {
+                    "title": self.designer_job.title,
+                    "description": self.designer_job.description,
+                    "link": self.designer_job.link,
+                    "hard_skills": ["Figma"],
+                    "company_name": "Gojek",
+                    "job_title_category": "design",
+                    "employment_type": "contract",
+                    "work_location": "hybrid",
+                    "posted_on": self.designer_job.posted_on.isoformat(),
+                },
+                {"title": "No link", "description": ""},
+                {
+                    "title": "Dup",
+                    "description": "",
+                    "link": "https://example.com/jobs/new",
+                },
+            ]
+        }
+        response = self.client.post("/api/v1/jobs/bulk-ingest/", payload, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        statuses = [item["status"] for item in response.data["results"]]
+        self.assertEqual(
+            statuses, ["inserted", "updated", "skipped", "skipped", "skipped"]
+        )
+        self.assertEqual(
+            (
+                response.data["inserted"],
+                response.data["updated"],
+                response.data["skipped"],
+            ),
+            (1, 1, 3),
+        )
+        self.assertIn("link", response.data["results"][3]["errors"])
+
+        created = Jobs.objects.get(link="https://example.com/jobs/new")
+        self.assertEqual(created.uid, response.data["results"][0]["uid"])
+        self.assertEqual(created.employment_type, "full_time")
+        self.python_job.refresh_from_db()
+        self.assertIn("FastAPI", self.python_job.description)
+        self.assertEqual(
+            self.client.get("/api/v1/jobs/", {"search": "fastapi"}).data["count"], 1
+        )
+
+    def test_bulk_ingest_keeps_fields_the_record_leaves_out(self):
+        admin = User.objects.create_user(username="n8n", password="x", is_staff=True)
+        self.client.force_authenticate(user=admin)
+        posted_on = self.python_job.posted_on
+        updated_on = self.python_job.updated_on
+        record = {
+            "title": self.python_job.title,
+            "description": self.python_job.description,
+            "link": self.python_job.link,
+        }
+        response = self.client.post(
+            "/api/v1/jobs/bulk-ingest/", {"jobs": [record]}, format="json"
+        )
+        self.assertEqual(response.data["results"][0]["status"], "skipped")
+
+        response = self.client.post(
+            "/api/v1/jobs/bulk-ingest/",
+            {"jobs": [{**record, "title": "Lead Python Developer"}]},
+            format="json",
+        )
+        self.assertEqual(response.data["results"][0]["status"], "updated")
+        self.python_job.refresh_from_db()
+        self.assertEqual(self.python_job.title, "Lead Python Developer")
+        self.assertEqual(self.python_job.posted_on, posted_on)
+        self.assertEqual(self.python_job.hard_skills, ["Python", "Django"])
+        self.assertEqual(self.python_job.company_name, "Tokopedia")
+        self.assertGreater(self.python_job.updated_on, updated_on)
+
+    def test_bulk_ingest_requires_staff(self):
+        response = self.client.post(
+            "/api/v1/jobs/bulk-ingest/", {"jobs": [{"title": "x"}]}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_new_links_ignores_variants_of_saved_links(self):
+        admin = User.objects.create_user(username="n8n", password="x", is_staff=True)
+        self.client.force_authenticate(user=admin)
+        Jobs.objects.create(
+            title="Flutter Developer",
+            description="",
+            link="https://id.indeed.com/jobs?q=flutter&l=&from=searchOnDesktopSerp&vjk=abc123",
+        )
+        candidates = [
+            "https://www.indeed.com/viewjob?jk=abc123&utm_source=n8n",
+            "https://example.com/jobs/1/?utm_medium=email",
+            "https://example.com/jobs/3",
+            "http://www.example.com/jobs/3/",
+        ]
+        response = self.client.post(
+            "/api/v1/jobs/new-links/", {"links": candidates}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["new_links"], ["https://example.com/jobs/3"])
+        self.assertEqual(response.data["seen"], 3)
+
+    def test_database_link_hash_matches_make_link_hash(self):
+        links = [
+            "https://example.com/jobs/1",
+            " HTTPS://User:pw@WWW.Example.com:8443/jobs/1/?b=2&a=1&a=&utm_Source=x#top",
+            "https://example.com/jobs?q=caf%C3%A9+bar&ref=home&x&&y=%zz&z=a+b%2Bc",
+            "https://example.com/jobs?q=%E2%9C%93&q=%F0%9F%9A%80&from=feed&Ref=1",
+            "https://example.com/search?q=d%C3%A9v&q=dev~1.0_-*",
+            "https://id.indeed.com/jobs?q=flutter&jk=&vjk=abc123",
+            "https://indeed.com/viewjob?jk=one&jk=two",
+            "https://notindeed.com/viewjob?jk=abc123",
+            "http://[2001:DB8::1]:80/jobs/",
+            "example.com/jobs/1/",
+            "https://example.com/jobs?q=%FF",
+        ]
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT link, jobs_link_hash(link) FROM unnest(%s::text[]) AS link",
+                [links],
+            )
+            stored = dict(cursor.fetchall())
+        self.assertEqual(stored, {link: make_link_hash(link) for link in links})
+        self.assertIsNone(stored["https://example.com/jobs?q=%FF"])
+
+    def test_new_links_sees_rows_written_outside_save(self):
+        job = Jobs.objects.create(
+            title="Flutter Developer", description="", link="https://example.com/1"
+        )
+        # As the n8n workflows do: straight to the table, no save()
+        Jobs.objects.filter(pk=job.pk).update(
+            link="https://example.com/jobs/2/?utm_source=n8n"
+        )
+        upsert_jobs(
+            [{"title": "Go Developer", "description": "", "link": "https://x.io/3"}]
+        )
+        candidates = [
+            "http://www.example.com/jobs/2",
+            "https://x.io/3/?fbclid=abc",
+            "https://example.com/1",
+        ]
+        self.assertEqual(find_new_links(candidates), ["https://example.com/1"])
+
+    def test_bulk_ingest_links_cross_platform_duplicates(self):
+        admin = User.objects.create_user(username="n8n", password="x", is_staff=True)
+        self.client.force_authenticate(user=admin)
+        description = (
+            "Tokopedia is looking for a senior Python developer to design, build "
+            "and operate the APIs behind our marketplace. You will work with Django, "
+            "PostgreSQL and Kubernetes, review code and mentor other engineers."
+        )
+        payload = {
+            "jobs": [
+                {
+                    "title": "Senior Python Developer",
+                    "company_name": "Tokopedia",
+                    "description": description,
+                    "link": "https://weworkremotely.com/remote-jobs/tokopedia-python",
+                },
+                {
+                    "title": "Senior Python Developer",
+                    "company_name": "Tokopedia",
+                    "description": description + " Apply today!",
+                    "link": "https://id.indeed.com/viewjob?jk=tokopedia1",
+                    "source_platform": "indeed.com",
+                },
+            ]
+        }
+        response = self.client.post("/api/v1/jobs/bulk-ingest/", payload, format="json")
+        self.assertEqual(response.data["inserted"], 2)
+
+        original = Jobs.objects.get(link=payload["jobs"][0]["link"])
+        repost = Jobs.objects.get(link=payload["jobs"][1]["link"])
+        self.assertIsNone(original.canonical_id)
+        self.assertEqual(repost.canonical_id, original.id)
+
+        listed = self.client.get("/api/v1/jobs/").data
+        self.assertNotIn(repost.uid, [job["uid"] for job in listed["results"]])
+        listed = self.client.get("/api/v1/jobs/", {"include_duplicates": "true"}).data
+        self.assertIn(repost.uid, [job["uid"] for job in listed["results"]])
+        stats = self.client.get("/api/v1/jobs/statistics/").data
+        self.assertEqual(stats["total_jobs"], 3)
+
+
+class RecommendedJobsAPITestCase(APITestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(username="seeker", password="x")
+        self.profile = Profile.objects.create(
+            actor=self.user,
+            name="Seeker",
+            job_title="Backend Developer",
+            profile="Five years of Python, Django and PostgreSQL. Strong communication.",
+            area="SE_ASIA",
+            availability_type="REMOTE",
+        )
+        self.backend = Jobs.objects.create(
+            title="Backend Developer",
+            description="",
+            link="https://example.com/jobs/backend",
+            hard_skills=["Python", "Django", "PostgreSQL"],
+            soft_skills=["Communication"],
+            location="Jakarta, Indonesia",
+        )
+        self.kotlin = Jobs.objects.create(
+            title="Android Developer",
+            description="",
+            link="https://example.com/jobs/android",
+            hard_skills=["Kotlin", "PostgreSQL"],
+        )
+        self.accountant = Jobs.objects.create(
+            title="Accountant",
+            description="",
+            link="https://example.com/jobs/accountant",
+            hard_skills=["Excel"],
+            work_location="onsite",
+        )
+        get_recommender().rebuild()
+        self.client.force_authenticate(user=self.user)
+
+    def test_recommended_ranks_best_fit_first(self):
+        response = self.client.get("/api/v1/jobs/recommended/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        uids = [job["uid"] for job in response.data["results"]]
+        self.assertEqual(uids, [self.backend.uid, self.kotlin.uid])
+        self.assertGreater(response.data["results"][0]["score"], 0)
+
+    def test_recommended_picks_up_changes_and_skips_assessed_jobs(self):
+        self.accountant.title = "Python Backend Developer"
+        self.accountant.hard_skills = ["Python", "Django", "PostgreSQL"]
+        self.accountant.work_location = "remote"
+        self.accountant.location = "Bandung, Indonesia"
+        self.accountant.save()
+        JobAssessment.objects.create(
+            job=self.backend, profile=self.profile, summary="", score=80
+        )
+        get_recommender().refresh(force=True)
+
+        response = self.client.get("/api/v1/jobs/recommended/", {"limit": 1})
+        uids = [job["uid"] for job in response.data["results"]]
+        self.assertEqual(uids, [self.accountant.uid])
+
+    def test_recommended_picks_up_changes_committed_behind_the_watermark(self):
+        # A transaction stamped before the last change seen, committed after it
+        Jobs.objects.filter(pk=self.accountant.pk).update(
+            title="Python Backend Developer",
+            hard_skills=["Python", "Django", "PostgreSQL"],
+            work_location="remote",
+            location="Bandung, Indonesia",
+            updated_on=get_recommender().watermark - timedelta(minutes=1),
+        )
+        JobAssessment.objects.create(
+            job=self.backend, profile=self.profile, summary="", score=80
+        )
+        get_recommender().refresh(force=True)
+
+        response = self.client.get("/api/v1/jobs/recommended/", {"limit": 1})
+        uids = [job["uid"] for job in response.data["results"]]
+        self.assertEqual(uids, [self.accountant.uid])
+
+    def test_recommended_requires_profile(self):
+        self.client.force_authenticate(
+            user=User.objects.create_user(username="new", password="x")
+        )
+        response = self.client.get("/api/v1/jobs/recommended/")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class JobsExportTestCase(APITestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.python_job = Jobs.objects.create(
+            title="Python Developer",
+            description="Django, all day",
+            link="https://example.com/jobs/python",
+            hard_skills=["Python", "Django"],
+            employment_type="full_time",
+        )
+        self.designer_job = Jobs.objects.create(
+            title="Product Designer",
+            description="",
+            link="https://example.com/jobs/designer",
+            employment_type="contract",
+        )
+        self.client.force_authenticate(
+            user=User.objects.create_user(username="analyst", password="x")
+        )
+
+    def export(self, **params):
+        response = self.client.get("/api/v1/jobs/export/", params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        return response, b"".join(response.streaming_content)
+
+    def test_ndjson_export_honors_filters(self):
+        response, content = self.export(
+            format="ndjson", employment_type="full_time", fields="uid,title,hard_skills"
+        )
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        self.assertEqual(
+            [orjson.loads(line) for line in content.splitlines()],
+            [
+                {
+                    "uid": self.python_job.uid,
+                    "title": "Python Developer",
+                    "hard_skills": ["Python", "Django"],
+                }
+            ],
+        )
+
+    def test_csv_export(self):
+        response, content = self.export(format="csv", fields="title,hard_skills")
+        self.assertEqual(response["Content-Type"], "text/csv")
+        rows = list(csv.reader(io.StringIO(content.decode())))
+        self.assertEqual(
+            rows,
+            [
+                ["title", "hard_skills"],
+                ["Product Designer", ""],
+                ["Python Developer", "Python; Django"],
+            ],
+        )
+
+    def test_gzip_export(self):
+        response = self.client.get(
+            "/api/v1/jobs/export/", {"format": "ndjson"}, HTTP_ACCEPT_ENCODING="gzip"
+        )
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        lines = gzip.decompress(b"".join(response.streaming_content)).splitlines()
+        self.assertEqual(len(lines), 2)
+
+        response = self.client.get(
+            "/api/v1/jobs/export/",
+            {"format": "ndjson"},
+            HTTP_ACCEPT_ENCODING="gzip;q=0, *;q=0.5",
+        )
+        self.assertNotIn("Content-Encoding", response)
+        self.assertEqual(len(b"".join(response.streaming_content).splitlines()), 2)
+
+    def test_export_requires_authentication(self):
+        self.client.force_authenticate(user=None)
+        response = self.client.get("/api/v1/jobs/export/", {"format": "csv"})
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_export_rejects_unknown_fields(self):
+        response = self.client.get(
+            "/api/v1/jobs/export/", {"format": "csv", "fields": "title,salary"}
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class JobsSnapshotAPITestCase(APITestCase):
+    def setUp(self):
+        self.client = APIClient()
+        Jobs.objects.create(
+            title="Data Engineer", description="", link="https://example.com/jobs/d"
+        )
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        settings_override = override_settings(JOBS_SNAPSHOT_DIR=directory.name)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+    def test_snapshot_requires_staff(self):
+        self.client.force_authenticate(
+            user=User.objects.create_user(username="user", password="x")
+        )
+        response = self.client.post("/api/v1/jobs/snapshot/")
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_snapshot_writes_and_lists_snapshots(self):
+        self.client.force_authenticate(
+            user=User.objects.create_user(username="staff", password="x", is_staff=True)
+        )
+        response = self.client.post("/api/v1/jobs/snapshot/", {"incremental": True})
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["kind"], "full")
+        self.assertEqual(response.data["rows"], 1)
+        snapshot_id = response.data["id"]
+
+        response = self.client.get("/api/v1/jobs/snapshot/")
+        self.assertEqual(
+            [snapshot["id"] for snapshot in response.data["snapshots"]], [snapshot_id]
+        )
+
+
+class SparseFieldsetTestCase(APITestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(username="sparse", password="x")
+        self.profile = Profile.objects.create(actor=self.user, name="Sparse")
+        self.job = Jobs.objects.create(
+            title="Data Engineer",
+            description="Pipelines all day.",
+            link="https://example.com/jobs/data",
+            company_name="Traveloka",
+        )
+        JobAssessment.objects.create(
+            job=self.job, profile=self.profile, summary="Good fit", score=75
+        )
+        self.client.force_authenticate(user=self.user)
+
+    def test_list_returns_only_requested_fields(self):
+        response = self.client.get("/api/v1/jobs/", {"fields": "uid,title"})
+        self.assertEqual(
+            response.data["results"], [{"uid": self.job.uid, "title": "Data Engineer"}]
+        )
+
+    def test_unknown_or_fully_omitted_fields_return_empty_objects(self):
+        response = self.client.get("/api/v1/jobs/", {"fields": "bogus"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["results"], [{}])
+        self.assertIn(f"job-{self.job.uid}", response.headers["Surrogate-Key"])
+        response = self.client.get(f"/api/v1/jobs/{self.job.id}/", {"fields": "bogus"})
+        self.assertEqual((response.status_code, response.data), (200, {}))
+
+    def test_retrieve_omits_fields_and_defers_columns(self):
+        with self.assertNumQueries(2) as queries:
+            response = self.client.get(
+                f"/api/v1/jobs/{self.job.id}/", {"omit": "description,hard_skills"}
+            )
+        self.assertEqual(response.data["title"], "Data Engineer")
+        self.assertNotIn("description", response.data)
+        self.assertNotIn("hard_skills", response.data)
+        self.assertNotIn('"description"', queries.captured_queries[-1]["sql"])
+
+    def test_nested_paths_select_nested_fields(self):
+        with self.assertNumQueries(2) as queries:
+            response = self.client.get(
+                "/api/v1/job-assessments/", {"fields": "score,job.title"}
+            )
+        self.assertEqual(
+            response.data["results"], [{"score": 75, "job": {"title": "Data Engineer"}}]
+        )
+        sql = queries.captured_queries[-1]["sql"]
+        self.assertIn('"jobs_jobs"."title"', sql)
+        self.assertNotIn('"jobs_jobs"."description"', sql)
+        self.assertNotIn('"jobs_jobassessment"."summary"', sql)
+
+    def test_nested_omit_and_profile_fields(self):
+        response = self.client.get(
+            "/api/v1/job-assessments/", {"omit": "job.description"}
+        )
+        job = response.data["results"][0]["job"]
+        self.assertEqual(job["title"], "Data Engineer")
+        self.assertNotIn("description", job)
+
+        response = self.client.get("/api/v1/profile/", {"fields": "name,email"})
+        self.assertEqual(response.data, {"name": "Sparse", "email": ""})
+
+
+class SimilarJobsAPITestCase(APITestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.backend = Jobs.objects.create(
+            title="Python Backend Developer",
+            description="Build REST APIs with Django and PostgreSQL.",
+            link="https://example.com/jobs/backend",
+        )
+        self.django = Jobs.objects.create(
+            title="Django Developer",
+            description="Maintain Python services and PostgreSQL schemas.",
+            link="https://example.com/jobs/django",
+        )
+        self.accountant = Jobs.objects.create(
+            title="Accountant",
+            description="Prepare monthly financial statements.",
+            link="https://example.com/jobs/accountant",
+        )
+        index_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(index_dir.cleanup)
+        settings_override = override_settings(SIMILAR_JOBS_INDEX_DIR=index_dir.name)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        build_index(index_dir.name)
+
+    def test_similar_ranks_related_jobs(self):
+        response = self.client.get(f"/api/v1/jobs/{self.backend.id}/similar/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        uids = [job["uid"] for job in response.data["results"]]
+        self.assertEqual(uids, [self.django.uid])
+        self.assertGreater(response.data["results"][0]["similarity"], 0)
+
+    def test_similar_handles_jobs_added_after_build(self):
+        new_job = Jobs.objects.create(
+            title="Senior Django Developer",
+            description="Python and PostgreSQL.",
+            link="https://example.com/jobs/new",
+        )
+        response = self.client.get(f"/api/v1/jobs/{new_job.id}/similar/", {"limit": 1})
+        uids = [job["uid"] for job in response.data["results"]]
+        self.assertEqual(uids, [self.django.uid])
+
+    def test_similar_reloads_a_rebuilt_index(self):
+        self.client.get(f"/api/v1/jobs/{self.backend.id}/similar/")
+        new_job = Jobs.objects.create(
+            title="Backend Engineer",
+            description="Python, Django and PostgreSQL services.",
+            link="https://example.com/jobs/new",
+        )
+        build_index(settings.SIMILAR_JOBS_INDEX_DIR)
+
+        response = self.client.get(f"/api/v1/jobs/{self.backend.id}/similar/")
+        uids = [job["uid"] for job in response.data["results"]]
+        self.assertCountEqual(uids, [self.django.uid, new_job.uid])
+
+
+class SuggestJobsAPITestCase(APITestCase):
+    def setUp(self):
+        self.client = APIClient()
+        for index, (skills, location) in enumerate(
+            [
+                (["Python", "PostgreSQL"], "Jakarta, Indonesia"),
+                (["python", "Pytest"], "Bandung, Indonesia"),
+                (["PyTorch"], "Singapore"),
+            ]
+        ):
+            Jobs.objects.create(
+                title="Engineer",
+                description="",
+                link=f"https://example.com/jobs/{index}",
+                hard_skills=skills,
+                location=location,
+            )
+        get_suggest_index().rebuild()
+
+    def test_suggest_ranks_by_frequency(self):
+        response = self.client.get(
+            "/api/v1/jobs/suggest/", {"field": "hard_skills", "prefix": "py"}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data["results"],
+            [
+                {"value": "Python", "count": 2},
+                {"value": "Pytest", "count": 1},
+                {"value": "PyTorch", "count": 1},
+            ],
+        )
+
+    def test_suggest_matches_word_starts_and_picks_up_changes(self):
+        job = Jobs.objects.get(location="Singapore")
+        job.location = "Surabaya, Indonesia"
+        job.save()
+        skills_index = get_suggest_index().indexes["hard_skills"]
+        get_suggest_index().refresh()
+        # Only fields whose counts changed get a new PrefixIndex
+        self.assertIs(get_suggest_index().indexes["hard_skills"], skills_index)
+
+        response = self.client.get(
+            "/api/v1/jobs/suggest/",
+            {"field": "location", "prefix": "indo", "limit": 2},
+        )
+        values = [item["value"] for item in response.data["results"]]
+        self.assertEqual(values, ["Bandung, Indonesia", "Jakarta, Indonesia"])
+        response = self.client.get(
+            "/api/v1/jobs/suggest/", {"field": "location", "prefix": "sin"}
+        )
+        self.assertEqual(response.data["results"], [])
+
+    def test_suggest_rejects_unknown_field(self):
+        response = self.client.get("/api/v1/jobs/suggest/", {"field": "title"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class JobsResponseCacheTestCase(APITestCase):
+    def setUp(self):
+        self.client = APIClient()
+        caches["jobs"].clear()
+        self.job = Jobs.objects.create(
+            title="Backend Developer",
+            description="",
+            link="https://example.com/jobs/backend",
+        )
+
+    def test_anonymous_list_and_detail_are_served_from_cache(self):
+        first = self.client.get("/api/v1/jobs/", {"page": 1, "search": ""})
+        self.client.get(f"/api/v1/jobs/{self.job.id}/")
+        with self.assertNumQueries(0):
+            second = self.client.get("/api/v1/jobs/", {"page": "1"})
+            detail = self.client.get(f"/api/v1/jobs/{self.job.id}/")
+        self.assertEqual(first.data, second.data)
+        self.assertEqual(detail.data["title"], "Backend Developer")
+
+        stats_user = User.objects.create_superuser(username="admin", password="x")
+        self.client.force_authenticate(user=stats_user)
+        stats = self.client.get("/api/v1/jobs/cache-stats/").data
+        self.assertEqual((stats["hits"], stats["misses"]), (2, 2))
+
+    def test_writes_invalidate_cached_responses(self):
+        self.client.get("/api/v1/jobs/")
+        self.job.title = "Staff Backend Developer"
+        self.job.save()
+        response = self.client.get("/api/v1/jobs/")
+        self.assertEqual(
+            response.data["results"][0]["title"], "Staff Backend Developer"
+        )
+
+        upsert_jobs(
+            [{"title": "Data Engineer", "description": "", "link": "https://x.io/1"}]
+        )
+        response = self.client.get("/api/v1/jobs/")
+        self.assertEqual(response.data["count"], 2)
+
+    def test_version_is_shared_across_workers(self):
+        self.client.get("/api/v1/jobs/")
+        # Another worker's write: only the version in the shared cache moves
+        Jobs.objects.filter(pk=self.job.pk).update(title="Staff Backend Developer")
+        caches["jobs"].incr("jobs:version")
+        response = self.client.get("/api/v1/jobs/")
+        self.assertEqual(
+            response.data["results"][0]["title"], "Staff Backend Developer"
+        )
+
+    def test_job_list_page_is_cached(self):
+        self.client.get("/jobs/")
+        with self.assertNumQueries(0):
+            response = self.client.get("/jobs/")
+        self.assertContains(response, "Backend Developer")
+
+
+class ConditionalGetTestCase(APITestCase):
+    def setUp(self):
+        self.client = APIClient()
+        caches["jobs"].clear()
+        self.job = Jobs.objects.create(
+            title="Backend Developer",
+            description="",
+            link="https://example.com/jobs/backend",
+        )
+
+    def test_retrieve_answers_if_none_match_with_304(self):
+        response = self.client.get(f"/api/v1/jobs/{self.job.id}/")
+        etag = response.headers["ETag"]
+        self.assertIn("Last-Modified", response.headers)
+        self.assertIn(f"job-{self.job.uid}", response.headers["Surrogate-Key"])
+        self.assertIn("s-maxage", response.headers["Cache-Control"])
+
+        caches["jobs"].clear()
+        with self.assertNumQueries(1):
+            response = self.client.get(
+                f"/api/v1/jobs/{self.job.id}/", HTTP_IF_NONE_MATCH=etag
+            )
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        self.job.title = "Staff Backend Developer"
+        self.job.save()
+        response = self.client.get(
+            f"/api/v1/jobs/{self.job.id}/", HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_list_etag_follows_filters_and_writes(self):
+        response = self.client.get("/api/v1/jobs/", {"search": "backend"})
+        etag = response.headers["ETag"]
+        self.assertNotEqual(self.client.get("/api/v1/jobs/").headers["ETag"], etag)
+
+        response = self.client.get(
+            "/api/v1/jobs/", {"search": "backend"}, HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        self.job.delete()
+        response = self.client.get(
+            "/api/v1/jobs/", {"search": "backend"}, HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_cursor_list_validators_need_no_aggregate(self):
+        # Only the page itself
+        with self.assertNumQueries(1):
+            response = self.client.get("/api/v1/jobs/", {"pagination": "cursor"})
+        self.assertIn("ETag", response.headers)
+
+    def test_job_detail_page_is_private_and_conditional(self):
+        # The first visit sets the CSRF cookie the ETag depends on
+        self.client.get(f"/jobs/{self.job.uid}")
+        response = self.client.get(f"/jobs/{self.job.uid}")
+        self.assertIn("private", response.headers["Cache-Control"])
+        response = self.client.get(
+            f"/jobs/{self.job.uid}", HTTP_IF_NONE_MATCH=response.headers["ETag"]
+        )
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+
+# The job routes as served with ASYNC_JOB_VIEWS on (see AsyncJobViewsTestCase)
+urlpatterns = [
+    path("api/v1/", include([async_route(pattern) for pattern in api_router.urls])),
+    path("jobs/", AsyncJobListView.as_view(), name="job_list"),
+    path("jobs/<str:uid>", AsyncJobDetailView.as_view(), name="job_detail"),
+    path("", include("core.urls")),
+]
+
+
+@override_settings(ROOT_URLCONF=__name__)
+class AsyncJobViewsTestCase(APITestCase):
+    def setUp(self):
+        caches["jobs"].clear()
+        self.job = Jobs.objects.create(
+            title="Backend Developer",
+            description="",
+            link="https://example.com/jobs/backend",
+        )
+        Jobs.objects.create(
+            title="Data Engineer",
+            description="",
+            link="https://example.com/jobs/data",
+        )
+
+    def async_get(self, *args, **kwargs):
+        return async_to_sync(self.async_client.get)(*args, **kwargs)
+
+    def test_list_matches_sync_view_and_is_cached(self):
+        response = self.async_get("/api/v1/jobs/", {"page_size": 1})
+        data = orjson.loads(response.content)
+        self.assertEqual(data["count"], 2)
+        self.assertEqual(len(data["results"]), 1)
+        self.assertIn("page=2", data["next"])
+        self.assertEqual(response.headers["Vary"], "Accept, Authorization")
+
+        with self.assertNumQueries(0):
+            cached = self.async_get("/api/v1/jobs/", {"page_size": "1"})
+        self.assertEqual(cached.content, response.content)
+        cached = self.async_get(
+            "/api/v1/jobs/",
+            {"page_size": 1},
+            headers={"If-None-Match": response.headers["ETag"]},
+        )
+        self.assertEqual(cached.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_sparse_fields_and_filters(self):
+        response = self.async_get(
+            "/api/v1/jobs/", {"fields": "title", "search": "backend"}
+        )
+        data = orjson.loads(response.content)
+        self.assertEqual(data["results"], [{"title": "Backend Developer"}])
+        self.assertIn(f"job-{self.job.uid}", response.headers["Surrogate-Key"])
+
+    def test_retrieve(self):
+        response = self.async_get(f"/api/v1/jobs/{self.job.id}/")
+        self.assertEqual(orjson.loads(response.content)["uid"], self.job.uid)
+        with self.assertNumQueries(0):
+            response = self.async_get(
+                f"/api/v1/jobs/{self.job.id}/",
+                headers={"If-None-Match": response.headers["ETag"]},
+            )
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_other_requests_fall_back_to_jobs_api(self):
+        response = self.async_get("/api/v1/jobs/", {"page": 9})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        response = self.async_get("/api/v1/jobs/0/")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        response = self.async_get("/api/v1/jobs/", {"pagination": "cursor"})
+        self.assertEqual(len(orjson.loads(response.content)["results"]), 2)
+        response = async_to_sync(self.async_client.post)("/api/v1/jobs/", {})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_job_pages(self):
+        response = self.async_get("/jobs/", {"search": "backend"})
+        self.assertContains(response, "Backend Developer")
+        self.assertNotContains(response, "Data Engineer")
+        with self.assertNumQueries(0):
+            self.async_get("/jobs/", {"search": "backend"})
+        response = self.async_get("/jobs/", {"page": 9})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+        response = self.async_get(f"/jobs/{self.job.uid}")
+        self.assertContains(response, "Backend Developer")
+        self.assertIn("private", response.headers["Cache-Control"])
+        response = self.async_get("/jobs/missing")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
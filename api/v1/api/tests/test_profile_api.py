@@ -1,7 +1,13 @@
 from django.contrib.auth.models import User
+from django.core.cache import caches
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 from rest_framework import status
+from rest_framework.authtoken.models import Token
 from rest_framework.test import APIClient, APITestCase
 
+from apps.profiles.auth import TokenCache, token_cache
 from apps.profiles.models import Profile
 
 
@@ -69,3 +75,75 @@ class ProfileAPITestCase(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.profile.refresh_from_db()
         self.assertIsNotNone(self.profile.deleted_on)
+
+
+class CachedTokenAuthenticationTestCase(APITestCase):
+    def setUp(self):
+        token_cache.clear()
+        self.user = User.objects.create_user(
+            username="cached", email="cached@example.com", password="old_password"
+        )
+        self.profile = Profile.objects.create(actor=self.user, name="Cached")
+        self.token = Token.objects.create(user=self.user)
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {self.token.key}")
+
+    def count_queries(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get("/api/v1/profile/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return len(queries)
+
+    def test_cached_token_saves_a_query(self):
+        first = self.count_queries()
+        self.assertEqual(self.count_queries(), first - 1)
+        stats = token_cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 1))
+
+    def test_password_change_invalidates_cached_user(self):
+        self.count_queries()
+        response = self.client.post(
+            "/api/v1/profile/change-password/",
+            {"old_password": "old_password", "new_password": "new_password"},
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIsNone(token_cache.get(self.token.key))
+
+        # The old password must not be accepted through a stale cached user
+        response = self.client.post(
+            "/api/v1/profile/change-password/",
+            {"old_password": "old_password", "new_password": "other_password"},
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_deactivation_and_token_rotation_take_effect(self):
+        self.count_queries()
+        self.user.is_active = False
+        self.user.save()
+        response = self.client.get("/api/v1/profile/")
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+        self.user.is_active = True
+        self.user.save()
+        self.count_queries()
+        self.token.delete()
+        response = self.client.get("/api/v1/profile/")
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_obfuscated_profile_is_invalidated(self):
+        self.count_queries()
+        response = self.client.delete(f"/api/v1/profile/{self.profile.uid}/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIsNone(token_cache.get(self.token.key))
+
+    @override_settings(AUTH_TOKEN_CACHE="default")
+    def test_invalidation_reaches_other_processes(self):
+        caches["default"].clear()
+        first = self.count_queries()
+        self.assertEqual(self.count_queries(), first - 1)
+
+        # Another worker deactivates the user after this one cached it
+        User.objects.filter(pk=self.user.pk).update(is_active=False)
+        TokenCache().invalidate_user(self.user.pk)
+        response = self.client.get("/api/v1/profile/")
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
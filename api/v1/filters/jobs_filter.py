@@ -1,8 +1,8 @@
-from django.db.models import Q
 from django_filters import rest_framework as filters
 
 from apps.jobs.consts import EMPLOYMENT_TYPE_CHOICES, WORK_LOCATION_CHOICES
 from apps.jobs.models import Jobs
+from apps.jobs.search import filter_skills, fuzzy_match, search_jobs
 
 
 class JobsFilter(filters.FilterSet):
@@ -38,9 +38,30 @@ class JobsFilter(filters.FilterSet):
         field_name="company_name", lookup_expr="icontains"
     )
 
-    # Skills filters
+    # Typo-tolerant filters, ordered by similarity
+    location_fuzzy = filters.CharFilter(method="filter_fuzzy", label="Location (fuzzy)")
+    company_name_fuzzy = filters.CharFilter(
+        method="filter_fuzzy", label="Company Name (fuzzy)"
+    )
+    experience_level_fuzzy = filters.CharFilter(
+        method="filter_fuzzy", label="Experience Level (fuzzy)"
+    )
+
+    # Skills filters (case-insensitive exact skill names, comma-separated lists)
     hard_skills = filters.CharFilter(method="filter_hard_skills", label="Hard Skills")
     soft_skills = filters.CharFilter(method="filter_soft_skills", label="Soft Skills")
+    hard_skills_any = filters.CharFilter(
+        method="filter_hard_skills_any", label="Any of Hard Skills"
+    )
+    hard_skills_all = filters.CharFilter(
+        method="filter_hard_skills_all", label="All of Hard Skills"
+    )
+    soft_skills_any = filters.CharFilter(
+        method="filter_soft_skills_any", label="Any of Soft Skills"
+    )
+    soft_skills_all = filters.CharFilter(
+        method="filter_soft_skills_all", label="All of Soft Skills"
+    )
 
     class Meta:
         model = Jobs
@@ -57,33 +78,48 @@ class JobsFilter(filters.FilterSet):
             "created_on_before",
             "location",
             "company_name",
+            "location_fuzzy",
+            "company_name_fuzzy",
+            "experience_level_fuzzy",
             "hard_skills",
             "soft_skills",
+            "hard_skills_any",
+            "hard_skills_all",
+            "soft_skills_any",
+            "soft_skills_all",
         ]
 
     def filter_search(self, queryset, name, value):
-        """Search across multiple fields like admin search_fields"""
+        """Ranked full-text search over title, company, category, location, skills and description"""
         if not value:
             return queryset
 
-        return queryset.filter(
-            Q(title__icontains=value)
-            | Q(description__icontains=value)
-            | Q(location__icontains=value)
-            | Q(job_title_category__icontains=value)
-            | Q(company_name__icontains=value)
-            | Q(hard_skills__icontains=value)
-            | Q(soft_skills__icontains=value)
-        )
+        return search_jobs(queryset, value)
+
+    def filter_fuzzy(self, queryset, name, value):
+        """Similarity-ranked match on the field named by the filter (minus `_fuzzy`)"""
+        return fuzzy_match(queryset, name.removesuffix("_fuzzy"), value)
 
     def filter_hard_skills(self, queryset, name, value):
-        """Filter jobs that contain specific hard skills"""
-        if not value:
-            return queryset
-        return queryset.filter(hard_skills__icontains=value)
+        """Filter jobs that list a specific hard skill"""
+        return filter_skills(queryset, "hard_skills", value, "all")
 
     def filter_soft_skills(self, queryset, name, value):
-        """Filter jobs that contain specific soft skills"""
-        if not value:
-            return queryset
-        return queryset.filter(soft_skills__icontains=value)
+        """Filter jobs that list a specific soft skill"""
+        return filter_skills(queryset, "soft_skills", value, "all")
+
+    def filter_hard_skills_any(self, queryset, name, value):
+        """Filter jobs that list at least one of the given hard skills"""
+        return filter_skills(queryset, "hard_skills", value, "any")
+
+    def filter_hard_skills_all(self, queryset, name, value):
+        """Filter jobs that list every one of the given hard skills"""
+        return filter_skills(queryset, "hard_skills", value, "all")
+
+    def filter_soft_skills_any(self, queryset, name, value):
+        """Filter jobs that list at least one of the given soft skills"""
+        return filter_skills(queryset, "soft_skills", value, "any")
+
+    def filter_soft_skills_all(self, queryset, name, value):
+        """Filter jobs that list every one of the given soft skills"""
+        return filter_skills(queryset, "soft_skills", value, "all")
@@ -0,0 +1,46 @@
+from rest_framework import serializers
+
+from apps.jobs.consts import (
+    EMPLOYMENT_TYPE_CHOICES,
+    EXTRACTION_LOOKUP_MAX_ITEMS,
+    WORK_LOCATION_CHOICES,
+)
+
+
+class ExtractedFieldsSerializer(serializers.Serializer):
+    hard_skills = serializers.ListField(
+        child=serializers.CharField(max_length=255), required=False, allow_null=True
+    )
+    soft_skills = serializers.ListField(
+        child=serializers.CharField(max_length=255), required=False, allow_null=True
+    )
+    experience_level = serializers.CharField(required=False, allow_null=True)
+    location = serializers.CharField(required=False, allow_null=True)
+    employment_type = serializers.ChoiceField(
+        choices=EMPLOYMENT_TYPE_CHOICES, required=False
+    )
+    work_location = serializers.ChoiceField(
+        choices=WORK_LOCATION_CHOICES, required=False
+    )
+    company_name = serializers.CharField(required=False, allow_null=True)
+    requirements = serializers.ListField(
+        child=serializers.CharField(max_length=800), required=False, allow_null=True
+    )
+
+
+class ExtractionLookupSerializer(serializers.Serializer):
+    descriptions = serializers.ListField(
+        child=serializers.CharField(allow_blank=True),
+        allow_empty=False,
+        max_length=EXTRACTION_LOOKUP_MAX_ITEMS,
+    )
+
+
+class ExtractionStoreSerializer(serializers.Serializer):
+    description = serializers.CharField()
+    fields = ExtractedFieldsSerializer()
+
+
+class ExtractionRequestSerializer(serializers.Serializer):
+    title = serializers.CharField(required=False, allow_blank=True, default="")
+    description = serializers.CharField()
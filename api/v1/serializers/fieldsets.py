@@ -0,0 +1,103 @@
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework import serializers
+from rest_framework.permissions import SAFE_METHODS
+
+FIELDS_PARAM = "fields"
+OMIT_PARAM = "omit"
+
+
+def parse_paths(value):
+    """Parse "title,job.title,job.company_name" into {"title": {}, "job": {...}}"""
+    tree = {}
+    for path in value.split(","):
+        node = tree
+        for name in filter(None, (part.strip() for part in path.split("."))):
+            node = node.setdefault(name, {})
+    return tree
+
+
+def requested_fieldset(request):
+    """(fields, omit) trees of a read request; both empty for writes"""
+    if request is None or request.method not in SAFE_METHODS:
+        return {}, {}
+    params = request.query_params
+    return (
+        parse_paths(params.get(FIELDS_PARAM, "")),
+        parse_paths(params.get(OMIT_PARAM, "")),
+    )
+
+
+class SparseFieldsetMixin:
+    """
+    Let GET requests pick the fields of a response with ?fields= and ?omit=.
+
+    Both take comma-separated names; nested serializers are reached with
+    dotted paths, e.g. ?fields=score,job.title,job.company_name. A nested
+    name without a path keeps or drops the whole nested object. Unknown
+    names are ignored.
+    """
+
+    def get_fields(self):
+        fields = super().get_fields()
+        include, omit = self.get_fieldset()
+        if include:
+            fields = {name: field for name, field in fields.items() if name in include}
+        for name, nested in omit.items():
+            if not nested:
+                fields.pop(name, None)
+        return fields
+
+    def get_fieldset(self):
+        include, omit = requested_fieldset(self.context.get("request"))
+        # Narrow the trees down to this serializer's position in the response
+        path, node = [], self
+        while node.parent is not None:
+            if node.field_name:
+                path.append(node.field_name)
+            node = node.parent
+        for name in reversed(path):
+            include, omit = include.get(name, {}), omit.get(name, {})
+        return include, omit
+
+
+def model_field_paths(serializer, model, prefix=""):
+    """
+    Concrete model fields read by `serializer`, as only() paths. Nested
+    serializers on relations add `relation__field` paths.
+    """
+    paths = []
+    for field in serializer.fields.values():
+        if field.write_only or field.source == "*":
+            continue
+        name = field.source_attrs[0]
+        try:
+            model_field = model._meta.get_field(name)
+        except FieldDoesNotExist:
+            continue
+        if not model_field.concrete:
+            continue
+        paths.append(prefix + name)
+        if isinstance(field, serializers.BaseSerializer) and model_field.is_relation:
+            paths += model_field_paths(
+                field, model_field.related_model, f"{prefix}{name}__"
+            )
+    return paths
+
+
+def sparse_queryset(queryset, serializer_class, request):
+    """
+    Load only the columns a sparse fieldset needs. select_related() is
+    narrowed to the nested serializers that are still part of the response.
+    """
+    include, omit = requested_fieldset(request)
+    if not include and not omit:
+        return queryset
+    serializer = serializer_class(context={"request": request})
+    paths = model_field_paths(serializer, queryset.model)
+    nested = [
+        name
+        for name, field in serializer.fields.items()
+        if isinstance(field, serializers.BaseSerializer)
+        and field.source_attrs[0] in paths
+    ]
+    return queryset.select_related(None).select_related(*nested).only(*paths)
@@ -1,9 +1,13 @@
+from django.utils import timezone
 from rest_framework import serializers
 
+from api.v1.serializers.fieldsets import SparseFieldsetMixin
+from apps.jobs.consts import BULK_INGEST_MAX_ITEMS, NEW_LINKS_MAX_ITEMS
+from apps.jobs.ingest import INGEST_COLUMNS
 from apps.jobs.models import JobAssessment, Jobs
 
 
-class JobsListSerializer(serializers.ModelSerializer):
+class JobsListSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """
     Lightweight serializer for job list operations
     """
@@ -25,7 +29,54 @@ class JobsListSerializer(serializers.ModelSerializer):
         read_only_fields = ["uid", "created_on"]
 
 
-class JobsDetailSerializer(serializers.ModelSerializer):
+def serialize_job_list_rows(rows, fields=None):
+    """
+    JobsListSerializer output for rows from `.values("id", *fields)`, without
+    building model instances or per-field serializers. Choice values are
+    passed through as-is, like ChoiceField does; datetimes are formatted the
+    way DRF's DateTimeField formats them (ISO 8601, UTC as "Z").
+    """
+    if fields is None:
+        fields = JobsListSerializer.Meta.fields
+    datetime_fields = [f for f in ("posted_on", "created_on") if f in fields]
+    current_timezone = timezone.get_current_timezone()
+    data = []
+    for row in rows:
+        item = {field: row[field] for field in fields}
+        for field in datetime_fields:
+            value = item[field]
+            if value:
+                value = value.astimezone(current_timezone).isoformat()
+                item[field] = value[:-6] + "Z" if value.endswith("+00:00") else value
+            else:
+                item[field] = None
+        data.append(item)
+    return data
+
+
+class JobsRecommendedSerializer(JobsListSerializer):
+    """
+    List serializer plus the profile match score of a recommended job
+    """
+
+    score = serializers.FloatField(read_only=True)
+
+    class Meta(JobsListSerializer.Meta):
+        fields = JobsListSerializer.Meta.fields + ["score"]
+
+
+class JobsSimilarSerializer(JobsListSerializer):
+    """
+    List serializer plus the similarity of a job to the requested one
+    """
+
+    similarity = serializers.FloatField(read_only=True)
+
+    class Meta(JobsListSerializer.Meta):
+        fields = JobsListSerializer.Meta.fields + ["similarity"]
+
+
+class JobsDetailSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """
     Comprehensive serializer for job detail operations
     """
@@ -54,11 +105,39 @@ class JobsDetailSerializer(serializers.ModelSerializer):
         read_only_fields = ["uid", "created_on", "updated_on"]
 
 
+class JobsIngestSerializer(serializers.ModelSerializer):
+    """
+    Validates one scraped job record for bulk ingestion
+    """
+
+    class Meta:
+        model = Jobs
+        fields = INGEST_COLUMNS
+        # Existing links are upserted rather than rejected
+        extra_kwargs = {"link": {"validators": []}}
+
+
+class JobsBulkIngestSerializer(serializers.Serializer):
+    jobs = serializers.ListField(
+        child=serializers.DictField(),
+        allow_empty=False,
+        max_length=BULK_INGEST_MAX_ITEMS,
+    )
+
+
+class JobsNewLinksSerializer(serializers.Serializer):
+    links = serializers.ListField(
+        child=serializers.URLField(),
+        allow_empty=False,
+        max_length=NEW_LINKS_MAX_ITEMS,
+    )
+
+
 # Alias for backward compatibility
 JobsSerializer = JobsDetailSerializer
 
 
-class JobAssessmentSerializer(serializers.ModelSerializer):
+class JobAssessmentSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     job = JobsDetailSerializer(read_only=True)
     job_uid = serializers.CharField(write_only=True)
 
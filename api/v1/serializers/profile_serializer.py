@@ -1,9 +1,10 @@
 from rest_framework import serializers
 
+from api.v1.serializers.fieldsets import SparseFieldsetMixin
 from apps.profiles.models import Profile
 
 
-class ProfileSerializer(serializers.ModelSerializer):
+class ProfileSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     email = serializers.CharField(source="actor.email", read_only=True)
     username = serializers.CharField(source="actor.username", read_only=True)
 
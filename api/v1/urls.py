@@ -1,18 +1,32 @@
+from django.conf import settings
 from django.urls import include, path
 from rest_framework import routers
 
 from api.v1.api.auth_api import AuthAPI
+from api.v1.api.database_api import DatabaseAPI
+from api.v1.api.extraction_api import ExtractionCacheAPI
 from api.v1.api.jobs_api import JobAssessmentAPI, JobsAPI
+from api.v1.api.jobs_async_api import async_route
 from api.v1.api.profile_api import ProfileAPI
+from api.v1.api.tasks_api import TasksAPI
 
 api_router = routers.DefaultRouter()
 api_router.register(r"auth", AuthAPI, basename="auth")
 api_router.register(r"profile", ProfileAPI, basename="profile")
 api_router.register(r"jobs", JobsAPI, basename="jobs")
 api_router.register(r"job-assessments", JobAssessmentAPI, basename="job-assessments")
+api_router.register(
+    r"extraction-cache", ExtractionCacheAPI, basename="extraction-cache"
+)
+api_router.register(r"tasks", TasksAPI, basename="tasks")
+api_router.register(r"database", DatabaseAPI, basename="database")
+
+router_urls = api_router.urls
+if settings.ASYNC_JOB_VIEWS:
+    router_urls = [async_route(pattern) for pattern in router_urls]
 
 urlpatterns = [
-    path("", include(api_router.urls)),
+    path("", include(router_urls)),
     path(
         "auth/reset-password/<uidb64>/<token>/",
         AuthAPI.as_view({"post": "reset_password"}),
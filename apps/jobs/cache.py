@@ -0,0 +1,171 @@
+import hashlib
+import time
+
+from django.core.cache import caches
+from django.core.paginator import Page, Paginator
+from django.db import connection, transaction
+
+# Cache alias holding rendered job responses (see CACHES in settings)
+JOBS_CACHE = "jobs"
+VERSION_KEY = "jobs:version"
+HITS_KEY = "jobs:hits"
+MISSES_KEY = "jobs:misses"
+
+
+def jobs_cache():
+    return caches[JOBS_CACHE]
+
+
+def get_jobs_version():
+    version = jobs_cache().get(VERSION_KEY)
+    if version is None:
+        # Start from the clock so a lost counter never reuses an old version
+        version = time.time_ns()
+        if not jobs_cache().add(VERSION_KEY, version, timeout=None):
+            version = jobs_cache().get(VERSION_KEY, version)
+    return version
+
+
+async def aget_jobs_version():
+    cache = jobs_cache()
+    version = await cache.aget(VERSION_KEY)
+    if version is None:
+        version = time.time_ns()
+        if not await cache.aadd(VERSION_KEY, version, timeout=None):
+            version = await cache.aget(VERSION_KEY, version)
+    return version
+
+
+def _bump():
+    cache = jobs_cache()
+    try:
+        cache.incr(VERSION_KEY)
+    except ValueError:
+        cache.set(VERSION_KEY, time.time_ns(), timeout=None)
+
+
+def request_jobs_version(request):
+    """The jobs version, read once per request"""
+    if not hasattr(request, "jobs_version"):
+        request.jobs_version = get_jobs_version()
+    return request.jobs_version
+
+
+async def arequest_jobs_version(request):
+    if not hasattr(request, "jobs_version"):
+        request.jobs_version = await aget_jobs_version()
+    return request.jobs_version
+
+
+def bump_jobs_version():
+    """
+    Invalidate every cached job response. Called for any write to Jobs; inside
+    a transaction the version is bumped again on commit so a response cached
+    from the old rows in the meantime is not served afterwards.
+    """
+    _bump()
+    if connection.in_atomic_block:
+        transaction.on_commit(_bump)
+
+
+def query_hash(request):
+    """sha1 of the query string with empty values dropped and keys sorted"""
+    query = sorted(
+        (key, value)
+        for key, values in request.GET.lists()
+        for value in values
+        if value != ""
+    )
+    return hashlib.sha1(repr(query).encode()).hexdigest()
+
+
+def response_cache_key(request, namespace):
+    """
+    Cache key of a response: jobs version, namespace and normalized query
+    string. The version is read once per request, so a response built while
+    a write lands is stored under the version it may already be stale for.
+    """
+    return f"jobs:{request_jobs_version(request)}:{namespace}:{query_hash(request)}"
+
+
+def get_cached_response(request, namespace):
+    """
+    Cached value for an anonymous request, or None. Signed-in users always
+    get fresh responses and do not count towards the hit/miss stats.
+    """
+    if request.user.is_authenticated:
+        return None
+    cache = jobs_cache()
+    value = cache.get(response_cache_key(request, namespace))
+    counter = MISSES_KEY if value is None else HITS_KEY
+    if not cache.add(counter, 1, timeout=None):
+        cache.incr(counter)
+    return value
+
+
+def set_cached_response(request, namespace, value):
+    if not request.user.is_authenticated:
+        jobs_cache().set(response_cache_key(request, namespace), value)
+
+
+async def aget_cached_response(request, namespace, user):
+    """Async get_cached_response() for a request made by `user`"""
+    if user.is_authenticated:
+        return None
+    cache = jobs_cache()
+    await arequest_jobs_version(request)
+    value = await cache.aget(response_cache_key(request, namespace))
+    counter = MISSES_KEY if value is None else HITS_KEY
+    if not await cache.aadd(counter, 1, timeout=None):
+        await cache.aincr(counter)
+    return value
+
+
+async def aset_cached_response(request, namespace, user, value):
+    if not user.is_authenticated:
+        await jobs_cache().aset(response_cache_key(request, namespace), value)
+
+
+def cache_stats():
+    cache = jobs_cache()
+    hits = cache.get(HITS_KEY, 0)
+    misses = cache.get(MISSES_KEY, 0)
+    total = hits + misses
+    return {
+        "hits": hits,
+        "misses": misses,
+        "hit_ratio": round(hits / total, 4) if total else 0.0,
+        "version": get_jobs_version(),
+    }
+
+
+class CachedPaginator(Paginator):
+    """Paginator over one already fetched page, with the total count known"""
+
+    def __init__(self, object_list, count, per_page):
+        super().__init__(object_list, per_page)
+        self.count = count
+
+    def page(self, number):
+        return Page(self.object_list, self.validate_number(number), self)
+
+
+def cached_page(request, namespace, page_size, paginate):
+    """
+    Cache the outcome of ListView.paginate_queryset() as (count, number, rows)
+    and rebuild (paginator, page, object_list, is_paginated) from it.
+    """
+    cached = get_cached_response(request, namespace)
+    if cached is None:
+        paginator, page, object_list, is_paginated = paginate()
+        cached = (paginator.count, page.number, list(object_list))
+        set_cached_response(request, namespace, cached)
+    return cached_page_result(cached, page_size)
+
+
+def cached_page_result(cached, page_size):
+    """(paginator, page, object_list, is_paginated) of a cached (count, number, rows)"""
+    count, number, object_list = cached
+    paginator = CachedPaginator(object_list, count, page_size)
+    page = paginator.page(number)
+    return paginator, page, object_list, paginator.num_pages > 1
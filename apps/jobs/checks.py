@@ -0,0 +1,24 @@
+import os
+
+from django.conf import settings
+from django.core.checks import Warning, register
+
+from .cache import JOBS_CACHE
+
+
+@register()
+def check_jobs_cache_is_shared(app_configs, **kwargs):
+    """The jobs version counter must be seen by every worker process"""
+    backend = settings.CACHES.get(JOBS_CACHE, {}).get("BACKEND", "")
+    workers = int(os.environ.get("WEB_CONCURRENCY", 1))
+    if workers > 1 and backend.endswith("LocMemCache"):
+        return [
+            Warning(
+                f"The {JOBS_CACHE!r} cache is per process but WEB_CONCURRENCY "
+                f"is {workers}: a write in one worker leaves the others "
+                "serving cached job responses until JOBS_CACHE_TIMEOUT.",
+                hint="Set JOBS_CACHE_BACKEND/JOBS_CACHE_LOCATION to a shared cache.",
+                id="jobs.W001",
+            )
+        ]
+    return []
@@ -0,0 +1,70 @@
+import hashlib
+
+from django.conf import settings
+from django.utils.cache import (
+    get_conditional_response,
+    patch_cache_control,
+    patch_vary_headers,
+)
+from django.utils.http import http_date
+
+from .cache import query_hash, request_jobs_version
+
+# Surrogate key shared by every job response, to purge them all at once
+ALL_JOBS_KEY = "jobs"
+
+
+def job_key(uid):
+    """Surrogate key of one job; purging it drops its detail and the lists showing it"""
+    return f"job-{uid}"
+
+
+def job_validators(uid, updated_on):
+    """(ETag, Last-Modified) of a single job"""
+    return f'"{uid}.{int(updated_on.timestamp() * 1_000_000)}"', updated_on
+
+
+def list_validators(request, rows):
+    """
+    (ETag, Last-Modified) of one page of a filtered job list, from the jobs
+    version and the page's own rows, so nothing beyond the page is queried.
+    Writes through Django (deletions included) move the version; rows
+    updated directly in the database change the page's updated_on.
+    """
+    last_modified = max((row["updated_on"] for row in rows), default=None)
+    stamps = ",".join(f"{row['id']}.{row['updated_on'].timestamp()}" for row in rows)
+    digest = hashlib.sha1(
+        f"{query_hash(request)}|{request_jobs_version(request)}|{stamps}".encode()
+    ).hexdigest()
+    return f'"{digest}"', last_modified
+
+
+def not_modified(request, etag, last_modified):
+    """A 304 response when the request's If-None-Match/If-Modified-Since match"""
+    return get_conditional_response(
+        request,
+        etag=etag,
+        last_modified=int(last_modified.timestamp()) if last_modified else None,
+    )
+
+
+def set_validators(response, etag, last_modified, keys=(), public=True):
+    """
+    Add ETag/Last-Modified, Cache-Control and Surrogate-Key headers. Public
+    responses may be kept by a CDN for JOBS_CDN_MAX_AGE and purged by key.
+    """
+    response.headers["ETag"] = etag
+    if last_modified:
+        response.headers["Last-Modified"] = http_date(last_modified.timestamp())
+    if public:
+        patch_cache_control(
+            response,
+            public=True,
+            max_age=settings.JOBS_HTTP_MAX_AGE,
+            s_maxage=settings.JOBS_CDN_MAX_AGE,
+        )
+        patch_vary_headers(response, ["Authorization"])
+        response.headers["Surrogate-Key"] = " ".join([ALL_JOBS_KEY, *keys])
+    else:
+        patch_cache_control(response, private=True, no_cache=True)
+    return response
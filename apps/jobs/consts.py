@@ -1,3 +1,5 @@
+from datetime import timedelta
+
 # Employment type choices
 EMPLOYMENT_TYPE_CHOICES = [
     ("full_time", "Full Time"),
@@ -17,4 +19,78 @@ WORK_LOCATION_CHOICES = [
 SOURCE_PLATFORM_CHOICES = [
     ("weworkremotely.com", "WeWorkRemotely"),
     ("indeed.com", "Indeed"),
-]
\ No newline at end of file
+]
+
+# Postgres text search configuration used for Jobs.search_vector
+JOBS_SEARCH_CONFIG = "english"
+
+# Maximum number of job records accepted by one bulk-ingest call
+BULK_INGEST_MAX_ITEMS = 5000
+
+# Maximum number of candidate links accepted by one new-links check
+NEW_LINKS_MAX_ITEMS = 10000
+
+# Maximum number of descriptions accepted by one extraction cache lookup
+EXTRACTION_LOOKUP_MAX_ITEMS = 1000
+
+# Rows the extraction cache counters are spread over, so concurrent lookups
+# rarely wait on the same row lock
+EXTRACTION_STATS_SHARDS = 16
+
+# Default and maximum number of recommended jobs per request
+RECOMMENDED_JOBS_DEFAULT = 20
+RECOMMENDED_JOBS_MAX = 100
+
+# Default and maximum number of similar jobs per request
+SIMILAR_JOBS_DEFAULT = 5
+SIMILAR_JOBS_MAX = 50
+
+# Fields that can be requested as facets on the jobs list (?facets=...)
+FACET_FIELDS = [
+    "employment_type",
+    "work_location",
+    "job_title_category",
+    "source_platform",
+]
+
+# Fields served by the typeahead endpoint (/api/v1/jobs/suggest/)
+SUGGEST_FIELDS = [
+    "hard_skills",
+    "soft_skills",
+    "company_name",
+    "location",
+    "job_title_category",
+]
+
+# Default and maximum number of completions per suggest request
+SUGGEST_DEFAULT = 10
+SUGGEST_MAX = 50
+
+# Columns of a jobs export (/api/v1/jobs/export/), in output order
+EXPORT_FIELDS = [
+    "uid",
+    "title",
+    "company_name",
+    "location",
+    "employment_type",
+    "work_location",
+    "experience_level",
+    "job_title_category",
+    "hard_skills",
+    "soft_skills",
+    "requirements",
+    "description",
+    "link",
+    "source_platform",
+    "posted_on",
+    "created_on",
+    "updated_on",
+]
+
+# Rows fetched per round trip from the server-side cursor of an export
+EXPORT_CHUNK_SIZE = 2000
+
+# Readers that pick up changed jobs by updated_on re-read this far behind
+# their watermark: updated_on is stamped before commit, so a long transaction
+# can commit rows older than changes another reader has already seen
+CHANGE_WATERMARK_OVERLAP = timedelta(minutes=5)
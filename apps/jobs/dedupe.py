@@ -0,0 +1,207 @@
+import hashlib
+import re
+from collections import defaultdict
+
+import numpy as np
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from rapidfuzz import fuzz
+
+from .cache import bump_jobs_version
+from .models import JobFingerprint, JobLshBucket, Jobs
+
+NUM_PERMUTATIONS = 128
+# 16 bands x 8 rows puts the LSH candidate threshold around 0.7 Jaccard
+LSH_BANDS = 16
+LSH_ROWS = NUM_PERMUTATIONS // LSH_BANDS
+SHINGLE_SIZE = 3
+# Jobs whose duplicate candidates are looked up per query
+DEDUPE_BATCH_SIZE = 1000
+
+MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+MAX_HASH = np.uint64((1 << 32) - 1)
+_rng = np.random.RandomState(1)
+PERM_A = _rng.randint(1, 1 << 32, size=NUM_PERMUTATIONS, dtype=np.uint64)
+PERM_B = _rng.randint(0, 1 << 32, size=NUM_PERMUTATIONS, dtype=np.uint64)
+
+WORD_RE = re.compile(r"\w+")
+
+
+def job_text(title, company_name, description):
+    return " ".join(filter(None, [title, company_name, description])).casefold()
+
+
+def shingle_hashes(text):
+    """32-bit hashes of the word n-gram shingles of a text"""
+    words = WORD_RE.findall(text)
+    if len(words) < SHINGLE_SIZE:
+        words = words + [""] * (SHINGLE_SIZE - len(words))
+    shingles = {
+        " ".join(words[i : i + SHINGLE_SIZE])
+        for i in range(len(words) - SHINGLE_SIZE + 1)
+    }
+    return np.fromiter(
+        (
+            int.from_bytes(hashlib.blake2b(s.encode(), digest_size=4).digest(), "big")
+            for s in shingles
+        ),
+        dtype=np.uint64,
+        count=len(shingles),
+    )
+
+
+def minhash_signature(text):
+    """MinHash signature of a text as a list of NUM_PERMUTATIONS ints"""
+    hashes = shingle_hashes(text)
+    # (a * x + b) mod p for every permutation/shingle pair; a, x < 2**32 so
+    # the product cannot overflow uint64
+    permuted = (np.outer(PERM_A, hashes) + PERM_B[:, None]) % MERSENNE_PRIME
+    return (permuted & MAX_HASH).min(axis=1).astype(np.int64).tolist()
+
+
+def band_buckets(signature):
+    """One bucket id per LSH band; the band index is part of the hash"""
+    buckets = []
+    for band in range(LSH_BANDS):
+        rows = signature[band * LSH_ROWS : (band + 1) * LSH_ROWS]
+        digest = hashlib.blake2b(repr((band, rows)).encode(), digest_size=8).digest()
+        buckets.append(int.from_bytes(digest, "big", signed=True))
+    return buckets
+
+
+def estimated_jaccard(signature_a, signature_b):
+    return float(np.mean(np.array(signature_a) == np.array(signature_b)))
+
+
+def is_duplicate(job, candidate, similarity):
+    """Confirm an LSH candidate on the signature estimate and the visible text"""
+    if similarity < settings.DEDUPE_JACCARD_THRESHOLD:
+        return False
+    headline = job_text(job.title, job.company_name, "")
+    candidate_headline = job_text(candidate.title, candidate.company_name, "")
+    return fuzz.token_set_ratio(headline, candidate_headline) >= (
+        settings.DEDUPE_TITLE_SIMILARITY
+    )
+
+
+def store_signatures(signatures):
+    """Persist {job_id: signature} and replace the jobs' LSH buckets"""
+    with transaction.atomic():
+        JobFingerprint.objects.bulk_create(
+            [
+                JobFingerprint(job_id=job_id, signature=signature)
+                for job_id, signature in signatures.items()
+            ],
+            update_conflicts=True,
+            unique_fields=["job"],
+            update_fields=["signature"],
+        )
+        JobLshBucket.objects.filter(job_id__in=signatures.keys()).delete()
+        JobLshBucket.objects.bulk_create(
+            [
+                JobLshBucket(job_id=job_id, bucket=bucket)
+                for job_id, signature in signatures.items()
+                for bucket in band_buckets(signature)
+            ]
+        )
+
+
+def find_candidates(jobs, signatures):
+    """
+    {job id: candidate Jobs} for many jobs from two queries: one over the
+    LSH buckets of all their signatures, one loading the candidates. Only
+    older jobs (lower id) are candidates, so the earliest posting of a
+    cluster is its canonical one.
+    """
+    job_buckets = {job.id: band_buckets(signatures[job.id]) for job in jobs}
+    bucket_jobs = defaultdict(set)
+    rows = JobLshBucket.objects.filter(
+        bucket__in={bucket for buckets in job_buckets.values() for bucket in buckets},
+        job_id__lt=max(job_buckets),
+    ).values_list("bucket", "job_id")
+    for bucket, job_id in rows:
+        bucket_jobs[bucket].add(job_id)
+    candidate_ids = {
+        job_id: {
+            candidate_id
+            for bucket in buckets
+            for candidate_id in bucket_jobs[bucket]
+            if candidate_id < job_id
+        }
+        for job_id, buckets in job_buckets.items()
+    }
+    candidates = (
+        Jobs.objects.filter(id__in=set().union(*candidate_ids.values()))
+        .only("id", "title", "company_name", "canonical_id", "fingerprint__signature")
+        .select_related("fingerprint")
+        .in_bulk()
+    )
+    return {
+        job_id: [candidates[i] for i in sorted(ids) if i in candidates]
+        for job_id, ids in candidate_ids.items()
+    }
+
+
+def find_canonical(job, signature, candidates, canonical_ids):
+    """
+    Return the canonical job id for `job` among its LSH `candidates`, or
+    None if it is an original. `canonical_ids` holds canonical ids already
+    resolved in this run, which take precedence over the loaded ones.
+    """
+    best, best_similarity = None, 0.0
+    for candidate in candidates:
+        similarity = estimated_jaccard(signature, candidate.fingerprint.signature)
+        if similarity > best_similarity and is_duplicate(job, candidate, similarity):
+            best, best_similarity = candidate, similarity
+    if best is None:
+        return None
+    return canonical_ids.get(best.id, best.canonical_id) or best.id
+
+
+def chunk_signatures(rows):
+    """{id: signature} for (id, title, company_name, description) rows"""
+    return {
+        job_id: minhash_signature(job_text(title, company_name, description))
+        for job_id, title, company_name, description in rows
+    }
+
+
+def index_jobs(jobs):
+    """
+    Compute signatures for `jobs`, store their LSH buckets and link each
+    near-duplicate to its canonical job. Jobs are resolved in id order.
+    """
+    jobs = sorted(jobs, key=lambda job: job.id)
+    signatures = chunk_signatures(
+        (job.id, job.title, job.company_name, job.description) for job in jobs
+    )
+    store_signatures(signatures)
+    link_duplicates(jobs, signatures)
+
+
+def link_duplicates(jobs, signatures):
+    """
+    Point each job at its canonical posting; jobs must be sorted by id.
+    Candidates are looked up DEDUPE_BATCH_SIZE jobs at a time and changed
+    links are written with one bulk UPDATE.
+    """
+    canonical_ids, changed = {}, []
+    now = timezone.now()
+    for start in range(0, len(jobs), DEDUPE_BATCH_SIZE):
+        batch = jobs[start : start + DEDUPE_BATCH_SIZE]
+        candidates = find_candidates(batch, signatures)
+        for job in batch:
+            canonical_id = find_canonical(
+                job, signatures[job.id], candidates[job.id], canonical_ids
+            )
+            canonical_ids[job.id] = canonical_id
+            if canonical_id != job.canonical_id:
+                job.canonical_id = canonical_id
+                job.updated_on = now
+                changed.append(job)
+    if changed:
+        Jobs.objects.bulk_update(
+            changed, ["canonical_id", "updated_on"], batch_size=DEDUPE_BATCH_SIZE
+        )
+        bump_jobs_version()
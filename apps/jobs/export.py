@@ -0,0 +1,90 @@
+import csv
+from itertools import islice
+
+import orjson
+from django.utils.text import compress_sequence
+
+from .consts import EXPORT_CHUNK_SIZE
+
+EXPORT_FORMATS = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+# Separator of array values (skills, requirements) inside one CSV cell
+CSV_LIST_SEPARATOR = "; "
+NDJSON_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NAIVE_UTC
+
+
+class Echo:
+    """File-like object whose write() returns the value, for csv.writer"""
+
+    def write(self, value):
+        return value
+
+
+def export_rows(queryset, fields, chunk_size=EXPORT_CHUNK_SIZE):
+    """
+    Rows of `queryset` as dicts of `fields`, read through a server-side cursor
+    `chunk_size` rows at a time so memory stays flat however many rows match.
+    """
+    return queryset.values(*fields).iterator(chunk_size=chunk_size)
+
+
+def ndjson_lines(rows, fields):
+    for row in rows:
+        yield orjson.dumps(row, option=NDJSON_OPTIONS) + b"\n"
+
+
+def csv_cell(value):
+    if value is None:
+        return ""
+    if isinstance(value, list):
+        return CSV_LIST_SEPARATOR.join(str(item) for item in value)
+    if hasattr(value, "isoformat"):
+        value = value.isoformat()
+        return value[:-6] + "Z" if value.endswith("+00:00") else value
+    return value
+
+
+def csv_lines(rows, fields):
+    writer = csv.writer(Echo())
+    yield writer.writerow(fields).encode()
+    for row in rows:
+        yield writer.writerow([csv_cell(row[field]) for field in fields]).encode()
+
+
+def batched(lines, size):
+    """Join lines into chunks of `size` so each write to the client is sizeable"""
+    lines = iter(lines)
+    while batch := b"".join(islice(lines, size)):
+        yield batch
+
+
+def accepts_gzip(accept_encoding):
+    """
+    Whether an Accept-Encoding header allows gzip: listed (or covered by "*")
+    with a non-zero q-value. An explicit gzip entry overrides "*".
+    """
+    qualities = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.partition(";")
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[coding.strip().lower()] = quality
+    for coding in ("gzip", "x-gzip", "*"):
+        if coding in qualities:
+            return qualities[coding] > 0
+    return False
+
+
+def export_stream(queryset, fields, export_format, gzip=False):
+    """Iterator of byte chunks of `queryset` as NDJSON or CSV, optionally gzipped"""
+    lines = {"ndjson": ndjson_lines, "csv": csv_lines}[export_format]
+    chunks = batched(lines(export_rows(queryset, fields), fields), EXPORT_CHUNK_SIZE)
+    return compress_sequence(chunks) if gzip else chunks
@@ -0,0 +1,211 @@
+import hashlib
+import html
+import random
+import re
+from abc import ABC, abstractmethod
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import F, Sum
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from .consts import EXTRACTION_STATS_SHARDS
+from .models import JobExtraction, JobExtractionStats
+
+# Fields produced by the LLM "Information Extractor" step that are cached
+EXTRACTED_FIELDS = [
+    "hard_skills",
+    "soft_skills",
+    "experience_level",
+    "location",
+    "employment_type",
+    "work_location",
+    "company_name",
+    "requirements",
+]
+
+TAG_RE = re.compile(r"<[^>]+>")
+WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_description(description):
+    """Strip markup, case and whitespace differences so light edits share a key"""
+    text = TAG_RE.sub(" ", html.unescape(description or ""))
+    return WHITESPACE_RE.sub(" ", text).strip().casefold()
+
+
+def make_description_hash(description):
+    return hashlib.sha256(
+        normalize_description(description).encode("utf-8")
+    ).hexdigest()
+
+
+class BaseExtractor(ABC):
+    """Turns a job posting into EXTRACTED_FIELDS; plug one in via JOBS_EXTRACTOR"""
+
+    @abstractmethod
+    def extract(self, title, description):
+        """Return a dict of EXTRACTED_FIELDS for one posting"""
+
+
+class FakeExtractor(BaseExtractor):
+    """
+    Deterministic keyword extractor for local development and tests, so the
+    caching path can be exercised without calling a model.
+    """
+
+    HARD_SKILLS = [
+        "Python",
+        "Django",
+        "JavaScript",
+        "TypeScript",
+        "React",
+        "Flutter",
+        "Go",
+        "Java",
+        "SQL",
+        "PostgreSQL",
+        "Docker",
+        "Kubernetes",
+        "AWS",
+        "Figma",
+    ]
+    SOFT_SKILLS = ["Communication", "Teamwork", "Leadership", "Problem Solving"]
+    EXPERIENCE_RE = re.compile(r"(\d+\+?)\s*years?", re.IGNORECASE)
+
+    def extract(self, title, description):
+        text = f"{title or ''} {normalize_description(description)}".casefold()
+        words = set(re.findall(r"[a-z0-9+#.]+", text))
+
+        def mentioned(skill):
+            skill = skill.casefold()
+            return skill in words if " " not in skill else skill in text
+
+        experience = self.EXPERIENCE_RE.search(text)
+        if "intern" in text:
+            employment_type = "internship"
+        elif "part-time" in text or "part time" in text:
+            employment_type = "part_time"
+        elif "contract" in text:
+            employment_type = "contract"
+        else:
+            employment_type = "full_time"
+        if "hybrid" in text:
+            work_location = "hybrid"
+        elif "on-site" in text or "onsite" in text:
+            work_location = "onsite"
+        else:
+            work_location = "remote"
+
+        return {
+            "hard_skills": [s for s in self.HARD_SKILLS if mentioned(s)],
+            "soft_skills": [s for s in self.SOFT_SKILLS if mentioned(s)],
+            "experience_level": f"{experience.group(1)} years" if experience else None,
+            "location": None,
+            "employment_type": employment_type,
+            "work_location": work_location,
+            "company_name": None,
+            "requirements": [],
+        }
+
+
+def get_extractor():
+    """Return the configured extractor, or None when extraction stays in n8n"""
+    if not settings.JOBS_EXTRACTOR:
+        return None
+    return import_string(settings.JOBS_EXTRACTOR)()
+
+
+def record_stats(hits=0, misses=0, evictions=0):
+    """Add to the counters of one random shard row in a single upsert"""
+    if not (hits or misses or evictions):
+        return
+    table = JobExtractionStats._meta.db_table
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"INSERT INTO {table} (id, hits, misses, evictions) "
+            "VALUES (%s, %s, %s, %s) ON CONFLICT (id) DO UPDATE SET "
+            f"hits = {table}.hits + EXCLUDED.hits, "
+            f"misses = {table}.misses + EXCLUDED.misses, "
+            f"evictions = {table}.evictions + EXCLUDED.evictions",
+            [random.randint(1, EXTRACTION_STATS_SHARDS), hits, misses, evictions],
+        )
+
+
+def extraction_stats():
+    """Hit/miss/eviction counters summed over the shard rows"""
+    totals = JobExtractionStats.objects.aggregate(
+        hits=Sum("hits"), misses=Sum("misses"), evictions=Sum("evictions")
+    )
+    return {key: value or 0 for key, value in totals.items()}
+
+
+def lookup_extractions(descriptions):
+    """
+    Look up cached extraction results for many descriptions at once.
+
+    Returns one (description_hash, fields or None) pair per description, in
+    order. Entries older than EXTRACTION_CACHE_TTL_DAYS count as misses.
+    """
+    hashes = [make_description_hash(d) for d in descriptions]
+    now = timezone.now()
+    fresh_after = now - timedelta(days=settings.EXTRACTION_CACHE_TTL_DAYS)
+    cached = dict(
+        JobExtraction.objects.filter(
+            description_hash__in=set(hashes), created_on__gte=fresh_after
+        ).values_list("description_hash", "fields")
+    )
+    if cached:
+        JobExtraction.objects.filter(description_hash__in=cached.keys()).update(
+            hit_count=F("hit_count") + 1, last_used_on=now
+        )
+    hits = sum(1 for h in hashes if h in cached)
+    record_stats(hits=hits, misses=len(hashes) - hits)
+    return [(h, cached.get(h)) for h in hashes]
+
+
+def store_extraction(description, fields):
+    fields = {key: fields.get(key) for key in EXTRACTED_FIELDS if key in fields}
+    entry, _ = JobExtraction.objects.update_or_create(
+        description_hash=make_description_hash(description),
+        defaults={
+            "fields": fields,
+            "created_on": timezone.now(),
+            "last_used_on": timezone.now(),
+        },
+    )
+    return entry
+
+
+def extract_job_fields(title, description, extractor=None):
+    """
+    Return (fields, cached) for a posting, running the extractor only on a
+    cache miss. fields is None when missed and no extractor is configured.
+    """
+    ((_, fields),) = lookup_extractions([description])
+    if fields is not None:
+        return fields, True
+    extractor = extractor or get_extractor()
+    if extractor is None:
+        return None, False
+    entry = store_extraction(description, extractor.extract(title, description))
+    return entry.fields, False
+
+
+def evict_extractions():
+    """Drop expired entries, then least recently used ones above the size cap"""
+    fresh_after = timezone.now() - timedelta(days=settings.EXTRACTION_CACHE_TTL_DAYS)
+    with transaction.atomic():
+        evicted, _ = JobExtraction.objects.filter(created_on__lt=fresh_after).delete()
+        overflow = list(
+            JobExtraction.objects.order_by("-last_used_on").values_list(
+                "id", flat=True
+            )[settings.EXTRACTION_CACHE_MAX_ENTRIES :]
+        )
+        if overflow:
+            dropped, _ = JobExtraction.objects.filter(id__in=overflow).delete()
+            evicted += dropped
+        record_stats(evictions=evicted)
+    return evicted
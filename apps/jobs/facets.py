@@ -0,0 +1,39 @@
+from django.db import connection
+
+
+def facet_counts(queryset, fields, count_field=None):
+    """
+    Count rows per distinct value of each field in one GROUPING SETS query.
+
+    Returns {field: [{"value": ..., "count": ...}, ...]} with the largest
+    counts first. `count_field` sums a pre-aggregated count column (e.g. a
+    rollup table) instead of counting rows.
+    """
+    columns = [*fields, count_field] if count_field else list(fields)
+    inner_sql, params = queryset.order_by().values(*columns).query.sql_with_params()
+    quoted = [connection.ops.quote_name(field) for field in fields]
+    aggregate = (
+        f"SUM({connection.ops.quote_name(count_field)})" if count_field else "COUNT(*)"
+    )
+    # GROUPING(col) = 0 marks the grouping set a row belongs to, which keeps
+    # genuine NULL values apart from the NULLs of the other sets
+    sql = (
+        f"SELECT {', '.join(quoted)}, "
+        f"{', '.join(f'GROUPING({column})' for column in quoted)}, {aggregate} "
+        f"FROM ({inner_sql}) AS facet_rows "
+        f"GROUP BY GROUPING SETS ({', '.join(f'({column})' for column in quoted)})"
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        rows = cursor.fetchall()
+
+    facets = {field: [] for field in fields}
+    size = len(fields)
+    for row in rows:
+        values, grouping, count = row[:size], row[size:-1], row[-1]
+        index = grouping.index(0)
+        if count:
+            facets[fields[index]].append({"value": values[index], "count": int(count)})
+    for buckets in facets.values():
+        buckets.sort(key=lambda bucket: (-bucket["count"], str(bucket["value"])))
+    return facets
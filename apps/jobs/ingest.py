@@ -0,0 +1,122 @@
+from django.db import connection, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from core.models import make_object_id
+
+from .cache import bump_jobs_version
+from .links import make_link_hash
+from .models import Jobs
+
+# Columns written from an ingested record; the ones a record provides, except
+# link, are refreshed when a record with a known link changes
+INGEST_COLUMNS = [
+    "title",
+    "description",
+    "link",
+    "hard_skills",
+    "soft_skills",
+    "experience_level",
+    "location",
+    "employment_type",
+    "work_location",
+    "job_title_category",
+    "posted_on",
+    "requirements",
+    "company_name",
+    "source_platform",
+]
+UPDATE_COLUMNS = [column for column in INGEST_COLUMNS if column != "link"]
+
+# Rows per INSERT statement
+UPSERT_BATCH_SIZE = 500
+
+
+def build_upsert_sql(row_count, update_columns=UPDATE_COLUMNS):
+    """
+    Multi-row upsert. Only `update_columns` are overwritten on conflict, so
+    fields a record leaves out keep their stored value instead of being
+    reset to the model default.
+    """
+    columns = [
+        "uid",
+        "created_on",
+        "updated_on",
+        "actor_id",
+        *INGEST_COLUMNS,
+    ]
+    row = "(" + ", ".join(["%s"] * len(columns)) + ")"
+    insert = f"INSERT INTO jobs_jobs ({', '.join(columns)}) VALUES " + ", ".join(
+        [row] * row_count
+    )
+    returning = "RETURNING link, uid, (xmax = 0) AS inserted"
+    if not update_columns:
+        return f"{insert} ON CONFLICT (link) DO NOTHING {returning}"
+    assignments = ", ".join(f"{c} = EXCLUDED.{c}" for c in update_columns)
+    current = ", ".join(f"jobs_jobs.{c}" for c in update_columns)
+    incoming = ", ".join(f"EXCLUDED.{c}" for c in update_columns)
+    # Unchanged rows are not touched and therefore not returned; xmax = 0
+    # tells a fresh insert apart from an update of an existing row. ROW()
+    # keeps a single column a row constructor.
+    return (
+        f"{insert} ON CONFLICT (link) DO UPDATE SET {assignments}, "
+        "updated_on = EXCLUDED.updated_on "
+        f"WHERE ROW({current}) IS DISTINCT FROM ROW({incoming}) {returning}"
+    )
+
+
+def find_new_links(links):
+    """
+    Return the links (in input order) whose normalized form is not stored yet.
+    Variants of one posting within the input are reported once. Links that
+    cannot be normalized (and so have no hash) only match themselves.
+    """
+    hashes = {link: make_link_hash(link) or link for link in links}
+    stored = Jobs.objects.filter(
+        Q(link_hash__in=set(hashes.values())) | Q(link__in=links)
+    ).values_list("link", "link_hash")
+    seen = {link_hash or link for link, link_hash in stored}
+
+    new_links = []
+    for link in links:
+        if hashes[link] not in seen:
+            seen.add(hashes[link])
+            new_links.append(link)
+    return new_links
+
+
+def upsert_jobs(records, actor=None):
+    """
+    Insert or update validated job records keyed on their unique link.
+
+    Returns {link: (uid, status)} with status "inserted" or "updated"; links
+    whose stored row already matched the record are left out.
+    """
+    now = timezone.now()
+    defaults = {
+        column: Jobs._meta.get_field(column).get_default() for column in INGEST_COLUMNS
+    }
+    actor_id = actor.pk if actor is not None else None
+    results = {}
+    with transaction.atomic(), connection.cursor() as cursor:
+        for start in range(0, len(records), UPSERT_BATCH_SIZE):
+            # One statement per set of provided columns; scrapers normally
+            # send the same keys for every record, so this is one per batch
+            groups = {}
+            for record in records[start : start + UPSERT_BATCH_SIZE]:
+                provided = tuple(c for c in UPDATE_COLUMNS if c in record)
+                groups.setdefault(provided, []).append(record)
+            for update_columns, batch in groups.items():
+                params = []
+                for record in batch:
+                    params += [make_object_id(), now, now, actor_id]
+                    params += [
+                        record.get(column, defaults[column])
+                        for column in INGEST_COLUMNS
+                    ]
+                cursor.execute(build_upsert_sql(len(batch), update_columns), params)
+                for link, uid, inserted in cursor.fetchall():
+                    results[link] = (uid, "inserted" if inserted else "updated")
+        if results:
+            bump_jobs_version()
+    return results
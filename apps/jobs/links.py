@@ -0,0 +1,50 @@
+import hashlib
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+# Query parameters that only track where a click came from
+TRACKING_PARAMS = {"fbclid", "gclid", "mc_cid", "mc_eid", "ref", "referrer", "from"}
+TRACKING_PREFIXES = ("utm_",)
+
+
+def normalize_link(link):
+    """
+    Reduce a job link to a canonical form so variants of the same posting
+    compare equal: scheme, "www.", fragments, tracking parameters, parameter
+    order and trailing slashes are ignored, and every Indeed URL carrying a
+    job key (jk/vjk) collapses to indeed.com/viewjob?jk=<key>. Raises
+    ValueError for links it cannot parse, including query parameters whose
+    escapes do not decode to UTF-8 text without NUL characters.
+
+    The jobs_normalize_link() SQL function (migration 0020) does the same in
+    the database and must be kept in step with it.
+    """
+    parts = urlsplit(link.strip())
+    host = (parts.hostname or "").lower().removeprefix("www.")
+    params = parse_qsl(parts.query, keep_blank_values=True, errors="strict")
+    # Postgres text cannot hold NUL, so jobs_normalize_link() rejects it too
+    if any("\x00" in key + value for key, value in params):
+        raise ValueError(f"NUL character in the query of {link!r}")
+
+    if host == "indeed.com" or host.endswith(".indeed.com"):
+        job_key = dict(params).get("jk") or dict(params).get("vjk")
+        if job_key:
+            return f"indeed.com/viewjob?jk={job_key}"
+
+    params = sorted(
+        (key, value)
+        for key, value in params
+        if key.lower() not in TRACKING_PARAMS
+        and not key.lower().startswith(TRACKING_PREFIXES)
+    )
+    path = parts.path.rstrip("/")
+    query = urlencode(params)
+    return f"{host}{path}?{query}" if query else f"{host}{path}"
+
+
+def make_link_hash(link):
+    """sha256 of the normalized link, or None if it cannot be normalized"""
+    try:
+        normalized = normalize_link(link)
+    except ValueError:
+        return None
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
@@ -0,0 +1,68 @@
+from concurrent.futures import ProcessPoolExecutor
+
+from django.core.management.base import BaseCommand
+
+from apps.jobs.dedupe import chunk_signatures, link_duplicates, store_signatures
+from apps.jobs.models import Jobs
+
+
+class Command(BaseCommand):
+    help = (
+        "Compute MinHash signatures for existing jobs and link near-duplicates "
+        "to their canonical posting"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--chunk-size", type=int, default=1000)
+        parser.add_argument(
+            "--workers", type=int, default=4, help="Processes computing signatures"
+        )
+        parser.add_argument(
+            "--missing-only",
+            action="store_true",
+            help="Only index jobs without a signature (e.g. inserted by n8n)",
+        )
+
+    def handle(self, *args, **options):
+        queryset = Jobs.objects.order_by("id")
+        if options["missing_only"]:
+            queryset = queryset.filter(fingerprint__isnull=True)
+
+        indexed = 0
+        with ProcessPoolExecutor(max_workers=options["workers"]) as executor:
+            window = []
+            for chunk in self.chunks(queryset, options["chunk_size"]):
+                window.append(chunk)
+                if len(window) == options["workers"]:
+                    indexed += self.index_window(executor, window)
+                    window = []
+            if window:
+                indexed += self.index_window(executor, window)
+
+        self.stdout.write(self.style.SUCCESS(f"Indexed {indexed} jobs"))
+
+    def chunks(self, queryset, chunk_size):
+        last_id = 0
+        while True:
+            rows = list(
+                queryset.filter(id__gt=last_id).values_list(
+                    "id", "title", "company_name", "description"
+                )[:chunk_size]
+            )
+            if not rows:
+                return
+            last_id = rows[-1][0]
+            yield rows
+
+    def index_window(self, executor, window):
+        """Sign chunks in parallel, then store and link them in id order"""
+        indexed = 0
+        for rows, signatures in zip(window, executor.map(chunk_signatures, window)):
+            store_signatures(signatures)
+            jobs = Jobs.objects.filter(id__in=signatures.keys()).only(
+                "id", "title", "company_name", "canonical_id"
+            )
+            link_duplicates(sorted(jobs, key=lambda job: job.id), signatures)
+            indexed += len(rows)
+            self.stdout.write(f"Indexed up to job id {rows[-1][0]}")
+        return indexed
@@ -0,0 +1,138 @@
+import asyncio
+import itertools
+import statistics
+import time
+from urllib.parse import urlsplit
+
+from django.core.management.base import BaseCommand, CommandError
+
+DEFAULT_PATHS = [
+    "/api/v1/jobs/",
+    "/api/v1/jobs/?page=2&page_size=50",
+    "/api/v1/jobs/?work_location=remote",
+    "/api/v1/jobs/?search=engineer",
+    "/jobs/",
+    "/jobs/?page=3",
+]
+
+
+async def read_response(reader):
+    """
+    (status, keep_alive) of one HTTP/1.1 response, reading its body to the end
+    """
+    head = await reader.readuntil(b"\r\n\r\n")
+    lines = head.decode("latin-1").split("\r\n")
+    status = int(lines[0].split()[1])
+    headers = {}
+    for line in lines[1:]:
+        if ":" in line:
+            name, value = line.split(":", 1)
+            headers[name.strip().lower()] = value.strip()
+    if headers.get("transfer-encoding") == "chunked":
+        while True:
+            size = int((await reader.readuntil(b"\r\n")).split(b";")[0], 16)
+            await reader.readexactly(size + 2)
+            if size == 0:
+                break
+    else:
+        await reader.readexactly(int(headers.get("content-length", 0)))
+    return status, headers.get("connection", "").lower() != "close"
+
+
+async def client(host, port, paths, deadline, latencies, errors):
+    """
+    One client sending requests back to back until `deadline`, over a
+    keep-alive connection unless the server closes it (e.g. gunicorn's sync
+    workers), in which case the reconnect is part of the request's latency
+    """
+    writer = None
+    try:
+        for path in paths:
+            if time.monotonic() >= deadline:
+                break
+            start = time.perf_counter()
+            if writer is None:
+                reader, writer = await asyncio.open_connection(host, port)
+            writer.write(
+                f"GET {path} HTTP/1.1\r\nHost: {host}\r\n"
+                "Accept: application/json\r\n\r\n".encode()
+            )
+            await writer.drain()
+            status, keep_alive = await read_response(reader)
+            latencies.append(time.perf_counter() - start)
+            if status >= 400:
+                errors.append(status)
+            if not keep_alive:
+                writer.close()
+                writer = None
+    finally:
+        if writer is not None:
+            writer.close()
+
+
+async def load(url, paths, concurrency, duration):
+    parts = urlsplit(url)
+    latencies, errors = [], []
+    deadline = time.monotonic() + duration
+    start = time.perf_counter()
+    await asyncio.gather(
+        *(
+            client(
+                parts.hostname,
+                parts.port or 80,
+                # Each connection starts at a different path of the mix
+                itertools.islice(itertools.cycle(paths), i, None),
+                deadline,
+                latencies,
+                errors,
+            )
+            for i in range(concurrency)
+        )
+    )
+    return latencies, errors, time.perf_counter() - start
+
+
+class Command(BaseCommand):
+    help = (
+        "Load a running server (WSGI or ASGI) with concurrent keep-alive "
+        "clients over a mix of job list URLs; reports requests/sec "
+        "and latency percentiles"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("url", help="Server base URL, e.g. http://127.0.0.1:8000")
+        parser.add_argument(
+            "--path",
+            action="append",
+            dest="paths",
+            help="Path to request (repeatable); defaults to a list/page mix",
+        )
+        parser.add_argument("--concurrency", type=int, default=32)
+        parser.add_argument("--duration", type=float, default=20.0)
+        parser.add_argument(
+            "--warmup", type=float, default=3.0, help="Seconds of unmeasured load"
+        )
+
+    def handle(self, *args, **options):
+        paths = options["paths"] or DEFAULT_PATHS
+        url, concurrency = options["url"], options["concurrency"]
+        if options["warmup"]:
+            asyncio.run(load(url, paths, concurrency, options["warmup"]))
+        latencies, errors, elapsed = asyncio.run(
+            load(url, paths, concurrency, options["duration"])
+        )
+        if not latencies:
+            raise CommandError("No responses received")
+
+        cuts = statistics.quantiles(latencies, n=100, method="inclusive")
+        self.stdout.write(
+            f"{len(latencies)} requests in {elapsed:.1f}s, "
+            f"{concurrency} connections, {len(errors)} errors"
+        )
+        self.stdout.write(
+            f"latency ms: p50 {cuts[49] * 1000:.1f}  p90 {cuts[89] * 1000:.1f}  "
+            f"p99 {cuts[98] * 1000:.1f}  max {max(latencies) * 1000:.1f}"
+        )
+        self.stdout.write(
+            self.style.SUCCESS(f"{len(latencies) / elapsed:.1f} requests/sec")
+        )
@@ -0,0 +1,55 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.renderers import JSONRenderer
+
+from api.v1.renderers import ORJSONRenderer
+from api.v1.serializers.jobs_serializer import (
+    JobsListSerializer,
+    serialize_job_list_rows,
+)
+from apps.jobs.models import Jobs
+
+
+class Command(BaseCommand):
+    help = (
+        "Time one jobs list page through JobsListSerializer + JSONRenderer "
+        "against the values() + ORJSONRenderer fast path"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--page-size", type=int, default=100)
+        parser.add_argument("--iterations", type=int, default=200)
+
+    def handle(self, *args, **options):
+        page_size = options["page_size"]
+        iterations = options["iterations"]
+        queryset = Jobs.objects.defer("search_vector").order_by("-created_on")
+        if not queryset.exists():
+            raise CommandError("No jobs to benchmark; ingest some first")
+
+        def model_path():
+            page = list(queryset[:page_size])
+            return JSONRenderer().render(JobsListSerializer(page, many=True).data)
+
+        def fast_path():
+            rows = queryset.values("id", *JobsListSerializer.Meta.fields)
+            return ORJSONRenderer().render(serialize_job_list_rows(rows[:page_size]))
+
+        if model_path() != fast_path():
+            raise CommandError("Fast path output differs from JobsListSerializer")
+
+        timings = {}
+        for name, render in (("serializer", model_path), ("fast path", fast_path)):
+            start = time.perf_counter()
+            for _ in range(iterations):
+                render()
+            timings[name] = (time.perf_counter() - start) / iterations * 1000
+            self.stdout.write(f"{name:>10}: {timings[name]:.3f} ms per page")
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{timings['serializer'] / timings['fast path']:.1f}x faster "
+                f"({page_size} jobs per page, identical output)"
+            )
+        )
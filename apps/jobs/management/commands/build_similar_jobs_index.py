@@ -0,0 +1,21 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from apps.jobs.similar import build_index
+
+
+class Command(BaseCommand):
+    help = "Build the TF-IDF index behind the similar jobs endpoint"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--output",
+            default=settings.SIMILAR_JOBS_INDEX_DIR,
+            help="Directory for the index .npz file (default: SIMILAR_JOBS_INDEX_DIR)",
+        )
+
+    def handle(self, *args, **options):
+        indexed = build_index(options["output"])
+        self.stdout.write(
+            self.style.SUCCESS(f"Indexed {indexed} jobs into {options['output']}")
+        )
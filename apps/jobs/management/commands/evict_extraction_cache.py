@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from apps.jobs.extraction import evict_extractions
+
+
+class Command(BaseCommand):
+    help = "Evict expired and least recently used job extraction cache entries"
+
+    def handle(self, *args, **options):
+        evicted = evict_extractions()
+        self.stdout.write(self.style.SUCCESS(f"Evicted {evicted} cache entries"))
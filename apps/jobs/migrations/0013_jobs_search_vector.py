@@ -0,0 +1,61 @@
+# Generated by Django 5.2.1 on 2026-10-18 09:12
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+SEARCH_VECTOR_TRIGGER_SQL = """
+CREATE OR REPLACE FUNCTION jobs_jobs_search_vector_update() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector :=
+        setweight(to_tsvector('english', coalesce(NEW.title, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(NEW.company_name, '')), 'B') ||
+        setweight(to_tsvector('english', coalesce(NEW.job_title_category, '')), 'B') ||
+        setweight(to_tsvector('english', coalesce(NEW.location, '')), 'C') ||
+        setweight(to_tsvector('english', coalesce(array_to_string(NEW.hard_skills, ' '), '')), 'C') ||
+        setweight(to_tsvector('english', coalesce(array_to_string(NEW.soft_skills, ' '), '')), 'C') ||
+        setweight(to_tsvector('english', coalesce(NEW.description, '')), 'D');
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER jobs_jobs_search_vector
+BEFORE INSERT OR UPDATE OF
+    title, company_name, job_title_category, location, hard_skills, soft_skills,
+    description
+ON jobs_jobs
+FOR EACH ROW EXECUTE FUNCTION jobs_jobs_search_vector_update();
+
+UPDATE jobs_jobs SET title = title;
+"""
+
+DROP_SEARCH_VECTOR_TRIGGER_SQL = """
+DROP TRIGGER IF EXISTS jobs_jobs_search_vector ON jobs_jobs;
+DROP FUNCTION IF EXISTS jobs_jobs_search_vector_update();
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("jobs", "0012_alter_jobs_source_platform"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="jobs",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False, null=True
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="jobs",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="jobs_search_vector_gin"
+            ),
+        ),
+        migrations.RunSQL(
+            SEARCH_VECTOR_TRIGGER_SQL, reverse_sql=DROP_SEARCH_VECTOR_TRIGGER_SQL
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.1 on 2026-10-18 01:00
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("jobs", "0013_jobs_search_vector"),
+        ("profiles", "0003_profile_hard_skill_gaps_profile_soft_skill_gaps"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="jobassessment",
+            index=models.Index(
+                fields=["profile", "created_on", "id"],
+                name="jobs_assess_profile_keyset_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="jobs",
+            index=models.Index(
+                fields=["created_on", "id"], name="jobs_created_on_id_idx"
+            ),
+        ),
+    ]
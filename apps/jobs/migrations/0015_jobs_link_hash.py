@@ -0,0 +1,21 @@
+# Generated by Django 5.2.1 on 2026-10-18 01:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("jobs", "0014_keyset_pagination_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="jobs",
+            name="link_hash",
+            field=models.CharField(
+                blank=True, db_index=True, editable=False, max_length=40, null=True
+            ),
+        ),
+        # Filled in by the trigger added in 0020_jobs_link_hash_trigger
+    ]
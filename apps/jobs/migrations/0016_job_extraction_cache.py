@@ -0,0 +1,55 @@
+# Generated by Django 5.2.1 on 2026-10-18 01:03
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("jobs", "0015_jobs_link_hash"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="JobExtraction",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("description_hash", models.CharField(max_length=64, unique=True)),
+                ("fields", models.JSONField(default=dict)),
+                ("hit_count", models.IntegerField(default=0)),
+                ("created_on", models.DateTimeField(default=django.utils.timezone.now)),
+                (
+                    "last_used_on",
+                    models.DateTimeField(
+                        db_index=True, default=django.utils.timezone.now
+                    ),
+                ),
+            ],
+        ),
+        migrations.CreateModel(
+            name="JobExtractionStats",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("hits", models.BigIntegerField(default=0)),
+                ("misses", models.BigIntegerField(default=0)),
+                ("evictions", models.BigIntegerField(default=0)),
+            ],
+        ),
+    ]
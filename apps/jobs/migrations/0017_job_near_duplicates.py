@@ -0,0 +1,81 @@
+# Generated by Django 5.2.1 on 2026-10-18 01:05
+
+import django.contrib.postgres.fields
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("jobs", "0016_job_extraction_cache"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="JobFingerprint",
+            fields=[
+                (
+                    "job",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="fingerprint",
+                        serialize=False,
+                        to="jobs.jobs",
+                    ),
+                ),
+                (
+                    "signature",
+                    django.contrib.postgres.fields.ArrayField(
+                        base_field=models.BigIntegerField(), size=None
+                    ),
+                ),
+            ],
+        ),
+        migrations.CreateModel(
+            name="JobLshBucket",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("bucket", models.BigIntegerField(db_index=True)),
+            ],
+        ),
+        migrations.AddField(
+            model_name="jobs",
+            name="canonical",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="duplicates",
+                to="jobs.jobs",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="jobs",
+            index=models.Index(
+                condition=models.Q(("canonical__isnull", True)),
+                fields=["created_on", "id"],
+                name="jobs_canonical_keyset_idx",
+            ),
+        ),
+        migrations.AddField(
+            model_name="joblshbucket",
+            name="job",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="lsh_buckets",
+                to="jobs.jobs",
+            ),
+        ),
+    ]
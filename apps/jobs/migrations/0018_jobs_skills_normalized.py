@@ -0,0 +1,82 @@
+# Generated by Django 5.2.1 on 2026-10-18 01:11
+
+import django.contrib.postgres.fields
+import django.contrib.postgres.indexes
+from django.conf import settings
+from django.db import migrations, models
+
+SKILLS_NORMALIZED_TRIGGER_SQL = """
+CREATE OR REPLACE FUNCTION jobs_normalize_skills(skills varchar[]) RETURNS varchar[] AS $$
+    SELECT coalesce(array_agg(DISTINCT lower(btrim(skill))), '{}')
+    FROM unnest(skills) AS skill
+    WHERE btrim(skill) <> ''
+$$ LANGUAGE sql IMMUTABLE;
+
+CREATE OR REPLACE FUNCTION jobs_jobs_skills_normalized_update() RETURNS trigger AS $$
+BEGIN
+    NEW.hard_skills_normalized := jobs_normalize_skills(NEW.hard_skills);
+    NEW.soft_skills_normalized := jobs_normalize_skills(NEW.soft_skills);
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER jobs_jobs_skills_normalized
+BEFORE INSERT OR UPDATE OF hard_skills, soft_skills
+ON jobs_jobs
+FOR EACH ROW EXECUTE FUNCTION jobs_jobs_skills_normalized_update();
+
+UPDATE jobs_jobs SET hard_skills = hard_skills;
+"""
+
+DROP_SKILLS_NORMALIZED_TRIGGER_SQL = """
+DROP TRIGGER IF EXISTS jobs_jobs_skills_normalized ON jobs_jobs;
+DROP FUNCTION IF EXISTS jobs_jobs_skills_normalized_update();
+DROP FUNCTION IF EXISTS jobs_normalize_skills(varchar[]);
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("jobs", "0017_job_near_duplicates"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="jobs",
+            name="hard_skills_normalized",
+            field=django.contrib.postgres.fields.ArrayField(
+                base_field=models.CharField(max_length=255),
+                editable=False,
+                null=True,
+                size=None,
+            ),
+        ),
+        migrations.AddField(
+            model_name="jobs",
+            name="soft_skills_normalized",
+            field=django.contrib.postgres.fields.ArrayField(
+                base_field=models.CharField(max_length=255),
+                editable=False,
+                null=True,
+                size=None,
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="jobs",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["hard_skills_normalized"], name="jobs_hard_skills_gin"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="jobs",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["soft_skills_normalized"], name="jobs_soft_skills_gin"
+            ),
+        ),
+        migrations.RunSQL(
+            SKILLS_NORMALIZED_TRIGGER_SQL,
+            reverse_sql=DROP_SKILLS_NORMALIZED_TRIGGER_SQL,
+        ),
+    ]
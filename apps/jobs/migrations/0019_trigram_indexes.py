@@ -0,0 +1,59 @@
+# Generated by Django 5.2.1 on 2026-10-18 01:13
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.conf import settings
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("jobs", "0018_jobs_skills_normalized"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddIndex(
+            model_name="jobs",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("location"),
+                    name="gin_trgm_ops",
+                ),
+                name="jobs_location_trgm",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="jobs",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("company_name"),
+                    name="gin_trgm_ops",
+                ),
+                name="jobs_company_name_trgm",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="jobs",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("experience_level"),
+                    name="gin_trgm_ops",
+                ),
+                name="jobs_experience_level_trgm",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="jobs",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("job_title_category"),
+                    name="gin_trgm_ops",
+                ),
+                name="jobs_title_category_trgm",
+            ),
+        ),
+    ]
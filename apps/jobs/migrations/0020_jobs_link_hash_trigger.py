@@ -0,0 +1,186 @@
+# Generated by Django 5.2.1 on 2026-10-18 14:20
+
+from django.db import migrations, models
+
+# SQL twin of apps.jobs.links.normalize_link/make_link_hash, so rows written
+# straight to the database (e.g. by the n8n workflows) get the same hash
+LINK_HASH_TRIGGER_SQL = r"""
+CREATE OR REPLACE FUNCTION jobs_unquote_plus(value text) RETURNS text AS $$
+DECLARE
+    decoded bytea := '';
+    i integer := 1;
+BEGIN
+    value := replace(value, '+', ' ');
+    IF strpos(value, '%') = 0 THEN
+        RETURN value;
+    END IF;
+    WHILE i <= length(value) LOOP
+        IF substr(value, i, 3) ~ '^%[0-9A-Fa-f]{2}$' THEN
+            decoded := decoded || decode(substr(value, i + 1, 2), 'hex');
+            i := i + 3;
+        ELSE
+            decoded := decoded || convert_to(substr(value, i, 1), 'UTF8');
+            i := i + 1;
+        END IF;
+    END LOOP;
+    RETURN convert_from(decoded, 'UTF8');
+EXCEPTION WHEN character_not_in_repertoire THEN
+    -- Escapes that are not UTF-8, or NUL
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql IMMUTABLE;
+
+CREATE OR REPLACE FUNCTION jobs_quote_plus(value text) RETURNS text AS $$
+DECLARE
+    bytes bytea;
+    byte integer;
+    quoted text := '';
+BEGIN
+    IF value ~ '^[A-Za-z0-9_.~-]*$' THEN
+        RETURN value;
+    END IF;
+    bytes := convert_to(value, 'UTF8');
+    FOR i IN 0 .. octet_length(bytes) - 1 LOOP
+        byte := get_byte(bytes, i);
+        IF byte = 32 THEN
+            quoted := quoted || '+';
+        ELSIF byte < 128 AND chr(byte) ~ '[A-Za-z0-9_.~-]' THEN
+            quoted := quoted || chr(byte);
+        ELSE
+            quoted := quoted || '%' || upper(lpad(to_hex(byte), 2, '0'));
+        END IF;
+    END LOOP;
+    RETURN quoted;
+END
+$$ LANGUAGE plpgsql IMMUTABLE;
+
+CREATE OR REPLACE FUNCTION jobs_normalize_link(link text) RETURNS text AS $$
+DECLARE
+    rest text := translate(btrim(link, E' \t\n\r\f\x0b'), E'\t\r\n', '');
+    netloc text := '';
+    query text := '';
+    host text;
+    path text;
+    keys text[];
+    vals text[];
+    job_key text;
+    params text;
+BEGIN
+    -- urlsplit()
+    IF rest ~ '^[A-Za-z][A-Za-z0-9+.-]*:' THEN
+        rest := substr(rest, strpos(rest, ':') + 1);
+    END IF;
+    IF left(rest, 2) = '//' THEN
+        netloc := substring(rest FROM '^//([^/?#]*)');
+        rest := substr(rest, length(netloc) + 3);
+        -- urlsplit() rejects an unbalanced IPv6 bracket
+        IF (strpos(netloc, '[') > 0) <> (strpos(netloc, ']') > 0) THEN
+            RETURN NULL;
+        END IF;
+    END IF;
+    rest := split_part(rest, '#', 1);
+    IF strpos(rest, '?') > 0 THEN
+        query := substr(rest, strpos(rest, '?') + 1);
+        rest := left(rest, strpos(rest, '?') - 1);
+    END IF;
+    path := rtrim(rest, '/');
+
+    host := regexp_replace(netloc, '^.*@', '');
+    IF strpos(host, '[') > 0 THEN
+        host := substring(host FROM '\[([^\]]*)');
+    ELSE
+        host := split_part(host, ':', 1);
+    END IF;
+    host := lower(host);
+    IF left(host, 4) = 'www.' THEN
+        host := substr(host, 5);
+    END IF;
+
+    -- parse_qsl(keep_blank_values=True)
+    SELECT
+        array_agg(jobs_unquote_plus(split_part(piece, '=', 1)) ORDER BY n),
+        array_agg(jobs_unquote_plus(CASE
+            WHEN strpos(piece, '=') > 0 THEN substr(piece, strpos(piece, '=') + 1)
+            ELSE ''
+        END) ORDER BY n)
+    INTO keys, vals
+    FROM unnest(string_to_array(query, '&')) WITH ORDINALITY AS p(piece, n)
+    WHERE piece <> '';
+    IF array_position(keys, NULL) IS NOT NULL
+            OR array_position(vals, NULL) IS NOT NULL THEN
+        RETURN NULL;
+    END IF;
+
+    IF host = 'indeed.com' OR host LIKE '%.indeed.com' THEN
+        SELECT coalesce(
+            nullif((SELECT v FROM unnest(keys, vals) WITH ORDINALITY AS p(k, v, n)
+                    WHERE k = 'jk' ORDER BY n DESC LIMIT 1), ''),
+            nullif((SELECT v FROM unnest(keys, vals) WITH ORDINALITY AS p(k, v, n)
+                    WHERE k = 'vjk' ORDER BY n DESC LIMIT 1), '')
+        ) INTO job_key;
+        IF job_key IS NOT NULL THEN
+            RETURN 'indeed.com/viewjob?jk=' || job_key;
+        END IF;
+    END IF;
+
+    SELECT string_agg(
+        jobs_quote_plus(k) || '=' || jobs_quote_plus(v), '&'
+        ORDER BY k COLLATE "C", v COLLATE "C"
+    )
+    INTO params
+    FROM unnest(keys, vals) AS p(k, v)
+    WHERE lower(k) NOT IN (
+        'fbclid', 'gclid', 'mc_cid', 'mc_eid', 'ref', 'referrer', 'from'
+    ) AND lower(k) NOT LIKE 'utm\_%';
+    RETURN host || path || coalesce('?' || params, '');
+END
+$$ LANGUAGE plpgsql IMMUTABLE;
+
+CREATE OR REPLACE FUNCTION jobs_link_hash(link text) RETURNS text AS $$
+    SELECT encode(sha256(convert_to(jobs_normalize_link(link), 'UTF8')), 'hex')
+$$ LANGUAGE sql IMMUTABLE;
+
+CREATE OR REPLACE FUNCTION jobs_jobs_link_hash_update() RETURNS trigger AS $$
+BEGIN
+    NEW.link_hash := jobs_link_hash(NEW.link);
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER jobs_jobs_link_hash
+BEFORE INSERT OR UPDATE OF link
+ON jobs_jobs
+FOR EACH ROW EXECUTE FUNCTION jobs_jobs_link_hash_update();
+
+UPDATE jobs_jobs SET link = link;
+"""
+
+DROP_LINK_HASH_TRIGGER_SQL = """
+UPDATE jobs_jobs SET link_hash = NULL;
+DROP TRIGGER IF EXISTS jobs_jobs_link_hash ON jobs_jobs;
+DROP FUNCTION IF EXISTS jobs_jobs_link_hash_update();
+DROP FUNCTION IF EXISTS jobs_link_hash(text);
+DROP FUNCTION IF EXISTS jobs_normalize_link(text);
+DROP FUNCTION IF EXISTS jobs_quote_plus(text);
+DROP FUNCTION IF EXISTS jobs_unquote_plus(text);
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("jobs", "0019_trigram_indexes"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="jobs",
+            name="link_hash",
+            field=models.CharField(
+                blank=True, db_index=True, editable=False, max_length=64, null=True
+            ),
+        ),
+        migrations.RunSQL(
+            LINK_HASH_TRIGGER_SQL, reverse_sql=DROP_LINK_HASH_TRIGGER_SQL
+        ),
+    ]
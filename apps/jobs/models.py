@@ -1,10 +1,17 @@
 from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
+from django.db.models.functions import Upper
 from django.utils import timezone
 
 from core.models import BaseModel
 
-from .consts import EMPLOYMENT_TYPE_CHOICES, WORK_LOCATION_CHOICES, SOURCE_PLATFORM_CHOICES
+from .consts import (
+    EMPLOYMENT_TYPE_CHOICES,
+    SOURCE_PLATFORM_CHOICES,
+    WORK_LOCATION_CHOICES,
+)
 
 
 # Create your models here.
@@ -41,6 +48,77 @@ class Jobs(BaseModel):
         choices=SOURCE_PLATFORM_CHOICES,
         default="weworkremotely.com",
     )
+    # sha256 of normalize_link(link), used to spot already-saved postings;
+    # kept by a database trigger (migration 0020)
+    link_hash = models.CharField(
+        max_length=64, null=True, blank=True, editable=False, db_index=True
+    )
+    # Earliest posting this job is a near-duplicate of (see apps.jobs.dedupe)
+    canonical = models.ForeignKey(
+        "self",
+        null=True,
+        blank=True,
+        on_delete=models.SET_NULL,
+        related_name="duplicates",
+    )
+    # Maintained by the jobs_jobs_search_vector trigger (see migration 0013)
+    search_vector = SearchVectorField(null=True, editable=False)
+    # Lowercased, trimmed copies of the skill arrays for indexed skill filters,
+    # maintained by the jobs_jobs_skills_normalized trigger (see migration 0018)
+    hard_skills_normalized = ArrayField(
+        models.CharField(max_length=255), null=True, editable=False
+    )
+    soft_skills_normalized = ArrayField(
+        models.CharField(max_length=255), null=True, editable=False
+    )
+
+    class Meta(BaseModel.Meta):
+        indexes = [
+            *BaseModel.Meta.indexes,
+            GinIndex(fields=["search_vector"], name="jobs_search_vector_gin"),
+            GinIndex(fields=["hard_skills_normalized"], name="jobs_hard_skills_gin"),
+            GinIndex(fields=["soft_skills_normalized"], name="jobs_soft_skills_gin"),
+            # Trigram indexes on UPPER(column) serve icontains (UPPER(col) LIKE
+            # UPPER('%...%')) and the fuzzy filters in apps.jobs.search
+            GinIndex(
+                OpClass(Upper("location"), name="gin_trgm_ops"),
+                name="jobs_location_trgm",
+            ),
+            GinIndex(
+                OpClass(Upper("company_name"), name="gin_trgm_ops"),
+                name="jobs_company_name_trgm",
+            ),
+            GinIndex(
+                OpClass(Upper("experience_level"), name="gin_trgm_ops"),
+                name="jobs_experience_level_trgm",
+            ),
+            GinIndex(
+                OpClass(Upper("job_title_category"), name="gin_trgm_ops"),
+                name="jobs_title_category_trgm",
+            ),
+            models.Index(fields=["created_on", "id"], name="jobs_created_on_id_idx"),
+            models.Index(
+                fields=["created_on", "id"],
+                condition=models.Q(canonical__isnull=True),
+                name="jobs_canonical_keyset_idx",
+            ),
+        ]
+
+
+class JobFingerprint(models.Model):
+    """MinHash signature of a job's title, company and description"""
+
+    job = models.OneToOneField(
+        Jobs, primary_key=True, on_delete=models.CASCADE, related_name="fingerprint"
+    )
+    signature = ArrayField(models.BigIntegerField())
+
+
+class JobLshBucket(models.Model):
+    """One LSH band bucket of a job's signature, used to find duplicate candidates"""
+
+    job = models.ForeignKey(Jobs, on_delete=models.CASCADE, related_name="lsh_buckets")
+    bucket = models.BigIntegerField(db_index=True)
 
 
 class JobAssessment(BaseModel):
@@ -54,3 +132,33 @@ class JobAssessment(BaseModel):
         models.CharField(max_length=255), size=20, null=True, blank=True, default=list
     )
     score = models.IntegerField(default=0)
+
+    class Meta(BaseModel.Meta):
+        indexes = [
+            *BaseModel.Meta.indexes,
+            models.Index(
+                fields=["profile", "created_on", "id"],
+                name="jobs_assess_profile_keyset_idx",
+            ),
+        ]
+
+
+class JobExtraction(models.Model):
+    """Cached LLM extraction result keyed by the normalized description hash"""
+
+    description_hash = models.CharField(max_length=64, unique=True)
+    fields = models.JSONField(default=dict)
+    hit_count = models.IntegerField(default=0)
+    created_on = models.DateTimeField(default=timezone.now)
+    last_used_on = models.DateTimeField(default=timezone.now, db_index=True)
+
+
+class JobExtractionStats(models.Model):
+    """
+    Hit/miss/eviction counters of the extraction cache, spread over
+    EXTRACTION_STATS_SHARDS rows that are summed when read
+    """
+
+    hits = models.BigIntegerField(default=0)
+    misses = models.BigIntegerField(default=0)
+    evictions = models.BigIntegerField(default=0)
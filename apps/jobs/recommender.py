@@ -0,0 +1,295 @@
+import logging
+import re
+import threading
+import time
+
+import numpy as np
+from django.conf import settings
+from django.db import connection
+from scipy import sparse
+
+from .consts import CHANGE_WATERMARK_OVERLAP
+from .models import JobAssessment, Jobs
+
+logger = logging.getLogger(__name__)
+
+WORD_RE = re.compile(r"[a-z0-9+#.]+")
+
+# Location keywords that place a job inside a Profile.area
+AREA_KEYWORDS = {
+    "SE_ASIA": [
+        "indonesia",
+        "jakarta",
+        "bandung",
+        "surabaya",
+        "bali",
+        "singapore",
+        "malaysia",
+        "kuala lumpur",
+        "thailand",
+        "bangkok",
+        "vietnam",
+        "philippines",
+        "manila",
+    ],
+    "APAC": ["asia", "apac", "australia", "japan", "india", "korea", "singapore"],
+    "EU": ["europe", "germany", "berlin", "france", "netherlands", "spain", "poland"],
+    "EMEA": ["emea", "europe", "uk", "united kingdom", "london", "dubai", "africa"],
+}
+
+# Feature weights of a profile; skills the profile lacks count against a job
+SKILL_WEIGHT = 1.0
+TITLE_WEIGHT = 0.75
+GAP_WEIGHT = -0.5
+WORK_LOCATION_WEIGHT = 0.5
+AREA_WEIGHT = 0.5
+
+JOB_FIELDS = [
+    "id",
+    "title",
+    "hard_skills",
+    "soft_skills",
+    "work_location",
+    "location",
+    "updated_on",
+]
+
+
+def tokens(text):
+    return WORD_RE.findall((text or "").casefold())
+
+
+def skill_feature(skill):
+    return "s:" + " ".join(tokens(skill))
+
+
+def job_features(job):
+    """Sparse feature names of a job: skills, title words, work location, area"""
+    features = {
+        skill_feature(skill)
+        for skill in (job["hard_skills"] or []) + (job["soft_skills"] or [])
+        if tokens(skill)
+    }
+    features.update("t:" + word for word in tokens(job["title"]))
+    features.add("wl:" + job["work_location"])
+    location = (job["location"] or "").casefold()
+    features.update(
+        "area:" + area
+        for area, keywords in AREA_KEYWORDS.items()
+        if any(keyword in location for keyword in keywords)
+    )
+    return features
+
+
+class JobRecommender:
+    """
+    In-memory job x feature incidence matrix (scipy CSR) used to score every
+    candidate job against a profile with one sparse mat-vec product.
+
+    Changed jobs are picked up incrementally by updated_on: their new rows are
+    appended and the old rows masked out. The matrix is rebuilt from scratch
+    when too many rows are stale or RECOMMENDER_REBUILD_SECONDS have passed,
+    which also drops deleted jobs.
+
+    Updates build new arrays next to the published ones and swap them in
+    under `lock`; readers only hold it to take a snapshot. Requests refresh in
+    a background thread, so only the first build runs on the request path.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.update_lock = threading.Lock()
+        self.vocabulary = {}
+        self.matrix = sparse.csr_matrix((0, 0), dtype=np.float32)
+        self.row_job_ids = np.zeros(0, dtype=np.int64)
+        self.row_alive = np.zeros(0, dtype=bool)
+        self.job_rows = {}
+        self.job_versions = {}
+        self.watermark = None
+        self.refreshed_at = 0.0
+        self.built_at = 0.0
+
+    def due(self, force=False):
+        now = time.monotonic()
+        if now - self.built_at > settings.RECOMMENDER_REBUILD_SECONDS:
+            return "rebuild"
+        if force or now - self.refreshed_at > settings.RECOMMENDER_REFRESH_SECONDS:
+            return "apply_changes"
+        return None
+
+    def refresh(self, force=False, wait=True):
+        """
+        Rebuild or pick up changed jobs if due. Without `wait` the update runs
+        in a background thread while readers keep the current matrix, unless
+        nothing has been built yet.
+        """
+        if not self.due(force):
+            return
+        if wait or not self.built_at:
+            self.update(force)
+        elif not self.update_lock.locked():
+            threading.Thread(target=self.update_in_background, daemon=True).start()
+
+    def update(self, force=False):
+        # One writer at a time; whoever waited re-checks what is still due
+        with self.update_lock:
+            step = self.due(force)
+            if step:
+                getattr(self, step)()
+
+    def update_in_background(self):
+        try:
+            self.update()
+        except Exception:
+            logger.exception("Recommender refresh failed")
+        finally:
+            connection.close()
+
+    def rebuild(self):
+        fresh = JobRecommender()
+        fresh.apply_changes()
+        with self.lock:
+            self.vocabulary = fresh.vocabulary
+            self.matrix = fresh.matrix
+            self.row_job_ids = fresh.row_job_ids
+            self.row_alive = fresh.row_alive
+            self.job_rows = fresh.job_rows
+            self.job_versions = fresh.job_versions
+            self.watermark = fresh.watermark
+            self.refreshed_at = fresh.refreshed_at
+            self.built_at = time.monotonic()
+
+    def apply_changes(self):
+        queryset = Jobs.objects.values(*JOB_FIELDS, "canonical_id")
+        if self.watermark is not None:
+            queryset = queryset.filter(
+                updated_on__gte=self.watermark - CHANGE_WATERMARK_OVERLAP
+            )
+        else:
+            queryset = queryset.filter(canonical__isnull=True)
+        changed = list(queryset.order_by("updated_on"))
+        refreshed_at = time.monotonic()
+        watermark = changed[-1]["updated_on"] if changed else self.watermark
+        # The overlap re-reads jobs whose current version is already applied
+        changed = [
+            job
+            for job in changed
+            if self.job_versions.get(job["id"]) != job["updated_on"]
+        ]
+        if not changed:
+            with self.lock:
+                self.watermark, self.refreshed_at = watermark, refreshed_at
+            return
+
+        # Stale rows of changed jobs are masked; jobs that became duplicates
+        # get no new row
+        vocabulary = dict(self.vocabulary)
+        job_rows = dict(self.job_rows)
+        job_versions = dict(self.job_versions)
+        row_alive = self.row_alive.copy()
+        for job in changed:
+            job_versions[job["id"]] = job["updated_on"]
+            row = job_rows.pop(job["id"], None)
+            if row is not None:
+                row_alive[row] = False
+        changed = [job for job in changed if job["canonical_id"] is None]
+
+        indptr, indices = [0], []
+        for job in changed:
+            for feature in job_features(job):
+                indices.append(vocabulary.setdefault(feature, len(vocabulary)))
+            indptr.append(len(indices))
+        # Rows are L2-normalized so long skill lists do not dominate
+        lengths = np.diff(indptr)
+        data = np.repeat(1.0 / np.sqrt(np.maximum(lengths, 1)), lengths).astype(
+            np.float32
+        )
+        new_rows = sparse.csr_matrix(
+            (data, indices, indptr), shape=(len(changed), len(vocabulary))
+        )
+        # Widen a new view of the old rows: readers may hold the published one
+        old_rows = sparse.csr_matrix(
+            (self.matrix.data, self.matrix.indices, self.matrix.indptr),
+            shape=(self.matrix.shape[0], len(vocabulary)),
+        )
+        matrix = sparse.vstack([old_rows, new_rows], format="csr")
+
+        first_row = len(self.row_job_ids)
+        row_job_ids = np.concatenate(
+            [self.row_job_ids, np.array([job["id"] for job in changed], dtype=np.int64)]
+        )
+        row_alive = np.concatenate([row_alive, np.ones(len(changed), bool)])
+        for offset, job in enumerate(changed):
+            job_rows[job["id"]] = first_row + offset
+
+        if (~row_alive).sum() > settings.RECOMMENDER_MAX_STALE_RATIO * len(row_alive):
+            alive = np.flatnonzero(row_alive)
+            matrix, row_job_ids = matrix[alive], row_job_ids[alive]
+            row_alive = np.ones(len(alive), dtype=bool)
+            job_rows = {job_id: row for row, job_id in enumerate(row_job_ids)}
+
+        with self.lock:
+            self.vocabulary, self.matrix = vocabulary, matrix
+            self.row_job_ids, self.row_alive = row_job_ids, row_alive
+            self.job_rows, self.job_versions = job_rows, job_versions
+            self.watermark, self.refreshed_at = watermark, refreshed_at
+
+    def profile_weights(self, profile):
+        """Weighted feature names of a profile"""
+        weights = {}
+        text_tokens = tokens(f"{profile.job_title or ''} {profile.profile or ''}")
+        # Skills may span several words, so weight every 1-3 word n-gram;
+        # those that name no skill have no column and are dropped
+        for size in (1, 2, 3):
+            for i in range(len(text_tokens) - size + 1):
+                weights["s:" + " ".join(text_tokens[i : i + size])] = SKILL_WEIGHT
+        for word in tokens(profile.job_title):
+            weights["t:" + word] = TITLE_WEIGHT
+        weights["wl:" + profile.availability_type.lower()] = WORK_LOCATION_WEIGHT
+        weights["area:" + profile.area] = AREA_WEIGHT
+
+        gaps = list(profile.hard_skill_gaps or []) + list(profile.soft_skill_gaps or [])
+        for hard_gap, soft_gap in JobAssessment.objects.filter(
+            profile=profile
+        ).values_list("hard_skill_gap", "soft_skill_gap"):
+            gaps += (hard_gap or []) + (soft_gap or [])
+        for gap in gaps:
+            if isinstance(gap, str) and weights.get(skill_feature(gap)) is None:
+                weights[skill_feature(gap)] = GAP_WEIGHT
+        return weights
+
+    def recommend(self, profile, limit, exclude_ids=()):
+        """Return [(job_id, score)] of the best matching jobs, best first"""
+        self.refresh(wait=False)
+        weights = self.profile_weights(profile)
+        with self.lock:
+            matrix, alive, job_ids = self.matrix, self.row_alive, self.row_job_ids
+            vector = np.zeros(len(self.vocabulary), dtype=np.float32)
+            for feature, weight in weights.items():
+                column = self.vocabulary.get(feature)
+                if column is not None:
+                    vector[column] = weight
+        if not matrix.shape[0]:
+            return []
+        scores = matrix @ vector
+        scores[~alive] = 0
+        excluded = np.isin(job_ids, np.fromiter(exclude_ids, dtype=np.int64))
+        scores[excluded] = 0
+
+        limit = min(limit, int((scores > 0).sum()))
+        if limit == 0:
+            return []
+        top = np.argpartition(-scores, limit - 1)[:limit]
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [(int(job_ids[row]), float(scores[row])) for row in top]
+
+
+_recommender = None
+
+
+def get_recommender():
+    """Process-wide recommender, built lazily on first use"""
+    global _recommender
+    if _recommender is None:
+        _recommender = JobRecommender()
+    return _recommender
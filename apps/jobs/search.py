@@ -0,0 +1,67 @@
+from django.contrib.postgres.search import (
+    SearchQuery,
+    SearchRank,
+    TrigramWordSimilarity,
+)
+from django.db.models import F
+from django.db.models.functions import Upper
+
+from .consts import JOBS_SEARCH_CONFIG
+
+
+def search_jobs(queryset, value):
+    """
+    Full-text search over Jobs.search_vector, ordered by rank (best match first).
+
+    The vector is weighted title > company/category > location/skills > description and
+    is maintained by a database trigger, so the match is served by its GIN index.
+    """
+    query = SearchQuery(value, search_type="websearch", config=JOBS_SEARCH_CONFIG)
+    return (
+        queryset.filter(search_vector=query)
+        .annotate(search_rank=SearchRank(F("search_vector"), query))
+        .order_by("-search_rank", "-created_on")
+    )
+
+
+def fuzzy_match(queryset, field, value):
+    """
+    Typo-tolerant match on a text column, ordered by similarity (best match first).
+
+    "tokopeda" finds "Tokopedia Tbk": the value only has to be word-similar
+    (pg_trgm `%>`) to part of the column, which the UPPER(column) trigram
+    index serves. The score is exposed as `<field>_similarity`.
+    """
+    value = value.strip().upper()
+    if not value:
+        return queryset
+    column = Upper(field)
+    similarity = f"{field}_similarity"
+    return (
+        queryset.alias(**{f"{field}_upper": column})
+        .filter(**{f"{field}_upper__trigram_word_similar": value})
+        .annotate(**{similarity: TrigramWordSimilarity(value, column)})
+        .order_by(f"-{similarity}", "-created_on")
+    )
+
+
+def normalize_skills(value):
+    """
+    Split a comma-separated skill list into the form stored in the *_normalized
+    skill columns: trimmed, lowercased, without blanks or repeats.
+    """
+    skills = (skill.strip().lower() for skill in value.split(","))
+    return list(dict.fromkeys(skill for skill in skills if skill))
+
+
+def filter_skills(queryset, field, value, match):
+    """
+    Filter on exact skills, served by the GIN index on `<field>_normalized`.
+
+    `match` is "any" (array overlap, &&) or "all" (array containment, @>).
+    """
+    skills = normalize_skills(value)
+    if not skills:
+        return queryset
+    lookup = "overlap" if match == "any" else "contains"
+    return queryset.filter(**{f"{field}_normalized__{lookup}": skills})
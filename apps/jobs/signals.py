@@ -0,0 +1,11 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .cache import bump_jobs_version
+from .models import Jobs
+
+
+@receiver(post_save, sender=Jobs)
+@receiver(post_delete, sender=Jobs)
+def invalidate_job_responses(sender, **kwargs):
+    bump_jobs_version()
@@ -0,0 +1,176 @@
+import os
+import re
+import threading
+import zlib
+from pathlib import Path
+
+import numpy as np
+from django.conf import settings
+from scipy import sparse
+
+from .models import Jobs
+
+# Hashed feature space: no vocabulary has to be stored or shipped
+NUM_FEATURES = 1 << 20
+TOKEN_RE = re.compile(r"[a-z0-9+#]+")
+# Titles are short but the best signal, so their terms count more
+TITLE_BOOST = 3
+
+# Matrix, job ids and IDF live in one file so one rename publishes them together
+INDEX_FILE = "index.npz"
+
+
+def document_terms(title, description, requirements):
+    """Hashed term counts of one job as (feature ids, counts)"""
+    terms = TOKEN_RE.findall((title or "").casefold()) * TITLE_BOOST
+    terms += TOKEN_RE.findall((description or "").casefold())
+    terms += TOKEN_RE.findall(" ".join(requirements or []).casefold())
+    hashed = np.fromiter(
+        (zlib.crc32(term.encode()) % NUM_FEATURES for term in terms),
+        dtype=np.int64,
+        count=len(terms),
+    )
+    return np.unique(hashed, return_counts=True)
+
+
+def tfidf_rows(documents, idf):
+    """L2-normalized sublinear TF-IDF CSR rows for (features, counts) pairs"""
+    indptr, indices, data = [0], [], []
+    for features, counts in documents:
+        weights = (1 + np.log(counts)) * idf[features]
+        norm = np.linalg.norm(weights)
+        indices.append(features)
+        data.append(weights / norm if norm else weights)
+        indptr.append(indptr[-1] + len(features))
+    return sparse.csr_matrix(
+        (
+            np.concatenate(data).astype(np.float32) if data else [],
+            np.concatenate(indices) if indices else [],
+            indptr,
+        ),
+        shape=(len(indptr) - 1, NUM_FEATURES),
+    )
+
+
+def build_index(directory, chunk_size=2000):
+    """Vectorize all canonical jobs and write the index to `directory`"""
+    job_ids, documents = [], []
+    queryset = (
+        Jobs.objects.filter(canonical__isnull=True)
+        .order_by("id")
+        .values_list("id", "title", "description", "requirements")
+    )
+    for job_id, title, description, requirements in queryset.iterator(
+        chunk_size=chunk_size
+    ):
+        job_ids.append(job_id)
+        documents.append(document_terms(title, description, requirements))
+
+    document_frequency = np.zeros(NUM_FEATURES, dtype=np.int64)
+    for features, _ in documents:
+        document_frequency[features] += 1
+    idf = (np.log((1 + len(documents)) / (1 + document_frequency)) + 1).astype(
+        np.float32
+    )
+    matrix = tfidf_rows(documents, idf)
+
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    # Write to a temporary name first so workers never load a half-written index
+    tmp = directory / f"tmp-{os.getpid()}-{INDEX_FILE}"
+    np.savez_compressed(
+        tmp,
+        data=matrix.data,
+        indices=matrix.indices,
+        indptr=matrix.indptr,
+        job_ids=np.array(job_ids, np.int64),
+        idf=idf,
+    )
+    os.replace(tmp, directory / INDEX_FILE)
+    return len(job_ids)
+
+
+class SimilarJobsIndex:
+    """
+    TF-IDF index loaded once per worker and reloaded when the file changes.
+    A load publishes a new snapshot; queries take it once under the lock.
+    """
+
+    def __init__(self, directory):
+        self.directory = Path(directory)
+        self.lock = threading.Lock()
+        self.load_lock = threading.Lock()
+        self.loaded_version = None
+        self.snapshot = None
+
+    def load(self):
+        """Current (matrix, job_ids, job_rows, idf), or None before any build"""
+        try:
+            stat = (self.directory / INDEX_FILE).stat()
+        except FileNotFoundError:
+            return None
+        # A replaced file is a new inode even within the mtime's resolution
+        version = (stat.st_ino, stat.st_mtime_ns)
+        with self.load_lock:
+            if version != self.loaded_version:
+                with np.load(self.directory / INDEX_FILE) as index:
+                    job_ids, idf = index["job_ids"], index["idf"]
+                    matrix = sparse.csr_matrix(
+                        (index["data"], index["indices"], index["indptr"]),
+                        shape=(len(job_ids), NUM_FEATURES),
+                    )
+                job_rows = {job_id: row for row, job_id in enumerate(job_ids.tolist())}
+                with self.lock:
+                    self.snapshot = (matrix, job_ids, job_rows, idf)
+                self.loaded_version = version
+        with self.lock:
+            return self.snapshot
+
+    def similar(self, job, limit):
+        """Return [(job_id, similarity)] of the nearest jobs, best first"""
+        snapshot = self.load()
+        if snapshot is None:
+            return []
+        matrix, job_ids, job_rows, idf = snapshot
+        row = job_rows.get(job.id)
+        if row is not None:
+            vector = matrix[row]
+        else:
+            # Jobs added after the last build are vectorized with the stored IDF
+            vector = tfidf_rows(
+                [document_terms(job.title, job.description, job.requirements)], idf
+            )
+        scores = (matrix @ vector.T).toarray().ravel()
+        for excluded in (job.id, job.canonical_id):
+            row = job_rows.get(excluded)
+            if row is not None:
+                scores[row] = 0
+        limit = min(limit, int((scores > 0).sum()))
+        if limit == 0:
+            return []
+        top = np.argpartition(-scores, limit - 1)[:limit]
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [(int(job_ids[row]), float(scores[row])) for row in top]
+
+
+_index = None
+
+
+def get_similar_jobs_index():
+    global _index
+    directory = Path(settings.SIMILAR_JOBS_INDEX_DIR)
+    if _index is None or _index.directory != directory:
+        _index = SimilarJobsIndex(directory)
+    return _index
+
+
+def similar_jobs(job, limit):
+    """Similar Jobs instances (with a .similarity attribute), best first"""
+    ranked = get_similar_jobs_index().similar(job, limit)
+    jobs = Jobs.objects.defer("search_vector").in_bulk([job_id for job_id, _ in ranked])
+    results = []
+    for job_id, similarity in ranked:
+        if job_id in jobs:
+            jobs[job_id].similarity = round(similarity, 4)
+            results.append(jobs[job_id])
+    return results
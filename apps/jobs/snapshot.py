@@ -0,0 +1,139 @@
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+from django.utils import timezone
+
+from .consts import CHANGE_WATERMARK_OVERLAP, EXPORT_CHUNK_SIZE, EXPORT_FIELDS
+from .models import Jobs
+
+MANIFEST_FILE = "manifest.json"
+# Hive-style partition columns: <dir>/posted_month=2025-06/source_platform=x/
+PARTITION_COLUMNS = ["posted_month", "source_platform"]
+# Partition value of jobs without a posted_on date
+UNKNOWN_MONTH = "unknown"
+
+SNAPSHOT_COLUMNS = ["id", "canonical_id", *EXPORT_FIELDS]
+LIST_COLUMNS = {"hard_skills", "soft_skills", "requirements"}
+TIMESTAMP_COLUMNS = {"posted_on", "created_on", "updated_on"}
+INTEGER_COLUMNS = {"id", "canonical_id"}
+
+
+def snapshot_schema():
+    """Fixed Arrow schema, so every part file of every snapshot has the same types"""
+    fields = []
+    for column in SNAPSHOT_COLUMNS:
+        if column in LIST_COLUMNS:
+            type_ = pa.list_(pa.string())
+        elif column in TIMESTAMP_COLUMNS:
+            type_ = pa.timestamp("us", tz="UTC")
+        elif column in INTEGER_COLUMNS:
+            type_ = pa.int64()
+        else:
+            type_ = pa.string()
+        fields.append(pa.field(column, type_))
+    fields.append(pa.field("posted_month", pa.string()))
+    return pa.schema(fields)
+
+
+def read_manifest(directory):
+    path = Path(directory) / MANIFEST_FILE
+    if not path.exists():
+        return {"snapshots": []}
+    return json.loads(path.read_text())
+
+
+def write_manifest(directory, manifest):
+    path = Path(directory) / MANIFEST_FILE
+    tmp_path = path.with_name(f"tmp-{MANIFEST_FILE}")
+    tmp_path.write_text(json.dumps(manifest, indent=2))
+    os.replace(tmp_path, path)
+
+
+def write_chunk(rows, directory, part, schema):
+    for row in rows:
+        posted_on = row["posted_on"]
+        row["posted_month"] = (
+            posted_on.strftime("%Y-%m") if posted_on else UNKNOWN_MONTH
+        )
+    frame = pd.DataFrame.from_records(rows, columns=[*SNAPSHOT_COLUMNS, "posted_month"])
+    frame.to_parquet(
+        directory,
+        engine="pyarrow",
+        index=False,
+        schema=schema,
+        partition_cols=PARTITION_COLUMNS,
+        basename_template=f"part-{part:05d}-{{i}}.parquet",
+    )
+
+
+def export_snapshot(directory, incremental=False, chunk_size=EXPORT_CHUNK_SIZE):
+    """
+    Write the jobs catalogue under `directory` as a partitioned Parquet
+    snapshot and record it in the manifest.
+
+    Rows are read `chunk_size` at a time through a server-side cursor and each
+    chunk is written as one part file per partition, so memory is bounded by
+    the chunk. An incremental snapshot only holds rows updated since the last
+    snapshot's watermark, less CHANGE_WATERMARK_OVERLAP so that rows committed
+    late are not skipped. A row can therefore appear in consecutive snapshots:
+    readers combine snapshots and keep the row with the latest updated_on per
+    uid. Deletions are only reflected by the next full snapshot.
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    manifest = read_manifest(directory)
+    previous = manifest["snapshots"][-1] if manifest["snapshots"] else None
+
+    started_on = timezone.now()
+    snapshot_id = started_on.strftime("%Y%m%dT%H%M%S%fZ")
+    queryset = Jobs.objects.order_by("updated_on", "id")
+    since = previous_watermark = None
+    if incremental and previous is not None and previous["watermark"]:
+        previous_watermark = previous["watermark"]
+        # updated_on is stamped before commit, so rows older than the
+        # watermark may still have committed after the previous snapshot
+        since = (
+            datetime.fromisoformat(previous_watermark) - CHANGE_WATERMARK_OVERLAP
+        ).isoformat()
+        queryset = queryset.filter(updated_on__gte=since)
+
+    tmp_directory = directory / f"tmp-{snapshot_id}"
+    schema = snapshot_schema()
+    rows, parts, count, watermark = [], 0, 0, None
+    for row in queryset.values(*SNAPSHOT_COLUMNS).iterator(chunk_size=chunk_size):
+        rows.append(row)
+        if len(rows) == chunk_size:
+            write_chunk(rows, tmp_directory, parts, schema)
+            parts, count, watermark = parts + 1, count + len(rows), row["updated_on"]
+            rows = []
+    if rows:
+        write_chunk(rows, tmp_directory, parts, schema)
+        parts, count, watermark = parts + 1, count + len(rows), rows[-1]["updated_on"]
+
+    # Readers only ever see complete snapshot directories
+    files = []
+    if count:
+        files = sorted(
+            str(path.relative_to(tmp_directory))
+            for path in tmp_directory.rglob("*.parquet")
+        )
+        os.replace(tmp_directory, directory / snapshot_id)
+    snapshot = {
+        "id": snapshot_id,
+        "kind": "incremental" if since else "full",
+        "path": snapshot_id if count else None,
+        "since": since,
+        "watermark": watermark.isoformat() if watermark else previous_watermark,
+        "rows": count,
+        "files": files,
+        "partition_columns": PARTITION_COLUMNS,
+        "started_on": started_on.isoformat(),
+        "finished_on": timezone.now().isoformat(),
+    }
+    manifest["snapshots"].append(snapshot)
+    write_manifest(directory, manifest)
+    return snapshot
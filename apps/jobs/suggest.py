@@ -0,0 +1,198 @@
+import heapq
+import re
+import threading
+import time
+from bisect import bisect_left
+from collections import Counter
+
+from django.conf import settings
+from django.db import connection
+
+from .consts import CHANGE_WATERMARK_OVERLAP, SUGGEST_FIELDS, SUGGEST_MAX
+from .models import Jobs
+
+# A completion may start at the beginning of any word ("indo" -> "Jakarta, Indonesia")
+WORD_START_RE = re.compile(r"(?:^|(?<=[\s,/(-]))\w")
+# Prefixes up to this length match too many values to rank per request, so
+# their completions are ranked once when the index is built
+PRECOMPUTED_PREFIX_LENGTH = 2
+
+
+class PrefixIndex:
+    """
+    Immutable, frequency-ranked completions for one field.
+
+    Values are numbered by rank (most frequent first) and every word start of
+    a value is stored as a sorted key, so a prefix is a bisect range and its
+    best completions are the smallest value numbers in that range.
+    """
+
+    def __init__(self, counts):
+        variants = {}
+        for value, count in counts.items():
+            if count > 0:
+                variants.setdefault(value.casefold(), Counter())[value] = count
+        ranked = sorted(
+            (
+                (sum(spellings.values()), spellings.most_common(1)[0][0])
+                for spellings in variants.values()
+            ),
+            key=lambda item: (-item[0], item[1].casefold()),
+        )
+        self.values = [value for _, value in ranked]
+        self.counts = [count for count, _ in ranked]
+
+        keys = sorted(
+            (value.casefold()[match.start() :], rank)
+            for rank, value in enumerate(self.values)
+            for match in WORD_START_RE.finditer(value.casefold())
+        )
+        self.keys = [key for key, _ in keys]
+        self.ranks = [rank for _, rank in keys]
+
+        top = {"": list(range(min(len(self.values), SUGGEST_MAX)))}
+        for key, rank in keys:
+            for length in range(1, min(len(key), PRECOMPUTED_PREFIX_LENGTH) + 1):
+                top.setdefault(key[:length], set()).add(rank)
+        self.top = {
+            prefix: ranks if prefix == "" else heapq.nsmallest(SUGGEST_MAX, ranks)
+            for prefix, ranks in top.items()
+        }
+
+    def complete(self, prefix, limit):
+        """Return [(value, count)] starting with `prefix`, most frequent first"""
+        prefix = " ".join(prefix.casefold().split())
+        if len(prefix) <= PRECOMPUTED_PREFIX_LENGTH:
+            ranks = self.top.get(prefix, [])[:limit]
+        else:
+            low = bisect_left(self.keys, prefix)
+            high = bisect_left(self.keys, prefix + "\U0010ffff", low)
+            ranks = heapq.nsmallest(limit, set(self.ranks[low:high]))
+        return [(self.values[rank], self.counts[rank]) for rank in ranks]
+
+
+def job_values(job, field):
+    value = job[field]
+    values = value if isinstance(value, list) else [value]
+    return [v.strip() for v in values if v and v.strip()]
+
+
+class SuggestIndex:
+    """
+    Per-process typeahead over distinct values of SUGGEST_FIELDS, counted over
+    canonical jobs.
+
+    Requests only read the current PrefixIndex of a field. Changes are applied
+    in a background thread, incrementally by updated_on every
+    SUGGEST_REFRESH_SECONDS, and from scratch every SUGGEST_REBUILD_SECONDS
+    (which also drops values of deleted jobs). A refresh rebuilds only the
+    PrefixIndex of fields whose counts changed. Only the very first request
+    of a process waits for the database.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.indexes = None
+        self.counts = {}
+        self.job_values = {}
+        self.watermark = None
+        self.refreshing = False
+        self.refreshed_at = 0.0
+        self.built_at = 0.0
+
+    def complete(self, field, prefix, limit):
+        if self.indexes is None:
+            with self.lock:
+                if self.indexes is None:
+                    self.rebuild()
+        else:
+            self.schedule_refresh()
+        return self.indexes[field].complete(prefix, limit)
+
+    def schedule_refresh(self):
+        now = time.monotonic()
+        if (
+            self.refreshing
+            or now - self.refreshed_at < settings.SUGGEST_REFRESH_SECONDS
+        ):
+            return
+        self.refreshing = True
+        rebuild = now - self.built_at > settings.SUGGEST_REBUILD_SECONDS
+        threading.Thread(
+            target=self.refresh_in_background, args=(rebuild,), daemon=True
+        ).start()
+
+    def refresh_in_background(self, rebuild):
+        try:
+            self.refresh(rebuild)
+        finally:
+            self.refreshing = False
+            # The thread's own connection would otherwise stay open
+            connection.close()
+
+    def refresh(self, rebuild=False):
+        with self.lock:
+            if rebuild:
+                self.rebuild()
+            else:
+                self.apply_changes()
+
+    def rebuild(self):
+        self.counts = {field: Counter() for field in SUGGEST_FIELDS}
+        self.job_values = {}
+        self.watermark = None
+        self.apply_changes()
+        self.built_at = time.monotonic()
+
+    def apply_changes(self):
+        queryset = Jobs.objects.values(
+            "id", "canonical_id", "updated_on", *SUGGEST_FIELDS
+        )
+        if self.watermark is not None:
+            queryset = queryset.filter(
+                updated_on__gte=self.watermark - CHANGE_WATERMARK_OVERLAP
+            )
+        else:
+            queryset = queryset.filter(canonical__isnull=True)
+        changed = list(queryset.order_by("updated_on"))
+        self.refreshed_at = time.monotonic()
+        if not changed and self.indexes is not None:
+            return
+        if changed:
+            self.watermark = changed[-1]["updated_on"]
+
+        # Jobs re-read within the overlap, or changed in other columns, net out
+        delta = {field: Counter() for field in SUGGEST_FIELDS}
+        for job in changed:
+            for field, values in self.job_values.pop(job["id"], {}).items():
+                delta[field].subtract(values)
+            if job["canonical_id"] is None:
+                values = {field: job_values(job, field) for field in SUGGEST_FIELDS}
+                for field, field_values in values.items():
+                    delta[field].update(field_values)
+                self.job_values[job["id"]] = values
+
+        indexes = dict(self.indexes or {})
+        for field, field_delta in delta.items():
+            field_delta = {value: n for value, n in field_delta.items() if n}
+            if field in indexes and not field_delta:
+                continue
+            counts = self.counts[field]
+            counts.update(field_delta)
+            for value in field_delta:
+                if counts[value] <= 0:
+                    del counts[value]
+            indexes[field] = PrefixIndex(counts)
+        # Readers keep using the previous indexes until the new ones are swapped in
+        self.indexes = indexes
+
+
+_suggest_index = None
+
+
+def get_suggest_index():
+    """Process-wide typeahead index, built lazily on first use"""
+    global _suggest_index
+    if _suggest_index is None:
+        _suggest_index = SuggestIndex()
+    return _suggest_index
@@ -0,0 +1,20 @@
+from django.conf import settings
+
+from apps.tasks.registry import task
+
+from .similar import build_index
+from .snapshot import export_snapshot
+
+DAY = 24 * 60 * 60
+
+
+@task(schedule=DAY, concurrency=1)
+def build_similar_jobs_index():
+    """Nightly rebuild of the TF-IDF index behind similar jobs"""
+    build_index(settings.SIMILAR_JOBS_INDEX_DIR)
+
+
+@task(schedule=DAY, concurrency=1)
+def export_jobs_snapshot(incremental=True):
+    """Nightly Parquet snapshot of the rows changed since the previous one"""
+    export_snapshot(settings.JOBS_SNAPSHOT_DIR, incremental=incremental)
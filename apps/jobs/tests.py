@@ -1 +1,156 @@
-# Create your tests here.
+import shutil
+import tempfile
+from datetime import datetime, timedelta, timezone
+from io import StringIO
+from pathlib import Path
+
+import pandas as pd
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from apps.jobs.consts import CHANGE_WATERMARK_OVERLAP
+from apps.jobs.dedupe import (
+    estimated_jaccard,
+    index_jobs,
+    job_text,
+    minhash_signature,
+)
+from apps.jobs.models import Jobs
+from apps.jobs.snapshot import export_snapshot, read_manifest
+
+DESCRIPTION = (
+    "We are hiring a Flutter engineer to build our mobile banking app. You will "
+    "ship features end to end, write tests and work closely with designers."
+)
+
+
+class JobDedupeTestCase(TestCase):
+    def test_signature_similarity_tracks_text_overlap(self):
+        base = minhash_signature(job_text("Flutter Engineer", "Jago", DESCRIPTION))
+        edited = minhash_signature(
+            job_text("Flutter Engineer", "Jago", DESCRIPTION + " Remote friendly.")
+        )
+        other = minhash_signature(job_text("Accountant", "Jago", "Close the books."))
+        self.assertGreater(estimated_jaccard(base, edited), 0.8)
+        self.assertLess(estimated_jaccard(base, other), 0.2)
+
+    def test_backfill_links_existing_duplicates(self):
+        original = Jobs.objects.create(
+            title="Flutter Engineer",
+            company_name="Jago",
+            description=DESCRIPTION,
+            link="https://example.com/jobs/flutter",
+        )
+        repost = Jobs.objects.create(
+            title="Flutter Engineer",
+            company_name="Bank Jago",
+            description=DESCRIPTION,
+            link="https://example.com/jobs/flutter-repost",
+        )
+        unrelated = Jobs.objects.create(
+            title="Accountant",
+            company_name="Jago",
+            description="Close the books every month.",
+            link="https://example.com/jobs/accountant",
+        )
+        call_command("backfill_job_dedupe", workers=2, chunk_size=1, stdout=StringIO())
+        repost.refresh_from_db()
+        unrelated.refresh_from_db()
+        self.assertEqual(repost.canonical_id, original.id)
+        self.assertIsNone(unrelated.canonical_id)
+
+    def test_index_jobs_links_a_batch_in_constant_queries(self):
+        jobs = Jobs.objects.bulk_create(
+            [
+                Jobs(
+                    title="Flutter Engineer",
+                    company_name="Jago",
+                    description=DESCRIPTION,
+                    link=f"https://example.com/jobs/flutter-{i}",
+                )
+                for i in range(12)
+            ]
+        )
+        with CaptureQueriesContext(connection) as queries:
+            index_jobs(jobs)
+        # Fingerprints, buckets, candidates and one bulk update, not per job
+        self.assertLess(len(queries), 12)
+        canonical_ids = set(
+            Jobs.objects.exclude(id=jobs[0].id).values_list("canonical_id", flat=True)
+        )
+        self.assertEqual(canonical_ids, {jobs[0].id})
+
+
+class JobsSnapshotTestCase(TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        Jobs.objects.create(
+            title="Data Engineer",
+            description="",
+            link="https://example.com/jobs/data",
+            hard_skills=["Python", "SQL"],
+            posted_on=datetime(2025, 5, 3, tzinfo=timezone.utc),
+            source_platform="linkedin.com",
+        )
+        Jobs.objects.create(
+            title="Designer",
+            description="",
+            link="https://example.com/jobs/design",
+            posted_on=None,
+        )
+
+    def read(self, snapshot):
+        return pd.read_parquet(Path(self.directory) / snapshot["path"])
+
+    def test_full_snapshot_is_partitioned_with_arrays(self):
+        snapshot = export_snapshot(self.directory, chunk_size=1)
+        self.assertEqual(snapshot["kind"], "full")
+        self.assertEqual(snapshot["rows"], 2)
+        self.assertEqual(
+            snapshot["files"],
+            [
+                "posted_month=2025-05/source_platform=linkedin.com/part-00000-0.parquet",
+                "posted_month=unknown/source_platform=weworkremotely.com/part-00001-0.parquet",
+            ],
+        )
+        frame = self.read(snapshot).set_index("title")
+        self.assertEqual(
+            list(frame.loc["Data Engineer", "hard_skills"]), ["Python", "SQL"]
+        )
+        self.assertEqual(read_manifest(self.directory)["snapshots"], [snapshot])
+
+    def test_incremental_snapshot_holds_changed_rows(self):
+        now = datetime.now(timezone.utc)
+        Jobs.objects.filter(title="Data Engineer").update(
+            updated_on=now - timedelta(days=1)
+        )
+        Jobs.objects.filter(title="Designer").update(
+            updated_on=now - timedelta(hours=1)
+        )
+        full = export_snapshot(self.directory)
+        job = Jobs.objects.get(title="Designer")
+        job.title = "Product Designer"
+        job.save()
+
+        snapshot = export_snapshot(self.directory, incremental=True)
+        self.assertEqual(snapshot["kind"], "incremental")
+        self.assertEqual(
+            datetime.fromisoformat(snapshot["since"]),
+            datetime.fromisoformat(full["watermark"]) - CHANGE_WATERMARK_OVERLAP,
+        )
+        self.assertEqual(list(self.read(snapshot)["title"]), ["Product Designer"])
+
+    def test_incremental_snapshot_picks_up_late_commits(self):
+        full = export_snapshot(self.directory)
+        # Stamped before the full snapshot's watermark, committed after it
+        Jobs.objects.filter(title="Data Engineer").update(
+            title="Senior Data Engineer",
+            updated_on=datetime.fromisoformat(full["watermark"]) - timedelta(minutes=1),
+        )
+
+        snapshot = export_snapshot(self.directory, incremental=True)
+        self.assertIn("Senior Data Engineer", list(self.read(snapshot)["title"]))
+        self.assertEqual(snapshot["watermark"], full["watermark"])
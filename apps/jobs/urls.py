@@ -1,8 +1,14 @@
+from django.conf import settings
 from django.urls import path
 
-from .views import JobDetailView, JobListView
+from .views import AsyncJobDetailView, AsyncJobListView, JobDetailView, JobListView
+
+if settings.ASYNC_JOB_VIEWS:
+    list_view, detail_view = AsyncJobListView, AsyncJobDetailView
+else:
+    list_view, detail_view = JobListView, JobDetailView
 
 urlpatterns = [
-    path("", JobListView.as_view(), name="job_list"),
-    path("<str:uid>", JobDetailView.as_view(), name="job_detail"),
+    path("", list_view.as_view(), name="job_list"),
+    path("<str:uid>", detail_view.as_view(), name="job_detail"),
 ]
@@ -1,10 +1,30 @@
+import hashlib
 from datetime import datetime, timedelta
 
-from django.db.models import Q
+from asgiref.sync import sync_to_async
+from django.core.paginator import InvalidPage
+from django.http import Http404
 from django.views.generic import DetailView, ListView
 
-from .consts import EMPLOYMENT_TYPE_CHOICES, WORK_LOCATION_CHOICES
+from .cache import (
+    CachedPaginator,
+    aget_cached_response,
+    aset_cached_response,
+    cached_page,
+    cached_page_result,
+    get_cached_response,
+    query_hash,
+    set_cached_response,
+)
+from .conditional import job_validators, not_modified, set_validators
+from .consts import (
+    EMPLOYMENT_TYPE_CHOICES,
+    SIMILAR_JOBS_DEFAULT,
+    WORK_LOCATION_CHOICES,
+)
 from .models import Jobs
+from .search import search_jobs
+from .similar import similar_jobs
 
 
 class JobListView(ListView):
@@ -15,7 +35,7 @@ class JobListView(ListView):
     ordering = ["-posted_on"]
 
     def get_queryset(self):
-        queryset = Jobs.objects.all()
+        queryset = Jobs.objects.defer("search_vector")
 
         # Filter by employment type
         employment_type = self.request.GET.get("employment_type")
@@ -49,18 +69,21 @@ class JobListView(ListView):
                 month_ago = datetime.now() - timedelta(days=30)
                 queryset = queryset.filter(posted_on__gte=month_ago)
 
-        # Search functionality
+        # Search functionality (ranked, best match first)
         search = self.request.GET.get("search")
         if search:
-            queryset = queryset.filter(
-                Q(title__icontains=search)
-                | Q(description__icontains=search)
-                | Q(location__icontains=search)
-                | Q(company_name__icontains=search)
-            )
+            return search_jobs(queryset, search)
 
         return queryset.order_by("-posted_on")
 
+    def paginate_queryset(self, queryset, page_size):
+        return cached_page(
+            self.request,
+            "job-list",
+            page_size,
+            lambda: super(JobListView, self).paginate_queryset(queryset, page_size),
+        )
+
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context["employment_type_choices"] = EMPLOYMENT_TYPE_CHOICES
@@ -83,8 +106,94 @@ class JobDetailView(DetailView):
     slug_field = "uid"
     slug_url_kwarg = "uid"
 
+    def get(self, request, *args, **kwargs):
+        self.object = self.get_object()
+        return self.render_conditional(request)
+
+    def render_conditional(self, request):
+        # The page embeds the visitor's CSRF token, so it is private and its
+        # ETag changes with that token and with the back link's query string
+        etag, last_modified = job_validators(self.object.uid, self.object.updated_on)
+        digest = hashlib.sha1(
+            f"{etag}|{query_hash(request)}|{request.META.get('CSRF_COOKIE', '')}".encode()
+        ).hexdigest()
+        validators = (f'"{digest}"', last_modified)
+        response = not_modified(request, *validators)
+        if response is None:
+            context = self.get_context_data(object=self.object)
+            response = self.render_to_response(context)
+        return set_validators(response, *validators, public=False)
+
+    def get_object(self, queryset=None):
+        namespace = f"job-detail:{self.kwargs[self.slug_url_kwarg]}"
+        cached = get_cached_response(self.request, namespace)
+        if cached is None:
+            job = super().get_object(queryset)
+            cached = (job, similar_jobs(job, SIMILAR_JOBS_DEFAULT))
+            set_cached_response(self.request, namespace, cached)
+        job, self.similar_jobs = cached
+        return job
+
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         # Preserve query parameters for back button
         context["back_url_params"] = self.request.GET.urlencode()
+        context["similar_jobs"] = self.similar_jobs
         return context
+
+
+class AsyncJobListView(JobListView):
+    """JobListView awaiting the jobs cache and the ORM (ASYNC_JOB_VIEWS)"""
+
+    async def get(self, request, *args, **kwargs):
+        self.object_list = self.get_queryset()
+        page_size = self.get_paginate_by(self.object_list)
+        user = await request.auser()
+        cached = await aget_cached_response(request, "job-list", user)
+        if cached is None:
+            cached = await self.fetch_page(self.object_list, page_size)
+            await aset_cached_response(request, "job-list", user, cached)
+        self.page = cached_page_result(cached, page_size)
+        return self.render_to_response(self.get_context_data())
+
+    async def fetch_page(self, queryset, page_size):
+        """(count, number, rows) of the requested page"""
+        count = await queryset.acount()
+        paginator = CachedPaginator([], count, page_size)
+        page_kwarg = self.page_kwarg
+        number = self.kwargs.get(page_kwarg) or self.request.GET.get(page_kwarg) or 1
+        try:
+            if number == "last":
+                number = paginator.num_pages
+            number = paginator.validate_number(number)
+        except InvalidPage as e:
+            raise Http404(f"Invalid page ({number}): {e}")
+        bottom = (number - 1) * page_size
+        rows = queryset[bottom : bottom + page_size]
+        return count, number, [job async for job in rows.aiterator()]
+
+    def paginate_queryset(self, queryset, page_size):
+        return self.page
+
+
+class AsyncJobDetailView(JobDetailView):
+    """JobDetailView awaiting the jobs cache and the ORM (ASYNC_JOB_VIEWS)"""
+
+    async def get(self, request, *args, **kwargs):
+        self.object = await self.aget_object()
+        return self.render_conditional(request)
+
+    async def aget_object(self):
+        uid = self.kwargs[self.slug_url_kwarg]
+        namespace = f"job-detail:{uid}"
+        user = await self.request.auser()
+        cached = await aget_cached_response(self.request, namespace, user)
+        if cached is None:
+            try:
+                job = await self.get_queryset().aget(uid=uid)
+            except Jobs.DoesNotExist:
+                raise Http404("No job found matching the query")
+            cached = (job, await sync_to_async(similar_jobs)(job, SIMILAR_JOBS_DEFAULT))
+            await aset_cached_response(self.request, namespace, user, cached)
+        job, self.similar_jobs = cached
+        return job
@@ -0,0 +1,18 @@
+from django.contrib import admin
+
+from apps.notifications.models import OutboxEmail
+
+
+@admin.register(OutboxEmail)
+class OutboxEmailAdmin(admin.ModelAdmin):
+    list_display = [
+        "subject",
+        "status",
+        "attempts",
+        "next_attempt_on",
+        "sent_on",
+        "created_on",
+    ]
+    list_filter = ["status"]
+    search_fields = ["subject", "to"]
+    readonly_fields = ["attempts", "last_error", "sent_on"]
@@ -0,0 +1,15 @@
+OUTBOX_STATUS_CHOICES = [
+    ("pending", "Pending"),
+    ("sent", "Sent"),
+    ("failed", "Failed"),
+]
+
+# Emails claimed (and sent over one SMTP connection) per worker batch
+OUTBOX_BATCH_SIZE = 50
+
+# Retry delay after the n-th failed attempt: base * 2 ** (n - 1), capped
+OUTBOX_RETRY_BASE_SECONDS = 30
+OUTBOX_RETRY_MAX_SECONDS = 3600
+
+# An email is marked failed after this many attempts
+OUTBOX_MAX_ATTEMPTS = 8
@@ -0,0 +1,40 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from apps.notifications.consts import OUTBOX_BATCH_SIZE
+from apps.notifications.outbox import send_batch
+
+
+class Command(BaseCommand):
+    help = (
+        "Send queued outbox emails in batches claimed with FOR UPDATE SKIP "
+        "LOCKED; run several workers side by side to send faster"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=OUTBOX_BATCH_SIZE)
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=5.0,
+            help="Seconds to sleep when no email is due",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Send what is due now and exit (e.g. from cron)",
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            sent, failed = send_batch(options["batch_size"])
+            if sent or failed:
+                self.stdout.write(f"Sent {sent} emails, {failed} failed attempts")
+                continue
+            if options["once"]:
+                break
+            time.sleep(options["poll_interval"])
+            # Reconnect if the database dropped the connection while idle
+            close_old_connections()
@@ -0,0 +1,41 @@
+from django.contrib.postgres.fields import ArrayField
+from django.db import models
+from django.utils import timezone
+
+from core.models import BaseModel
+
+from .consts import OUTBOX_STATUS_CHOICES
+
+
+class OutboxEmail(BaseModel):
+    """
+    An email waiting to be sent by the send_outbox_email worker, so requests
+    only pay for an INSERT instead of an SMTP round trip.
+    """
+
+    subject = models.CharField(max_length=255)
+    body = models.TextField()
+    html_message = models.TextField(blank=True, default="")
+    from_email = models.CharField(max_length=255, null=True, blank=True)
+    to = ArrayField(models.CharField(max_length=255))
+    status = models.CharField(
+        max_length=20, choices=OUTBOX_STATUS_CHOICES, default="pending"
+    )
+    attempts = models.PositiveIntegerField(default=0)
+    next_attempt_on = models.DateTimeField(default=timezone.now)
+    last_error = models.TextField(blank=True, default="")
+    sent_on = models.DateTimeField(null=True, blank=True)
+
+    class Meta(BaseModel.Meta):
+        indexes = [
+            *BaseModel.Meta.indexes,
+            # Workers only ever scan due, pending emails
+            models.Index(
+                fields=["next_attempt_on"],
+                condition=models.Q(status="pending"),
+                name="outbox_pending_due_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.subject} -> {', '.join(self.to)}"
@@ -0,0 +1,120 @@
+import logging
+from datetime import timedelta
+
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.db import transaction
+from django.utils import timezone
+
+from .consts import (
+    OUTBOX_BATCH_SIZE,
+    OUTBOX_MAX_ATTEMPTS,
+    OUTBOX_RETRY_BASE_SECONDS,
+    OUTBOX_RETRY_MAX_SECONDS,
+)
+from .models import OutboxEmail
+
+logger = logging.getLogger(__name__)
+
+
+def enqueue_email(subject, body, to, from_email=None, html_message=""):
+    """Queue an email for the outbox worker; the caller only pays for the INSERT"""
+    return OutboxEmail.objects.create(
+        subject=subject,
+        body=body,
+        to=list(to),
+        from_email=from_email,
+        html_message=html_message or "",
+    )
+
+
+def retry_delay(attempts):
+    """Exponential backoff after `attempts` failed attempts"""
+    return timedelta(
+        seconds=min(
+            OUTBOX_RETRY_BASE_SECONDS * 2 ** (attempts - 1), OUTBOX_RETRY_MAX_SECONDS
+        )
+    )
+
+
+def build_message(email, connection):
+    message = EmailMultiAlternatives(
+        email.subject,
+        email.body,
+        email.from_email,
+        email.to,
+        connection=connection,
+    )
+    if email.html_message:
+        message.attach_alternative(email.html_message, "text/html")
+    return message
+
+
+def mark_failed_attempt(email, error, now):
+    email.attempts += 1
+    email.last_error = str(error)
+    if email.attempts >= OUTBOX_MAX_ATTEMPTS:
+        email.status = "failed"
+    else:
+        email.next_attempt_on = now + retry_delay(email.attempts)
+
+
+def send_batch(batch_size=OUTBOX_BATCH_SIZE):
+    """
+    Claim up to `batch_size` due emails and send them over one connection.
+
+    Rows are locked with FOR UPDATE SKIP LOCKED for the whole batch, so
+    concurrent workers claim disjoint batches without waiting on each other.
+    Returns (sent, failed) counts.
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        emails = list(
+            OutboxEmail.objects.select_for_update(skip_locked=True)
+            .filter(status="pending", next_attempt_on__lte=now)
+            .order_by("next_attempt_on")[:batch_size]
+        )
+        if not emails:
+            return 0, 0
+
+        sent = failed = 0
+        connection = get_connection()
+        try:
+            connection.open()
+        except Exception as error:
+            logger.warning("Outbox could not connect to the mail server: %s", error)
+            for email in emails:
+                mark_failed_attempt(email, error, now)
+            failed = len(emails)
+        else:
+            try:
+                for email in emails:
+                    try:
+                        build_message(email, connection).send()
+                    except Exception as error:
+                        logger.warning("Outbox email %s failed: %s", email.uid, error)
+                        mark_failed_attempt(email, error, now)
+                        failed += 1
+                    else:
+                        email.attempts += 1
+                        email.status = "sent"
+                        email.sent_on = timezone.now()
+                        email.last_error = ""
+                        sent += 1
+            finally:
+                connection.close()
+
+        # bulk_update() skips auto_now
+        for email in emails:
+            email.updated_on = timezone.now()
+        OutboxEmail.objects.bulk_update(
+            emails,
+            [
+                "status",
+                "attempts",
+                "next_attempt_on",
+                "last_error",
+                "sent_on",
+                "updated_on",
+            ],
+        )
+    return sent, failed
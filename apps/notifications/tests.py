@@ -0,0 +1,70 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core import mail
+from django.core.mail.backends.base import BaseEmailBackend
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from apps.notifications.consts import OUTBOX_MAX_ATTEMPTS
+from apps.notifications.models import OutboxEmail
+from apps.notifications.outbox import enqueue_email, retry_delay, send_batch
+
+
+class FailingBackend(BaseEmailBackend):
+    def send_messages(self, email_messages):
+        raise ConnectionRefusedError("SMTP down")
+
+
+class OutboxTestCase(TestCase):
+    def test_forgot_password_only_queues_the_email(self):
+        User.objects.create_user(
+            username="reset", email="reset@example.com", password="x"
+        )
+        response = APIClient().post(
+            "/api/v1/auth/forgot-password/", {"email": "reset@example.com"}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(mail.outbox), 0)
+        email = OutboxEmail.objects.get()
+        self.assertEqual(email.to, ["reset@example.com"])
+
+        call_command("send_outbox_email", "--once", stdout=StringIO())
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].to, ["reset@example.com"])
+        self.assertEqual(mail.outbox[0].alternatives[0][1], "text/html")
+        email.refresh_from_db()
+        self.assertEqual(email.status, "sent")
+
+    def test_batch_sends_due_emails_only(self):
+        for i in range(3):
+            enqueue_email(f"Hello {i}", "Body", [f"user{i}@example.com"])
+        later = enqueue_email("Later", "Body", ["later@example.com"])
+        later.next_attempt_on = timezone.now() + timedelta(hours=1)
+        later.save()
+
+        self.assertEqual(send_batch(batch_size=2), (2, 0))
+        self.assertEqual(send_batch(batch_size=2), (1, 0))
+        self.assertEqual(send_batch(batch_size=2), (0, 0))
+        self.assertEqual(len(mail.outbox), 3)
+
+    @override_settings(EMAIL_BACKEND="apps.notifications.tests.FailingBackend")
+    def test_failures_back_off_and_give_up(self):
+        email = enqueue_email("Hello", "Body", ["user@example.com"])
+        before = timezone.now()
+        self.assertEqual(send_batch(), (0, 1))
+        email.refresh_from_db()
+        self.assertEqual((email.status, email.attempts), ("pending", 1))
+        self.assertIn("SMTP down", email.last_error)
+        self.assertGreaterEqual(email.next_attempt_on, before + retry_delay(1))
+        self.assertEqual(send_batch(), (0, 0))
+
+        OutboxEmail.objects.filter(pk=email.pk).update(
+            attempts=OUTBOX_MAX_ATTEMPTS - 1, next_attempt_on=timezone.now()
+        )
+        send_batch()
+        email.refresh_from_db()
+        self.assertEqual(email.status, "failed")
@@ -0,0 +1,171 @@
+import copy
+import threading
+import time
+import uuid
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import caches
+from rest_framework.authentication import TokenAuthentication
+from rest_framework.authtoken.models import Token
+
+SHARED_KEY_PREFIX = "auth-token:"
+VERSION_KEY_PREFIX = "auth-token-version:"
+
+
+class TokenCache:
+    """
+    Bounded LRU of token key -> (user, token), with a TTL per entry and an
+    optional second tier in the shared cache (AUTH_TOKEN_CACHE).
+
+    With a shared cache every token key also has a version there. Entries are
+    only served while the version they were loaded under is current, so an
+    invalidation in one process (see apps.profiles.signals) reaches all of
+    them, at the cost of one shared cache round trip per lookup. Without one,
+    other processes drop their local copy when its TTL runs out.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.shared_hits = 0
+        self.misses = 0
+        # Bumped by every invalidation, so a lookup that raced with one is not stored
+        self.generation = 0
+
+    @property
+    def shared(self):
+        alias = settings.AUTH_TOKEN_CACHE
+        return caches[alias] if alias else None
+
+    def shared_version(self, key, version):
+        """`version` of `key` from the shared cache, or a new one if it has none"""
+        if version is None:
+            version = uuid.uuid4().hex
+            if not self.shared.add(VERSION_KEY_PREFIX + key, version, timeout=None):
+                version = self.shared.get(VERSION_KEY_PREFIX + key, version)
+        return version
+
+    def get(self, key):
+        return self.lookup(key)[0]
+
+    def lookup(self, key):
+        """
+        ((user, token) or None, version). A miss is stored with set() under the
+        version returned here, which no later invalidation will match.
+        """
+        now = time.monotonic()
+        shared, shared_version, value = self.shared, None, None
+        if shared is not None:
+            # The version and the shared entry in one round trip
+            values = shared.get_many(
+                [VERSION_KEY_PREFIX + key, SHARED_KEY_PREFIX + key]
+            )
+            shared_version = self.shared_version(
+                key, values.get(VERSION_KEY_PREFIX + key)
+            )
+            value = values.get(SHARED_KEY_PREFIX + key)
+        with self.lock:
+            version = (self.generation, shared_version)
+            entry = self.entries.get(key)
+            if entry is not None and entry[2] > now and entry[3] == shared_version:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return (entry[0], entry[1]), version
+            self.entries.pop(key, None)
+        if value is not None and value[2] == shared_version:
+            self.set_local(key, value[0], value[1], version)
+            with self.lock:
+                self.shared_hits += 1
+            return (value[0], value[1]), version
+        with self.lock:
+            self.misses += 1
+        return None, version
+
+    def set(self, key, user, token, version):
+        if not self.set_local(key, user, token, version):
+            return
+        if self.shared is not None:
+            self.shared.set(
+                SHARED_KEY_PREFIX + key,
+                (user, token, version[1]),
+                timeout=settings.AUTH_TOKEN_CACHE_TIMEOUT,
+            )
+
+    def set_local(self, key, user, token, version):
+        expires = time.monotonic() + settings.AUTH_TOKEN_CACHE_TIMEOUT
+        generation, shared_version = version
+        with self.lock:
+            if generation != self.generation:
+                return False
+            self.entries[key] = (user, token, expires, shared_version)
+            self.entries.move_to_end(key)
+            while len(self.entries) > settings.AUTH_TOKEN_CACHE_SIZE:
+                self.entries.popitem(last=False)
+        return True
+
+    def invalidate_user(self, user_id, keys=()):
+        """
+        Forget `user_id`'s entries, plus `keys` (e.g. a just deleted token), in
+        this process and, through new versions, in every process
+        """
+        with self.lock:
+            stale = {
+                key
+                for key, (user, _, _, _) in self.entries.items()
+                if user.pk == user_id
+            }
+            stale.update(keys)
+            self.generation += 1
+            for key in stale:
+                self.entries.pop(key, None)
+        if self.shared is not None:
+            stale.update(
+                Token.objects.filter(user_id=user_id).values_list("key", flat=True)
+            )
+            self.shared.set_many(
+                {VERSION_KEY_PREFIX + key: uuid.uuid4().hex for key in stale},
+                timeout=None,
+            )
+            self.shared.delete_many([SHARED_KEY_PREFIX + key for key in stale])
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.hits = self.shared_hits = self.misses = 0
+
+    def stats(self):
+        with self.lock:
+            hits = self.hits + self.shared_hits
+            total = hits + self.misses
+            return {
+                "hits": self.hits,
+                "shared_hits": self.shared_hits,
+                "misses": self.misses,
+                "hit_ratio": round(hits / total, 4) if total else 0.0,
+                "size": len(self.entries),
+                "max_size": settings.AUTH_TOKEN_CACHE_SIZE,
+            }
+
+
+token_cache = TokenCache()
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """
+    TokenAuthentication that keeps recently seen tokens in token_cache, so
+    most authenticated requests skip the Token + User query.
+    """
+
+    def authenticate_credentials(self, key):
+        cached, version = token_cache.lookup(key)
+        if cached is None:
+            user, token = super().authenticate_credentials(key)
+            token_cache.set(key, user, token, version)
+        else:
+            user, token = cached
+        # Requests may modify request.user, so each gets its own copy
+        user, token = copy.copy(user), copy.copy(token)
+        token.user = user
+        return user, token
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.1 on 2026-10-18 01:13
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.conf import settings
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        # Enables pg_trgm
+        ("jobs", "0019_trigram_indexes"),
+        ("profiles", "0003_profile_hard_skill_gaps_profile_soft_skill_gaps"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="profile",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("name"), name="gin_trgm_ops"
+                ),
+                name="profiles_name_trgm",
+            ),
+        ),
+    ]
@@ -1,6 +1,8 @@
 import uuid
 
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
+from django.db.models.functions import Upper
 
 from core.models import BaseModel
 
@@ -29,6 +31,16 @@ class Profile(BaseModel):
     soft_skill_gaps = models.JSONField(default=list, blank=True)
     hard_skill_gaps = models.JSONField(default=list, blank=True)
 
+    class Meta(BaseModel.Meta):
+        indexes = [
+            *BaseModel.Meta.indexes,
+            # Serves name__icontains searches in the user list
+            GinIndex(
+                OpClass(Upper("name"), name="gin_trgm_ops"),
+                name="profiles_name_trgm",
+            ),
+        ]
+
     def obfuscate_email(self):
         if self.actor:
             self.actor.username = f"deleted_{uuid.uuid4()}"
@@ -0,0 +1,30 @@
+from django.contrib.auth.models import User
+from django.db import connection, transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from rest_framework.authtoken.models import Token
+
+from .auth import token_cache
+
+
+def invalidate_tokens(user_id, keys=()):
+    """
+    Drop cached tokens of `user_id` now and, inside a transaction, again on
+    commit: another request may cache the old rows until the write commits.
+    """
+    token_cache.invalidate_user(user_id, keys)
+    if connection.in_atomic_block:
+        transaction.on_commit(lambda: token_cache.invalidate_user(user_id, keys))
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_user_tokens(sender, instance, **kwargs):
+    # Password changes and resets, email obfuscation, deactivation
+    invalidate_tokens(instance.pk)
+
+
+@receiver(post_save, sender=Token)
+@receiver(post_delete, sender=Token)
+def invalidate_rotated_token(sender, instance, **kwargs):
+    invalidate_tokens(instance.user_id, keys=[instance.key])
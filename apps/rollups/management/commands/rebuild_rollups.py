@@ -0,0 +1,93 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+
+# (rollup table, source table, dimension expressions, aggregate expressions)
+ROLLUPS = [
+    (
+        "rollups_jobsdailyrollup",
+        "jobs_jobs",
+        {
+            "source_platform": "source_platform",
+            "employment_type": "employment_type",
+            "work_location": "work_location",
+            "job_title_category": "job_title_category",
+            "is_duplicate": "canonical_id IS NOT NULL",
+        },
+        {"count": "count(*)"},
+    ),
+    (
+        "rollups_assessmentdailyrollup",
+        "jobs_jobassessment",
+        {},
+        {"count": "count(*)", "score_sum": "coalesce(sum(score), 0)"},
+    ),
+    (
+        "rollups_profiledailyrollup",
+        "profiles_profile",
+        {},
+        {"count": "count(*)"},
+    ),
+]
+
+
+def fresh_rollup_sql(source, columns, aggregates):
+    select = ", ".join(
+        ["(created_on AT TIME ZONE 'UTC')::date AS day"]
+        + [f"{expr} AS {name}" for name, expr in columns.items()]
+        + [f"{expr} AS {name}" for name, expr in aggregates.items()]
+    )
+    group_by = ", ".join(str(i) for i in range(1, len(columns) + 2))
+    return f"SELECT {select} FROM {source} GROUP BY {group_by}"
+
+
+class Command(BaseCommand):
+    help = "Rebuild the dashboard/statistics rollup tables from the source tables"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Only compare rollups with a fresh aggregation; exit non-zero on drift",
+        )
+
+    def handle(self, *args, **options):
+        if options["check"]:
+            self.check_rollups()
+        else:
+            self.rebuild_rollups()
+
+    def rebuild_rollups(self):
+        with transaction.atomic(), connection.cursor() as cursor:
+            # Block writers so triggers cannot interleave with the rebuild
+            sources = ", ".join(source for _, source, _, _ in ROLLUPS)
+            cursor.execute(f"LOCK TABLE {sources} IN SHARE MODE")
+            for table, source, columns, aggregates in ROLLUPS:
+                cursor.execute(f"DELETE FROM {table}")
+                target = ", ".join(["day", *columns, *aggregates])
+                cursor.execute(
+                    f"INSERT INTO {table} ({target}) "
+                    + fresh_rollup_sql(source, columns, aggregates)
+                )
+                self.stdout.write(f"{table}: {cursor.rowcount} buckets")
+        self.stdout.write(self.style.SUCCESS("Rollups rebuilt"))
+
+    def check_rollups(self):
+        drifted = 0
+        with connection.cursor() as cursor:
+            # Each comparison is a single statement, so it sees one snapshot
+            for table, source, columns, aggregates in ROLLUPS:
+                target = ", ".join(["day", *columns, *aggregates])
+                stored = f"SELECT {target} FROM {table} WHERE count <> 0"
+                fresh = fresh_rollup_sql(source, columns, aggregates)
+                cursor.execute(
+                    f"SELECT count(*) FROM (({stored} EXCEPT {fresh}) "
+                    f"UNION ALL ({fresh} EXCEPT {stored})) AS diff"
+                )
+                mismatches = cursor.fetchone()[0]
+                drifted += mismatches
+                self.stdout.write(f"{table}: {mismatches} mismatched buckets")
+        if drifted:
+            raise CommandError(
+                f"{drifted} rollup buckets drifted; run rebuild_rollups to repair"
+            )
+        self.stdout.write(self.style.SUCCESS("Rollups are consistent"))
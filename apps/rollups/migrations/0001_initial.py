@@ -0,0 +1,248 @@
+# Generated by Django 5.2.1 on 2026-10-18 00:58
+
+from django.db import migrations, models
+
+ROLLUP_TRIGGERS_SQL = """
+CREATE OR REPLACE FUNCTION rollups_jobs_bump(
+    p_created_on timestamptz,
+    p_source_platform varchar,
+    p_employment_type varchar,
+    p_work_location varchar,
+    p_job_title_category varchar,
+    p_delta bigint
+) RETURNS void AS $$
+BEGIN
+    INSERT INTO rollups_jobsdailyrollup
+        (day, source_platform, employment_type, work_location, job_title_category, count)
+    VALUES (
+        (p_created_on AT TIME ZONE 'UTC')::date,
+        p_source_platform,
+        p_employment_type,
+        p_work_location,
+        p_job_title_category,
+        p_delta
+    )
+    ON CONFLICT (day, source_platform, employment_type, work_location, job_title_category)
+    DO UPDATE SET count = rollups_jobsdailyrollup.count + EXCLUDED.count;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION rollups_jobs_trigger() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        PERFORM rollups_jobs_bump(
+            OLD.created_on, OLD.source_platform, OLD.employment_type,
+            OLD.work_location, OLD.job_title_category, -1
+        );
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        PERFORM rollups_jobs_bump(
+            NEW.created_on, NEW.source_platform, NEW.employment_type,
+            NEW.work_location, NEW.job_title_category, 1
+        );
+    END IF;
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER rollups_jobs_insert_delete
+AFTER INSERT OR DELETE ON jobs_jobs
+FOR EACH ROW EXECUTE FUNCTION rollups_jobs_trigger();
+
+CREATE TRIGGER rollups_jobs_update
+AFTER UPDATE ON jobs_jobs
+FOR EACH ROW
+WHEN (
+    (OLD.created_on, OLD.source_platform, OLD.employment_type,
+     OLD.work_location, OLD.job_title_category)
+    IS DISTINCT FROM
+    (NEW.created_on, NEW.source_platform, NEW.employment_type,
+     NEW.work_location, NEW.job_title_category)
+)
+EXECUTE FUNCTION rollups_jobs_trigger();
+
+CREATE OR REPLACE FUNCTION rollups_assessment_bump(
+    p_created_on timestamptz, p_count bigint, p_score bigint
+) RETURNS void AS $$
+BEGIN
+    INSERT INTO rollups_assessmentdailyrollup (day, count, score_sum)
+    VALUES ((p_created_on AT TIME ZONE 'UTC')::date, p_count, p_score)
+    ON CONFLICT (day) DO UPDATE SET
+        count = rollups_assessmentdailyrollup.count + EXCLUDED.count,
+        score_sum = rollups_assessmentdailyrollup.score_sum + EXCLUDED.score_sum;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION rollups_assessment_trigger() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        PERFORM rollups_assessment_bump(OLD.created_on, -1, -OLD.score);
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        PERFORM rollups_assessment_bump(NEW.created_on, 1, NEW.score);
+    END IF;
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER rollups_assessment_insert_delete
+AFTER INSERT OR DELETE ON jobs_jobassessment
+FOR EACH ROW EXECUTE FUNCTION rollups_assessment_trigger();
+
+CREATE TRIGGER rollups_assessment_update
+AFTER UPDATE ON jobs_jobassessment
+FOR EACH ROW
+WHEN ((OLD.created_on, OLD.score) IS DISTINCT FROM (NEW.created_on, NEW.score))
+EXECUTE FUNCTION rollups_assessment_trigger();
+
+CREATE OR REPLACE FUNCTION rollups_profile_bump(
+    p_created_on timestamptz, p_count bigint
+) RETURNS void AS $$
+BEGIN
+    INSERT INTO rollups_profiledailyrollup (day, count)
+    VALUES ((p_created_on AT TIME ZONE 'UTC')::date, p_count)
+    ON CONFLICT (day) DO UPDATE SET
+        count = rollups_profiledailyrollup.count + EXCLUDED.count;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION rollups_profile_trigger() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        PERFORM rollups_profile_bump(OLD.created_on, -1);
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        PERFORM rollups_profile_bump(NEW.created_on, 1);
+    END IF;
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER rollups_profile_insert_delete
+AFTER INSERT OR DELETE ON profiles_profile
+FOR EACH ROW EXECUTE FUNCTION rollups_profile_trigger();
+
+CREATE TRIGGER rollups_profile_update
+AFTER UPDATE ON profiles_profile
+FOR EACH ROW
+WHEN (OLD.created_on IS DISTINCT FROM NEW.created_on)
+EXECUTE FUNCTION rollups_profile_trigger();
+"""
+
+DROP_ROLLUP_TRIGGERS_SQL = """
+DROP TRIGGER IF EXISTS rollups_jobs_insert_delete ON jobs_jobs;
+DROP TRIGGER IF EXISTS rollups_jobs_update ON jobs_jobs;
+DROP TRIGGER IF EXISTS rollups_assessment_insert_delete ON jobs_jobassessment;
+DROP TRIGGER IF EXISTS rollups_assessment_update ON jobs_jobassessment;
+DROP TRIGGER IF EXISTS rollups_profile_insert_delete ON profiles_profile;
+DROP TRIGGER IF EXISTS rollups_profile_update ON profiles_profile;
+DROP FUNCTION IF EXISTS rollups_jobs_trigger();
+DROP FUNCTION IF EXISTS rollups_jobs_bump(
+    timestamptz, varchar, varchar, varchar, varchar, bigint
+);
+DROP FUNCTION IF EXISTS rollups_assessment_trigger();
+DROP FUNCTION IF EXISTS rollups_assessment_bump(timestamptz, bigint, bigint);
+DROP FUNCTION IF EXISTS rollups_profile_trigger();
+DROP FUNCTION IF EXISTS rollups_profile_bump(timestamptz, bigint);
+"""
+
+BACKFILL_SQL = """
+INSERT INTO rollups_jobsdailyrollup
+    (day, source_platform, employment_type, work_location, job_title_category, count)
+SELECT (created_on AT TIME ZONE 'UTC')::date, source_platform, employment_type,
+       work_location, job_title_category, count(*)
+FROM jobs_jobs
+GROUP BY 1, 2, 3, 4, 5;
+
+INSERT INTO rollups_assessmentdailyrollup (day, count, score_sum)
+SELECT (created_on AT TIME ZONE 'UTC')::date, count(*), coalesce(sum(score), 0)
+FROM jobs_jobassessment
+GROUP BY 1;
+
+INSERT INTO rollups_profiledailyrollup (day, count)
+SELECT (created_on AT TIME ZONE 'UTC')::date, count(*)
+FROM profiles_profile
+GROUP BY 1;
+"""
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ("jobs", "0013_jobs_search_vector"),
+        ("profiles", "0003_profile_hard_skill_gaps_profile_soft_skill_gaps"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="AssessmentDailyRollup",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("day", models.DateField(unique=True)),
+                ("count", models.BigIntegerField(default=0)),
+                ("score_sum", models.BigIntegerField(default=0)),
+            ],
+        ),
+        migrations.CreateModel(
+            name="ProfileDailyRollup",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("day", models.DateField(unique=True)),
+                ("count", models.BigIntegerField(default=0)),
+            ],
+        ),
+        migrations.CreateModel(
+            name="JobsDailyRollup",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("day", models.DateField()),
+                ("source_platform", models.CharField(max_length=255)),
+                ("employment_type", models.CharField(max_length=255)),
+                ("work_location", models.CharField(max_length=255)),
+                ("job_title_category", models.CharField(max_length=255)),
+                ("count", models.BigIntegerField(default=0)),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=(
+                            "day",
+                            "source_platform",
+                            "employment_type",
+                            "work_location",
+                            "job_title_category",
+                        ),
+                        name="rollups_jobs_daily_bucket_unique",
+                    )
+                ],
+            },
+        ),
+        migrations.RunSQL(ROLLUP_TRIGGERS_SQL, reverse_sql=DROP_ROLLUP_TRIGGERS_SQL),
+        migrations.RunSQL(BACKFILL_SQL, reverse_sql=migrations.RunSQL.noop),
+    ]
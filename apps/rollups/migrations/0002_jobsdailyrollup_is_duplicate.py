@@ -0,0 +1,171 @@
+# Generated by Django 5.2.1 on 2026-10-18 01:05
+
+from django.db import migrations, models
+
+JOBS_ROLLUP_TRIGGER_SQL = """
+DROP TRIGGER IF EXISTS rollups_jobs_update ON jobs_jobs;
+DROP FUNCTION IF EXISTS rollups_jobs_bump(
+    timestamptz, varchar, varchar, varchar, varchar, bigint
+);
+
+CREATE OR REPLACE FUNCTION rollups_jobs_bump(
+    p_created_on timestamptz,
+    p_source_platform varchar,
+    p_employment_type varchar,
+    p_work_location varchar,
+    p_job_title_category varchar,
+    p_is_duplicate boolean,
+    p_delta bigint
+) RETURNS void AS $$
+BEGIN
+    INSERT INTO rollups_jobsdailyrollup (
+        day, source_platform, employment_type, work_location,
+        job_title_category, is_duplicate, count
+    )
+    VALUES (
+        (p_created_on AT TIME ZONE 'UTC')::date,
+        p_source_platform,
+        p_employment_type,
+        p_work_location,
+        p_job_title_category,
+        p_is_duplicate,
+        p_delta
+    )
+    ON CONFLICT (
+        day, source_platform, employment_type, work_location,
+        job_title_category, is_duplicate
+    )
+    DO UPDATE SET count = rollups_jobsdailyrollup.count + EXCLUDED.count;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION rollups_jobs_trigger() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        PERFORM rollups_jobs_bump(
+            OLD.created_on, OLD.source_platform, OLD.employment_type,
+            OLD.work_location, OLD.job_title_category,
+            OLD.canonical_id IS NOT NULL, -1
+        );
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        PERFORM rollups_jobs_bump(
+            NEW.created_on, NEW.source_platform, NEW.employment_type,
+            NEW.work_location, NEW.job_title_category,
+            NEW.canonical_id IS NOT NULL, 1
+        );
+    END IF;
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER rollups_jobs_update
+AFTER UPDATE ON jobs_jobs
+FOR EACH ROW
+WHEN (
+    (OLD.created_on, OLD.source_platform, OLD.employment_type,
+     OLD.work_location, OLD.job_title_category, OLD.canonical_id IS NULL)
+    IS DISTINCT FROM
+    (NEW.created_on, NEW.source_platform, NEW.employment_type,
+     NEW.work_location, NEW.job_title_category, NEW.canonical_id IS NULL)
+)
+EXECUTE FUNCTION rollups_jobs_trigger();
+"""
+
+PREVIOUS_JOBS_ROLLUP_TRIGGER_SQL = """
+DROP TRIGGER IF EXISTS rollups_jobs_update ON jobs_jobs;
+DROP FUNCTION IF EXISTS rollups_jobs_bump(
+    timestamptz, varchar, varchar, varchar, varchar, boolean, bigint
+);
+
+CREATE OR REPLACE FUNCTION rollups_jobs_bump(
+    p_created_on timestamptz,
+    p_source_platform varchar,
+    p_employment_type varchar,
+    p_work_location varchar,
+    p_job_title_category varchar,
+    p_delta bigint
+) RETURNS void AS $$
+BEGIN
+    INSERT INTO rollups_jobsdailyrollup
+        (day, source_platform, employment_type, work_location, job_title_category, count)
+    VALUES (
+        (p_created_on AT TIME ZONE 'UTC')::date,
+        p_source_platform,
+        p_employment_type,
+        p_work_location,
+        p_job_title_category,
+        p_delta
+    )
+    ON CONFLICT (day, source_platform, employment_type, work_location, job_title_category)
+    DO UPDATE SET count = rollups_jobsdailyrollup.count + EXCLUDED.count;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION rollups_jobs_trigger() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        PERFORM rollups_jobs_bump(
+            OLD.created_on, OLD.source_platform, OLD.employment_type,
+            OLD.work_location, OLD.job_title_category, -1
+        );
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        PERFORM rollups_jobs_bump(
+            NEW.created_on, NEW.source_platform, NEW.employment_type,
+            NEW.work_location, NEW.job_title_category, 1
+        );
+    END IF;
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER rollups_jobs_update
+AFTER UPDATE ON jobs_jobs
+FOR EACH ROW
+WHEN (
+    (OLD.created_on, OLD.source_platform, OLD.employment_type,
+     OLD.work_location, OLD.job_title_category)
+    IS DISTINCT FROM
+    (NEW.created_on, NEW.source_platform, NEW.employment_type,
+     NEW.work_location, NEW.job_title_category)
+)
+EXECUTE FUNCTION rollups_jobs_trigger();
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("rollups", "0001_initial"),
+        ("jobs", "0017_job_near_duplicates"),
+    ]
+
+    operations = [
+        migrations.RemoveConstraint(
+            model_name="jobsdailyrollup",
+            name="rollups_jobs_daily_bucket_unique",
+        ),
+        migrations.AddField(
+            model_name="jobsdailyrollup",
+            name="is_duplicate",
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddConstraint(
+            model_name="jobsdailyrollup",
+            constraint=models.UniqueConstraint(
+                fields=(
+                    "day",
+                    "source_platform",
+                    "employment_type",
+                    "work_location",
+                    "job_title_category",
+                    "is_duplicate",
+                ),
+                name="rollups_jobs_daily_bucket_uniq",
+            ),
+        ),
+        migrations.RunSQL(
+            JOBS_ROLLUP_TRIGGER_SQL, reverse_sql=PREVIOUS_JOBS_ROLLUP_TRIGGER_SQL
+        ),
+    ]
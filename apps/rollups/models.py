@@ -0,0 +1,43 @@
+from django.db import models
+
+# Rollup rows are maintained by database triggers on jobs_jobs,
+# jobs_jobassessment and profiles_profile (see migration 0001), so rows written
+# outside Django (e.g. by the n8n workflows) are counted as well.
+# Days are UTC dates of the source row's created_on.
+
+
+class JobsDailyRollup(models.Model):
+    day = models.DateField()
+    source_platform = models.CharField(max_length=255)
+    employment_type = models.CharField(max_length=255)
+    work_location = models.CharField(max_length=255)
+    job_title_category = models.CharField(max_length=255)
+    # Near-duplicates of another posting (Jobs.canonical is set)
+    is_duplicate = models.BooleanField(default=False)
+    count = models.BigIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=[
+                    "day",
+                    "source_platform",
+                    "employment_type",
+                    "work_location",
+                    "job_title_category",
+                    "is_duplicate",
+                ],
+                name="rollups_jobs_daily_bucket_uniq",
+            )
+        ]
+
+
+class AssessmentDailyRollup(models.Model):
+    day = models.DateField(unique=True)
+    count = models.BigIntegerField(default=0)
+    score_sum = models.BigIntegerField(default=0)
+
+
+class ProfileDailyRollup(models.Model):
+    day = models.DateField(unique=True)
+    count = models.BigIntegerField(default=0)
@@ -0,0 +1,67 @@
+from django.db.models import Sum
+
+from apps.jobs.facets import facet_counts
+
+from .models import AssessmentDailyRollup, JobsDailyRollup, ProfileDailyRollup
+
+
+def job_buckets(category=None):
+    """
+    Job counts per (employment_type, work_location, job_title_category),
+    summed over all days. Near-duplicate postings are not counted.
+    Optionally restricted to one category (iexact).
+    """
+    queryset = JobsDailyRollup.objects.filter(count__gt=0, is_duplicate=False)
+    if category:
+        queryset = queryset.filter(job_title_category__iexact=category)
+    return (
+        queryset.values("employment_type", "work_location", "job_title_category")
+        .annotate(count=Sum("count"))
+        .order_by()
+    )
+
+
+def job_facets(fields, include_duplicates=False):
+    """Facet counts over all jobs (see apps.jobs.facets), read from the rollup"""
+    queryset = JobsDailyRollup.objects.all()
+    if not include_duplicates:
+        queryset = queryset.filter(is_duplicate=False)
+    return facet_counts(queryset, fields, count_field="count")
+
+
+def job_distribution(field):
+    """
+    Job counts grouped by one rollup dimension, largest first. Like the
+    statistics and facets, near-duplicate postings are not counted.
+    """
+    return (
+        JobsDailyRollup.objects.filter(is_duplicate=False)
+        .values(field)
+        .annotate(count=Sum("count"))
+        .filter(count__gt=0)
+        .order_by("-count")
+    )
+
+
+def total_jobs(day=None):
+    """Number of jobs, optionally posted on `day`, not counting near-duplicates"""
+    queryset = JobsDailyRollup.objects.filter(is_duplicate=False)
+    if day:
+        queryset = queryset.filter(day=day)
+    return queryset.aggregate(total=Sum("count"))["total"] or 0
+
+
+def total_profiles(day=None):
+    queryset = ProfileDailyRollup.objects.all()
+    if day:
+        queryset = queryset.filter(day=day)
+    return queryset.aggregate(total=Sum("count"))["total"] or 0
+
+
+def assessment_totals(day=None):
+    """Return (count, score_sum) of job assessments"""
+    queryset = AssessmentDailyRollup.objects.all()
+    if day:
+        queryset = queryset.filter(day=day)
+    totals = queryset.aggregate(count=Sum("count"), score_sum=Sum("score_sum"))
+    return totals["count"] or 0, totals["score_sum"] or 0
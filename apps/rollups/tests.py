@@ -0,0 +1,95 @@
+from io import StringIO
+
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+
+from apps.jobs.models import JobAssessment, Jobs
+from apps.profiles.models import Profile
+from apps.rollups.models import JobsDailyRollup
+from apps.rollups.queries import (
+    assessment_totals,
+    job_buckets,
+    job_distribution,
+    total_jobs,
+    total_profiles,
+)
+
+
+class RollupTriggerTestCase(TestCase):
+    def setUp(self):
+        self.job = Jobs.objects.create(
+            title="Backend Engineer",
+            description="",
+            link="https://example.com/jobs/rollup-1",
+            job_title_category="engineering",
+        )
+        self.profile = Profile.objects.create(name="Rollup User")
+
+    def test_insert_update_delete_keep_counts(self):
+        Jobs.objects.create(
+            title="Designer",
+            description="",
+            link="https://example.com/jobs/rollup-2",
+            job_title_category="design",
+            work_location="onsite",
+        )
+        self.assertEqual(total_jobs(), 2)
+
+        self.job.work_location = "hybrid"
+        self.job.save()
+        locations = {
+            row["work_location"]: row["count"]
+            for row in job_distribution("work_location")
+        }
+        self.assertEqual(locations, {"onsite": 1, "hybrid": 1})
+
+        self.job.delete()
+        self.assertEqual(total_jobs(), 1)
+        self.assertEqual(
+            list(job_buckets(category="DESIGN")),
+            [
+                {
+                    "employment_type": "full_time",
+                    "work_location": "onsite",
+                    "job_title_category": "design",
+                    "count": 1,
+                }
+            ],
+        )
+
+    def test_dashboard_totals_skip_duplicates(self):
+        Jobs.objects.create(
+            title="Backend Engineer",
+            description="",
+            link="https://example.com/jobs/rollup-repost",
+            job_title_category="engineering",
+            canonical=self.job,
+        )
+        self.assertEqual(total_jobs(), 1)
+        self.assertEqual(
+            list(job_distribution("job_title_category")),
+            [{"job_title_category": "engineering", "count": 1}],
+        )
+
+    def test_assessment_and_profile_totals(self):
+        assessment = JobAssessment.objects.create(
+            job=self.job, profile=self.profile, summary="", score=70
+        )
+        JobAssessment.objects.create(
+            job=self.job, profile=self.profile, summary="", score=90
+        )
+        self.assertEqual(assessment_totals(), (2, 160))
+
+        assessment.score = 50
+        assessment.save()
+        self.assertEqual(assessment_totals(), (2, 140))
+        self.assertEqual(total_profiles(), 1)
+
+    def test_rebuild_and_check(self):
+        JobsDailyRollup.objects.update(count=5)
+        with self.assertRaises(CommandError):
+            call_command("rebuild_rollups", check=True, stdout=StringIO())
+
+        call_command("rebuild_rollups", stdout=StringIO())
+        call_command("rebuild_rollups", check=True, stdout=StringIO())
+        self.assertEqual(total_jobs(), 1)
@@ -0,0 +1,26 @@
+from django.contrib import admin
+
+from apps.tasks.models import PeriodicTask, Task
+
+
+@admin.register(Task)
+class TaskAdmin(admin.ModelAdmin):
+    list_display = [
+        "name",
+        "status",
+        "priority",
+        "attempts",
+        "run_after",
+        "started_on",
+        "finished_on",
+        "worker",
+    ]
+    list_filter = ["status", "name"]
+    search_fields = ["name", "uid"]
+    readonly_fields = ["attempts", "worker", "started_on", "finished_on", "last_error"]
+
+
+@admin.register(PeriodicTask)
+class PeriodicTaskAdmin(admin.ModelAdmin):
+    list_display = ["name", "interval_seconds", "next_run_on", "enabled"]
+    list_filter = ["enabled"]
@@ -0,0 +1,22 @@
+TASK_STATUS_CHOICES = [
+    ("queued", "Queued"),
+    ("running", "Running"),
+    ("succeeded", "Succeeded"),
+    ("failed", "Failed"),
+]
+
+# Default attempts per task before it is marked failed
+TASK_MAX_ATTEMPTS = 3
+
+# Retry delay after the n-th failed attempt: base * 2 ** (n - 1), capped
+TASK_RETRY_BASE_SECONDS = 10
+TASK_RETRY_MAX_SECONDS = 3600
+
+# Default seconds a worker may hold a task before it is handed to another one
+TASK_TIMEOUT_SECONDS = 3600
+
+# Queued tasks locked per claim; ones over their concurrency limit are skipped
+TASK_CLAIM_CANDIDATES = 20
+
+# Window of finished tasks the latency stats are computed over
+TASK_STATS_WINDOW_SECONDS = 3600
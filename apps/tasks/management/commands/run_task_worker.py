@@ -0,0 +1,96 @@
+import multiprocessing
+import os
+import signal
+import socket
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from apps.tasks.queue import (
+    claim_task,
+    enqueue_periodic_tasks,
+    requeue_expired,
+    run_task,
+    sync_periodic_tasks,
+)
+from core.db import close_connection_pools
+
+
+def work(poll_interval, burst, stop):
+    """Claim and run tasks until `stop` is set (or, in burst mode, none is due)"""
+    worker = f"{socket.gethostname()}:{os.getpid()}"
+    housekeeping_on = 0.0
+    while not stop.is_set():
+        if time.monotonic() - housekeeping_on >= poll_interval:
+            requeue_expired()
+            enqueue_periodic_tasks()
+            housekeeping_on = time.monotonic()
+        task = claim_task(worker)
+        if task is not None:
+            run_task(task)
+            continue
+        if burst:
+            break
+        stop.wait(poll_interval)
+        # Reconnect if the database dropped the connection while idle
+        close_old_connections()
+
+
+def run_worker(poll_interval, burst, stop):
+    # Finish the current task on SIGTERM/SIGINT instead of dying mid-run
+    previous = {
+        signum: signal.signal(signum, lambda *_: stop.set())
+        for signum in (signal.SIGTERM, signal.SIGINT)
+    }
+    try:
+        work(poll_interval, burst, stop)
+    finally:
+        for signum, handler in previous.items():
+            signal.signal(signum, handler)
+
+
+class Command(BaseCommand):
+    help = (
+        "Run background tasks from the Postgres task queue, claiming them with "
+        "FOR UPDATE SKIP LOCKED from one or more worker processes"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--processes", type=int, default=1, help="Worker processes to fork"
+        )
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=1.0,
+            help="Seconds to sleep when no task is due",
+        )
+        parser.add_argument(
+            "--burst",
+            action="store_true",
+            help="Exit once no task is due (e.g. from cron or in tests)",
+        )
+
+    def handle(self, *args, **options):
+        sync_periodic_tasks()
+        context = multiprocessing.get_context("fork")
+        stop = context.Event()
+        args = (options["poll_interval"], options["burst"], stop)
+        if options["processes"] == 1:
+            run_worker(*args)
+            return
+
+        # Children must not share the parent's connections or pool
+        close_connection_pools()
+        processes = [
+            context.Process(target=run_worker, args=args, daemon=True)
+            for _ in range(options["processes"])
+        ]
+        for process in processes:
+            process.start()
+        self.stdout.write(f"Started {len(processes)} task workers")
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            signal.signal(signum, lambda *_: stop.set())
+        for process in processes:
+            process.join()
@@ -0,0 +1,63 @@
+from django.db import models
+from django.utils import timezone
+
+from core.models import BaseModel
+
+from .consts import TASK_MAX_ATTEMPTS, TASK_STATUS_CHOICES
+
+
+class Task(BaseModel):
+    """
+    One run of a registered task function (see apps.tasks.registry), claimed
+    by run_task_worker processes with FOR UPDATE SKIP LOCKED.
+    """
+
+    name = models.CharField(max_length=255, db_index=True)
+    kwargs = models.JSONField(default=dict, blank=True)
+    # Higher runs first
+    priority = models.IntegerField(default=0)
+    status = models.CharField(
+        max_length=20, choices=TASK_STATUS_CHOICES, default="queued"
+    )
+    run_after = models.DateTimeField(default=timezone.now)
+    attempts = models.PositiveIntegerField(default=0)
+    max_attempts = models.PositiveIntegerField(default=TASK_MAX_ATTEMPTS)
+    worker = models.CharField(max_length=255, blank=True, default="")
+    started_on = models.DateTimeField(null=True, blank=True)
+    finished_on = models.DateTimeField(null=True, blank=True)
+    # A running task whose lease expired is requeued (its worker died)
+    lease_expires_on = models.DateTimeField(null=True, blank=True)
+    last_error = models.TextField(blank=True, default="")
+
+    class Meta(BaseModel.Meta):
+        indexes = [
+            *BaseModel.Meta.indexes,
+            # Claims scan this in order: most urgent first, then oldest due
+            models.Index(
+                models.F("priority").desc(),
+                "run_after",
+                condition=models.Q(status="queued"),
+                name="tasks_queued_idx",
+            ),
+            models.Index(
+                fields=["name"],
+                condition=models.Q(status="running"),
+                name="tasks_running_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.name} ({self.status})"
+
+
+class PeriodicTask(BaseModel):
+    """Schedule of a task enqueued every `interval_seconds` by the workers"""
+
+    name = models.CharField(max_length=255, unique=True)
+    kwargs = models.JSONField(default=dict, blank=True)
+    interval_seconds = models.PositiveIntegerField()
+    next_run_on = models.DateTimeField(default=timezone.now)
+    enabled = models.BooleanField(default=True)
+
+    def __str__(self):
+        return self.name
@@ -0,0 +1,206 @@
+import logging
+import traceback
+from datetime import timedelta
+
+from django.db import connection, transaction
+from django.db.models import Avg, Count, F, Max, Q
+from django.utils import timezone
+
+from .consts import (
+    TASK_CLAIM_CANDIDATES,
+    TASK_RETRY_BASE_SECONDS,
+    TASK_RETRY_MAX_SECONDS,
+    TASK_STATS_WINDOW_SECONDS,
+)
+from .models import PeriodicTask, Task
+from .registry import get_task, registry
+
+logger = logging.getLogger(__name__)
+
+
+def enqueue(task, kwargs=None, priority=None, delay=None):
+    """
+    Queue a run of a registered task (function or name), optionally after
+    `delay` seconds. Returns the Task row.
+    """
+    definition = get_task(task)
+    if definition is None:
+        raise ValueError(f"Unknown task: {task}")
+    return Task.objects.create(
+        name=definition.name,
+        kwargs=kwargs or {},
+        priority=definition.priority if priority is None else priority,
+        run_after=timezone.now() + timedelta(seconds=delay or 0),
+        max_attempts=definition.max_attempts,
+    )
+
+
+def retry_delay(attempts):
+    """Exponential backoff after `attempts` failed attempts"""
+    return timedelta(
+        seconds=min(
+            TASK_RETRY_BASE_SECONDS * 2 ** (attempts - 1), TASK_RETRY_MAX_SECONDS
+        )
+    )
+
+
+def has_capacity(name, concurrency):
+    """
+    Whether another `name` task may start. Runs inside the claiming
+    transaction; the advisory lock serializes claims of the same task name
+    until the claimed row is committed as running.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT pg_try_advisory_xact_lock(hashtext(%s))", [name])
+        if not cursor.fetchone()[0]:
+            return False
+    return Task.objects.filter(name=name, status="running").count() < concurrency
+
+
+def claim_task(worker):
+    """
+    Lock the most urgent due task no other worker holds and mark it running,
+    skipping tasks whose concurrency limit is reached. Returns it or None.
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        candidates = (
+            Task.objects.select_for_update(skip_locked=True)
+            .filter(status="queued", run_after__lte=now)
+            .order_by("-priority", "run_after", "id")[:TASK_CLAIM_CANDIDATES]
+        )
+        for task in candidates:
+            definition = get_task(task.name)
+            if definition is None:
+                task.status = "failed"
+                task.finished_on = now
+                task.last_error = f"Unknown task: {task.name}"
+                task.save()
+                continue
+            if definition.concurrency is not None and not has_capacity(
+                task.name, definition.concurrency
+            ):
+                continue
+            task.status = "running"
+            task.attempts += 1
+            task.worker = worker
+            task.started_on = now
+            task.lease_expires_on = now + timedelta(seconds=definition.timeout)
+            task.save()
+            return task
+    return None
+
+
+def run_task(task):
+    """Run a claimed task and record the outcome; failures are retried with backoff"""
+    definition = get_task(task.name)
+    try:
+        definition.func(**task.kwargs)
+    except Exception:
+        logger.exception("Task %s (%s) failed", task.name, task.uid)
+        task.last_error = traceback.format_exc()
+        if task.attempts < task.max_attempts:
+            task.status = "queued"
+            task.run_after = timezone.now() + retry_delay(task.attempts)
+        else:
+            task.status = "failed"
+    else:
+        task.status = "succeeded"
+        task.last_error = ""
+    task.finished_on = timezone.now()
+    task.lease_expires_on = None
+    # Only record the outcome if the lease was not handed to another worker
+    Task.objects.filter(pk=task.pk, status="running", worker=task.worker).update(
+        status=task.status,
+        run_after=task.run_after,
+        finished_on=task.finished_on,
+        lease_expires_on=None,
+        last_error=task.last_error,
+        updated_on=task.finished_on,
+    )
+    return task
+
+
+def requeue_expired():
+    """Requeue running tasks whose worker went away without finishing them"""
+    now = timezone.now()
+    expired = Task.objects.filter(status="running", lease_expires_on__lt=now)
+    error = "Lease expired before the task finished"
+    failed = expired.filter(attempts__gte=F("max_attempts")).update(
+        status="failed", finished_on=now, last_error=error, updated_on=now
+    )
+    requeued = expired.update(
+        status="queued", run_after=now, worker="", last_error=error, updated_on=now
+    )
+    return requeued + failed
+
+
+def sync_periodic_tasks():
+    """Create or update the PeriodicTask rows of tasks registered with a schedule"""
+    for definition in registry.values():
+        if definition.schedule is None:
+            continue
+        periodic, created = PeriodicTask.objects.get_or_create(
+            name=definition.name,
+            defaults={"interval_seconds": definition.schedule},
+        )
+        if not created and periodic.interval_seconds != definition.schedule:
+            periodic.interval_seconds = definition.schedule
+            periodic.save()
+
+
+def enqueue_periodic_tasks():
+    """Queue every due periodic task once, whichever worker gets to it first"""
+    now = timezone.now()
+    enqueued = 0
+    with transaction.atomic():
+        due = PeriodicTask.objects.select_for_update(skip_locked=True).filter(
+            enabled=True, next_run_on__lte=now
+        )
+        for periodic in due:
+            if get_task(periodic.name) is None:
+                continue
+            enqueue(periodic.name, periodic.kwargs)
+            # Missed runs (e.g. no worker was up) are not caught up one by one
+            interval = timedelta(seconds=periodic.interval_seconds)
+            periodic.next_run_on = max(periodic.next_run_on + interval, now + interval)
+            periodic.save()
+            enqueued += 1
+    return enqueued
+
+
+def queue_stats():
+    """
+    Per task name: queue depth (queued, due, running, failed) and, over the
+    last TASK_STATS_WINDOW_SECONDS, wait time from run_after to start and
+    run time of finished tasks, in seconds.
+    """
+    now = timezone.now()
+    since = now - timedelta(seconds=TASK_STATS_WINDOW_SECONDS)
+    finished = Q(finished_on__gte=since, started_on__isnull=False)
+    rows = (
+        Task.objects.order_by()
+        .values("name")
+        .annotate(
+            queued=Count("id", filter=Q(status="queued")),
+            due=Count("id", filter=Q(status="queued", run_after__lte=now)),
+            running=Count("id", filter=Q(status="running")),
+            failed=Count("id", filter=Q(status="failed")),
+            finished=Count("id", filter=finished),
+            avg_wait=Avg(F("started_on") - F("run_after"), filter=finished),
+            max_wait=Max(F("started_on") - F("run_after"), filter=finished),
+            avg_runtime=Avg(F("finished_on") - F("started_on"), filter=finished),
+            oldest_due=Max(
+                now - F("run_after"), filter=Q(status="queued", run_after__lte=now)
+            ),
+        )
+        .order_by("name")
+    )
+    stats = {}
+    for row in rows:
+        name = row.pop("name")
+        stats[name] = {
+            key: value.total_seconds() if isinstance(value, timedelta) else value
+            for key, value in row.items()
+        }
+    return stats
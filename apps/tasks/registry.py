@@ -0,0 +1,55 @@
+from .consts import TASK_MAX_ATTEMPTS, TASK_TIMEOUT_SECONDS
+
+
+class TaskDefinition:
+    def __init__(
+        self, name, func, priority, concurrency, max_attempts, timeout, schedule
+    ):
+        self.name = name
+        self.func = func
+        self.priority = priority
+        # Tasks of this name allowed to run at once across all workers
+        self.concurrency = concurrency
+        self.max_attempts = max_attempts
+        self.timeout = timeout
+        # Seconds between runs of a periodic task
+        self.schedule = schedule
+
+
+registry = {}
+
+
+def task(
+    name=None,
+    priority=0,
+    concurrency=None,
+    max_attempts=TASK_MAX_ATTEMPTS,
+    timeout=TASK_TIMEOUT_SECONDS,
+    schedule=None,
+):
+    """
+    Register a function as a background task, by default named
+    "<module>.<function>". The function takes JSON-serializable kwargs;
+    `schedule` (seconds) also runs it periodically.
+    """
+
+    def decorator(func):
+        definition = TaskDefinition(
+            name or f"{func.__module__}.{func.__name__}",
+            func,
+            priority,
+            concurrency,
+            max_attempts,
+            timeout,
+            schedule,
+        )
+        registry[definition.name] = definition
+        func.task_name = definition.name
+        return func
+
+    return decorator
+
+
+def get_task(task):
+    """TaskDefinition of a task name or a registered function, or None"""
+    return registry.get(getattr(task, "task_name", task))
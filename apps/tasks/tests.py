@@ -0,0 +1,123 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from apps.tasks.models import PeriodicTask, Task
+from apps.tasks.queue import (
+    claim_task,
+    enqueue,
+    enqueue_periodic_tasks,
+    queue_stats,
+    requeue_expired,
+    run_task,
+    sync_periodic_tasks,
+)
+from apps.tasks.registry import task
+
+calls = []
+
+
+@task(name="tests.record")
+def record(value):
+    calls.append(value)
+
+
+@task(name="tests.exclusive", concurrency=1)
+def exclusive():
+    pass
+
+
+@task(name="tests.flaky", max_attempts=2)
+def flaky():
+    raise RuntimeError("boom")
+
+
+@task(name="tests.periodic", schedule=300)
+def periodic():
+    calls.append("periodic")
+
+
+class TaskQueueTestCase(TestCase):
+    def setUp(self):
+        calls.clear()
+
+    def test_claims_by_priority_then_due_time(self):
+        enqueue(record, {"value": "low"})
+        enqueue(record, {"value": "high"}, priority=5)
+        enqueue(record, {"value": "later"}, priority=9, delay=60)
+
+        for _ in range(3):
+            task = claim_task("test")
+            if task:
+                run_task(task)
+        self.assertEqual(calls, ["high", "low"])
+        self.assertEqual(Task.objects.get(kwargs__value="high").status, "succeeded")
+
+    def test_concurrency_limit_per_task_name(self):
+        enqueue(exclusive)
+        enqueue(exclusive)
+        first = claim_task("a")
+        self.assertIsNotNone(first)
+        self.assertIsNone(claim_task("b"))
+        run_task(first)
+        self.assertIsNotNone(claim_task("b"))
+
+    def test_failures_retry_with_backoff_then_fail(self):
+        queued = enqueue(flaky)
+        run_task(claim_task("test"))
+        queued.refresh_from_db()
+        self.assertEqual((queued.status, queued.attempts), ("queued", 1))
+        self.assertGreater(queued.run_after, timezone.now())
+        self.assertIn("boom", queued.last_error)
+
+        Task.objects.filter(pk=queued.pk).update(run_after=timezone.now())
+        run_task(claim_task("test"))
+        queued.refresh_from_db()
+        self.assertEqual((queued.status, queued.attempts), ("failed", 2))
+
+    def test_expired_lease_is_requeued(self):
+        enqueue(record, {"value": "lost"})
+        claimed = claim_task("dead-worker")
+        Task.objects.filter(pk=claimed.pk).update(
+            lease_expires_on=timezone.now() - timedelta(seconds=1)
+        )
+        self.assertEqual(requeue_expired(), 1)
+        run_task(claim_task("test"))
+        self.assertEqual(calls, ["lost"])
+
+    def test_periodic_tasks_are_enqueued_once_per_interval(self):
+        sync_periodic_tasks()
+        periodic_task = PeriodicTask.objects.get(name="tests.periodic")
+        self.assertEqual(periodic_task.interval_seconds, 300)
+
+        PeriodicTask.objects.exclude(name="tests.periodic").update(enabled=False)
+        self.assertEqual(enqueue_periodic_tasks(), 1)
+        self.assertEqual(enqueue_periodic_tasks(), 0)
+        periodic_task.refresh_from_db()
+        self.assertGreater(periodic_task.next_run_on, timezone.now())
+
+    def test_worker_command_and_stats(self):
+        enqueue(record, {"value": "from worker"})
+        enqueue(record, {"value": "future"}, delay=3600)
+        # Keep the nightly jobs tasks out of this run
+        sync_periodic_tasks()
+        PeriodicTask.objects.update(enabled=False)
+        call_command("run_task_worker", "--burst", stdout=StringIO())
+        self.assertEqual(calls, ["from worker"])
+
+        stats = queue_stats()["tests.record"]
+        self.assertEqual((stats["queued"], stats["due"], stats["finished"]), (1, 0, 1))
+        self.assertGreaterEqual(stats["avg_wait"], 0)
+
+        client = APIClient()
+        client.force_authenticate(
+            user=User.objects.create_user(username="staff", password="x", is_staff=True)
+        )
+        response = client.get("/api/v1/tasks/stats/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["tests.record"]["queued"], 1)
@@ -0,0 +1,59 @@
+import os
+from collections import Counter
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+
+
+def close_connection_pools():
+    """
+    Close every connection and connection pool, e.g. before forking worker
+    processes: pooled sockets and the pool's threads must not be shared with
+    children. Each process opens its own pool on first use.
+    """
+    connections.close_all()
+    for connection in connections.all(initialized_only=True):
+        if connection.vendor == "postgresql":
+            connection.close_pool()
+
+
+def pool_stats(alias=DEFAULT_DB_ALIAS):
+    """
+    Connection pool metrics of this worker process: checkout wait time,
+    saturation and connection churn. Counters run since the pool opened.
+    """
+    pool = connections[alias].pool
+    if pool is None:
+        return {"mode": settings.DB_CONNECTION_MODE, "pid": os.getpid()}
+
+    # psycopg_pool only reports counters that have moved
+    stats = Counter(pool.get_stats())
+    checkouts, waited = stats["requests_num"], stats["requests_queued"]
+    opened = stats["connections_num"]
+    in_use = stats["pool_size"] - stats["pool_available"]
+
+    def ratio(value, total, digits=3):
+        return round(value / total, digits) if total else 0.0
+
+    return {
+        "mode": settings.DB_CONNECTION_MODE,
+        "pid": os.getpid(),
+        "min_size": stats["pool_min"],
+        "max_size": stats["pool_max"],
+        "size": stats["pool_size"],
+        "in_use": in_use,
+        "available": stats["pool_available"],
+        "waiting": stats["requests_waiting"],
+        "saturation": ratio(in_use, stats["pool_max"], 4),
+        "checkouts": checkouts,
+        "checkouts_waited": waited,
+        "checkout_timeouts": stats["requests_errors"],
+        "wait_ms_total": stats["requests_wait_ms"],
+        "wait_ms_avg": ratio(stats["requests_wait_ms"], checkouts),
+        "wait_ms_avg_waited": ratio(stats["requests_wait_ms"], waited),
+        "connections_opened": opened,
+        "connections_failed": stats["connections_errors"],
+        "connections_lost": stats["connections_lost"],
+        "connections_discarded": stats["returns_bad"],
+        "connect_ms_avg": ratio(stats["connections_ms"], opened),
+    }
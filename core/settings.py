@@ -25,12 +25,12 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 # See https://docs.djangoproject.com/en/5.2/howto/deployment/checklist/
 
 # SECURITY WARNING: keep the secret key used in production secret!
-SECRET_KEY = os.environ.get('SECRET_KEY', 'yourkey')
+SECRET_KEY = os.environ.get("SECRET_KEY", "yourkey")
 
 # SECURITY WARNING: don't run with debug turned on in production!
-DEBUG = os.environ.get('DEBUG', 'False') == 'True'
+DEBUG = os.environ.get("DEBUG", "False") == "True"
 
-ALLOWED_HOSTS = os.environ.get('ALLOWED_HOSTS', 'localhost,127.0.0.1').split(',')
+ALLOWED_HOSTS = os.environ.get("ALLOWED_HOSTS", "localhost,127.0.0.1").split(",")
 
 
 # Application definition
@@ -43,6 +43,7 @@ INSTALLED_APPS = [
     "django.contrib.messages",
     "django.contrib.staticfiles",
     "django.contrib.humanize",
+    "django.contrib.postgres",
     "django_extensions",
     "rest_framework",
     "rest_framework.authtoken",
@@ -50,11 +51,14 @@ INSTALLED_APPS = [
     "drf_yasg",
     "apps.profiles",
     "apps.jobs",
+    "apps.rollups",
+    "apps.notifications",
+    "apps.tasks",
 ]
 
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
-    "whitenoise.middleware.WhiteNoiseMiddleware",  # For serving static files in production
+    "core.middleware.AsyncWhiteNoiseMiddleware",  # For serving static files in production
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
@@ -94,9 +98,36 @@ DATABASES = {
         "PASSWORD": os.environ.get("POSTGRES_PASSWORD"),
         "HOST": os.environ.get("DB_HOST", "db"),
         "PORT": os.environ.get("DB_PORT", "5432"),
+        # Check connections before handing them out (pooled or persistent)
+        "CONN_HEALTH_CHECKS": True,
     }
 }
 
+# DB_CONNECTION_MODE:
+# - "pool" (default): a psycopg connection pool in each worker process, of
+#   DB_POOL_MIN_SIZE to DB_POOL_MAX_SIZE connections. A request waits up to
+#   DB_POOL_TIMEOUT seconds for a free one; connections are replaced after
+#   DB_POOL_MAX_LIFETIME seconds. Metrics: GET /api/v1/database/pool-stats/
+# - "pgbouncer": for PgBouncer in transaction mode. Persistent connections to
+#   PgBouncer (DB_CONN_MAX_AGE seconds) and no server-side cursors, which do
+#   not survive a transaction there; .iterator() (exports, snapshots) then
+#   holds each query's full result in memory. Prepared statements are off
+#   in both modes (Django's default with psycopg 3).
+DB_CONNECTION_MODE = os.environ.get("DB_CONNECTION_MODE", "pool")
+if DB_CONNECTION_MODE == "pgbouncer":
+    DATABASES["default"]["CONN_MAX_AGE"] = int(os.environ.get("DB_CONN_MAX_AGE", 60))
+    DATABASES["default"]["DISABLE_SERVER_SIDE_CURSORS"] = True
+else:
+    DATABASES["default"]["OPTIONS"] = {
+        "pool": {
+            "name": "default",
+            "min_size": int(os.environ.get("DB_POOL_MIN_SIZE", 2)),
+            "max_size": int(os.environ.get("DB_POOL_MAX_SIZE", 8)),
+            "timeout": float(os.environ.get("DB_POOL_TIMEOUT", 10)),
+            "max_lifetime": float(os.environ.get("DB_POOL_MAX_LIFETIME", 3600)),
+        }
+    }
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -145,7 +176,11 @@ LOGIN_URL = "/login/"
 
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": [
-        "rest_framework.authentication.TokenAuthentication",
+        "apps.profiles.auth.CachedTokenAuthentication",
+    ],
+    "DEFAULT_RENDERER_CLASSES": [
+        "api.v1.renderers.ORJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
     ],
     "DEFAULT_FILTER_BACKENDS": [
         "django_filters.rest_framework.DjangoFilterBackend",
@@ -153,6 +188,16 @@ REST_FRAMEWORK = {
         "rest_framework.filters.OrderingFilter",
     ],
 }
+
+# Authenticated tokens kept in-process by CachedTokenAuthentication: an LRU of
+# AUTH_TOKEN_CACHE_SIZE entries, each trusted for AUTH_TOKEN_CACHE_TIMEOUT
+# seconds. Set AUTH_TOKEN_CACHE to a cache alias shared by all workers when
+# running several: it also carries the versions that make an invalidation
+# (password change, deactivation, token rotation) reach every worker at once.
+AUTH_TOKEN_CACHE_SIZE = int(os.environ.get("AUTH_TOKEN_CACHE_SIZE", 1024))
+AUTH_TOKEN_CACHE_TIMEOUT = int(os.environ.get("AUTH_TOKEN_CACHE_TIMEOUT", 60))
+AUTH_TOKEN_CACHE = os.environ.get("AUTH_TOKEN_CACHE") or None
+
 EMAIL_BACKEND = "django.core.mail.backends.smtp.EmailBackend"
 EMAIL_HOST = os.environ.get("EMAIL_HOST", "smtp.gmail.com")
 EMAIL_PORT = int(os.environ.get("EMAIL_PORT", 587))
@@ -162,4 +207,67 @@ EMAIL_HOST_PASSWORD = os.environ.get("EMAIL_HOST_PASSWORD")
 
 BACKEND_URL = os.environ.get("BACKEND_URL", "http://localhost:8000")
 
+# Job field extraction cache; JOBS_EXTRACTOR is a dotted path to an
+# apps.jobs.extraction.BaseExtractor subclass, e.g. "apps.jobs.extraction.FakeExtractor"
+JOBS_EXTRACTOR = os.environ.get("JOBS_EXTRACTOR", "")
+EXTRACTION_CACHE_TTL_DAYS = int(os.environ.get("EXTRACTION_CACHE_TTL_DAYS", 180))
+EXTRACTION_CACHE_MAX_ENTRIES = int(
+    os.environ.get("EXTRACTION_CACHE_MAX_ENTRIES", 200000)
+)
+
+# Near-duplicate job detection (apps.jobs.dedupe)
+DEDUPE_JACCARD_THRESHOLD = float(os.environ.get("DEDUPE_JACCARD_THRESHOLD", 0.8))
+DEDUPE_TITLE_SIMILARITY = int(os.environ.get("DEDUPE_TITLE_SIMILARITY", 85))
+
+# In-memory job recommender (apps.jobs.recommender)
+RECOMMENDER_REFRESH_SECONDS = int(os.environ.get("RECOMMENDER_REFRESH_SECONDS", 30))
+RECOMMENDER_REBUILD_SECONDS = int(os.environ.get("RECOMMENDER_REBUILD_SECONDS", 3600))
+RECOMMENDER_MAX_STALE_RATIO = 0.2
+
+# In-memory typeahead index (apps.jobs.suggest), refreshed in the background
+SUGGEST_REFRESH_SECONDS = int(os.environ.get("SUGGEST_REFRESH_SECONDS", 30))
+SUGGEST_REBUILD_SECONDS = int(os.environ.get("SUGGEST_REBUILD_SECONDS", 3600))
+
+# Anonymous jobs list/detail responses (apps.jobs.cache). Entries are dropped
+# by a version bump on every write through Django; the timeout bounds how
+# long rows written directly to the database (e.g. by n8n) can go unseen.
+# The version counter lives in the same cache, so with several workers
+# (WEB_CONCURRENCY) it must be a shared backend, e.g. FileBasedCache or Redis;
+# `manage.py check` warns about a per-process LocMemCache.
+JOBS_CACHE_TIMEOUT = int(os.environ.get("JOBS_CACHE_TIMEOUT", 300))
+CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+    "jobs": {
+        "BACKEND": os.environ.get(
+            "JOBS_CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache"
+        ),
+        "LOCATION": os.environ.get("JOBS_CACHE_LOCATION", "jobs"),
+        "TIMEOUT": JOBS_CACHE_TIMEOUT,
+        "OPTIONS": {"MAX_ENTRIES": 5000},
+    },
+}
+
+# Cache-Control of public job responses: browsers revalidate (ETag) after
+# JOBS_HTTP_MAX_AGE, a CDN keeps them for JOBS_CDN_MAX_AGE or until purged by
+# Surrogate-Key (apps.jobs.conditional)
+JOBS_HTTP_MAX_AGE = int(os.environ.get("JOBS_HTTP_MAX_AGE", 60))
+JOBS_CDN_MAX_AGE = int(os.environ.get("JOBS_CDN_MAX_AGE", 300))
+
+# Route the jobs list/detail pages and anonymous JSON reads of /api/jobs/ to
+# async views (awaiting the ORM and the jobs cache). Meant for the ASGI
+# server (SERVER=asgi turns it on); under WSGI each request would be run
+# through an event loop of its own.
+ASYNC_JOB_VIEWS = os.environ.get("ASYNC_JOB_VIEWS", "False") == "True"
+
+# TF-IDF index for similar jobs, written by `manage.py build_similar_jobs_index`
+SIMILAR_JOBS_INDEX_DIR = os.environ.get(
+    "SIMILAR_JOBS_INDEX_DIR", BASE_DIR / "var" / "similar_jobs"
+)
+
+# Partitioned Parquet snapshots of the jobs catalogue, written by
+# `manage.py export_jobs_snapshot` (apps.jobs.snapshot)
+JOBS_SNAPSHOT_DIR = os.environ.get(
+    "JOBS_SNAPSHOT_DIR", BASE_DIR / "var" / "jobs_snapshot"
+)
+
 CSRF_TRUSTED_ORIGINS = ["https://api.cariinkerja.id"]
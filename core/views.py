@@ -1,7 +1,6 @@
 # Create your views here.
 from django.contrib.auth.decorators import user_passes_test
 from django.contrib.auth.views import LoginView, PasswordResetConfirmView
-from django.db.models import Avg, Count
 from django.shortcuts import render
 from django.urls import reverse_lazy
 from django.utils import timezone
@@ -9,8 +8,12 @@ from django.utils.decorators import method_decorator
 from django.views import View
 from django.views.generic import TemplateView
 
-from apps.jobs.models import JobAssessment, Jobs
-from apps.profiles.models import Profile
+from apps.rollups.queries import (
+    assessment_totals,
+    job_distribution,
+    total_jobs,
+    total_profiles,
+)
 from core.forms import CustomSetPasswordForm
 
 
@@ -30,48 +33,32 @@ class DashboardView(SuperuserRequiredMixin, View):
         today = timezone.now().date()
 
         # User statistics
-        user_count = Profile.objects.all().count()
-        users_registered_today = Profile.objects.filter(created_on=today).count()
+        user_count = total_profiles()
+        users_registered_today = total_profiles(day=today)
 
         # Job statistics
-        total_jobs = Jobs.objects.all().count()
-        jobs_posted_today = Jobs.objects.filter(created_on__date=today).count()
+        total_jobs_count = total_jobs()
+        jobs_posted_today = total_jobs(day=today)
 
         # Employment type distribution
-        employment_type_stats = (
-            Jobs.objects.values("employment_type")
-            .annotate(count=Count("employment_type"))
-            .order_by("-count")
-        )
+        employment_type_stats = job_distribution("employment_type")
 
         # Work location distribution
-        work_location_stats = (
-            Jobs.objects.values("work_location")
-            .annotate(count=Count("work_location"))
-            .order_by("-count")
-        )
+        work_location_stats = job_distribution("work_location")
 
         # Job category distribution
-        job_category_stats = (
-            Jobs.objects.values("job_title_category")
-            .annotate(count=Count("job_title_category"))
-            .order_by("-count")[:5]
-        )  # Top 5 categories
+        job_category_stats = job_distribution("job_title_category")[:5]  # Top 5
 
         # Source platform distribution
-        source_platform_stats = (
-            Jobs.objects.values("source_platform")
-            .annotate(count=Count("source_platform"))
-            .order_by("-count")
-        )
+        source_platform_stats = job_distribution("source_platform")
 
         # Job assessment statistics
-        total_assessments = JobAssessment.objects.all().count()
-        assessments_today = JobAssessment.objects.filter(created_on__date=today).count()
+        total_assessments, total_score = assessment_totals()
+        assessments_today, _ = assessment_totals(day=today)
 
         # Average assessment score
         avg_assessment_score = (
-            JobAssessment.objects.aggregate(avg_score=Avg("score"))["avg_score"] or 0
+            total_score / total_assessments if total_assessments else 0
         )
 
         return render(
@@ -80,7 +67,7 @@ class DashboardView(SuperuserRequiredMixin, View):
             context={
                 "user_count": user_count,
                 "users_registered_today": users_registered_today,
-                "total_jobs": total_jobs,
+                "total_jobs": total_jobs_count,
                 "jobs_posted_today": jobs_posted_today,
                 "employment_type_stats": employment_type_stats,
                 "work_location_stats": work_location_stats,